@@ -0,0 +1 @@
+"""Offline benchmarks of canarytools against a local fake Canary console. See README.rst."""
@@ -0,0 +1,359 @@
+"""Synthetic console data for the benchmarks.
+
+Every record is generated from the dataset's seed and its own index, so the fake console can render any
+incident on demand without holding the whole dataset in memory, and every run sees the same data.
+"""
+import datetime
+import random
+
+# record counts of each benchmark scale. Incidents have on average ~10 events, so ``events`` is approximate
+SCALES = {
+    'tiny': {'devices': 20, 'incidents': 200, 'events': 2000, 'tokens': 20, 'flocks': 3},
+    'small': {'devices': 500, 'incidents': 5000, 'events': 50000, 'tokens': 200, 'flocks': 10},
+    'medium': {'devices': 2000, 'incidents': 20000, 'events': 200000, 'tokens': 1000, 'flocks': 25},
+    'full': {'devices': 10000, 'incidents': 100000, 'events': 1000000, 'tokens': 5000, 'flocks': 100},
+}
+
+STD_FORMAT = '%Y-%m-%d %H:%M:%S UTC+0000'
+
+EPOCH = datetime.datetime(1970, 1, 1)
+
+# incidents are spread over the 90 days before this time
+END_TIME = 1700000000
+
+PERIOD = 90 * 24 * 3600
+
+# share of incidents that are unacknowledged
+UNACKNOWLEDGED = 0.2
+
+USERNAMES = ('root', 'admin', 'administrator', 'ubuntu', 'oracle', 'pi', 'test', 'guest', 'user', 'backup')
+
+PASSWORDS = ('123456', 'password', 'admin', 'root', 'qwerty', 'letmein', 'changeme', 'P@ssw0rd', 'toor', '')
+
+USER_AGENTS = ('Mozilla/5.0 (X11; Linux x86_64)', 'curl/7.68.0', 'python-requests/2.25.1', 'Go-http-client/1.1')
+
+PORTS = (21, 22, 23, 25, 53, 80, 110, 139, 143, 443, 445, 1433, 3306, 3389, 5432, 5900, 6379, 8080, 8443)
+
+
+def std_time(timestamp):
+    """Format epoch seconds the way the console formats ``*_std`` fields
+
+    :param timestamp: Epoch seconds
+    :return: A string like ``'2019-12-25 12:00:00 UTC+0000'``
+    """
+    return (EPOCH + datetime.timedelta(seconds=timestamp)).strftime(STD_FORMAT)
+
+
+def _ssh_event(rng):
+    return {'USERNAME': rng.choice(USERNAMES), 'PASSWORD': rng.choice(PASSWORDS),
+            'LOCALVERSION': 'SSH-2.0-OpenSSH_5.1p1 Debian-4', 'REMOTEVERSION': 'SSH-2.0-libssh2_1.8.0'}
+
+
+def _http_login_event(rng):
+    return {'USERNAME': rng.choice(USERNAMES), 'PASSWORD': rng.choice(PASSWORDS), 'PATH': '/index.html',
+            'SKIN': 'nasLogin', 'USERAGENT': rng.choice(USER_AGENTS)}
+
+
+def _smb_event(rng):
+    return {'FILENAME': 'Salaries-{0}.xlsx'.format(rng.randint(2015, 2023)), 'USER': rng.choice(USERNAMES),
+            'DOMAIN': 'CORP', 'REMOTENAME': 'WS-{0:04d}'.format(rng.randint(0, 9999)), 'SHARENAME': 'Documents',
+            'AUDITACTION': 'pread', 'MODE': 'workgroup', 'OFFSET': '0', 'SIZE': str(rng.randint(1, 65535))}
+
+
+def _port_scan_event(rng):
+    ports = rng.sample(PORTS, rng.randint(3, len(PORTS)))
+    ports += [rng.randint(1024, 65535) for _ in range(rng.randint(0, 40))]
+    return dict((str(port), rng.randint(1, 5)) for port in ports)
+
+
+def _token_event(rng):
+    return {'type': 'http', 'canarytoken': '%032x' % rng.getrandbits(128), 'url': 'http://canarytokens.com/x',
+            'headers': {'User-Agent': rng.choice(USER_AGENTS), 'Accept': '*/*'}}
+
+
+def _no_event(rng):
+    return {}
+
+
+# (summary, logtype, destination port, extra event fields, relative frequency)
+INCIDENT_KINDS = (
+    ('SSH Login Attempt', '4002', 22, _ssh_event, 30),
+    ('HTTP Login Attempt', '3001', 80, _http_login_event, 20),
+    ('Shared File Opened', '5000', 445, _smb_event, 15),
+    ('Consolidated Network Port Scan', '5007', -1, _port_scan_event, 10),
+    ('Canarytoken triggered', '17000', 80, _token_event, 10),
+    ('Canary Disconnected', '1004', -1, _no_event, 10),
+    ('Telnet Login Attempt', '6001', 23, _ssh_event, 5),
+)
+
+_KIND_WEIGHTS = [kind[-1] for kind in INCIDENT_KINDS]
+
+
+class Dataset(object):
+    def __init__(self, scale='small', seed=0):
+        """Synthetic devices, incidents, Canarytokens, flocks and updates of a console
+
+        :param scale: Name of one of the :data:`SCALES`, or a dictionary of record counts
+        :param seed: Seed of the random data
+        """
+        counts = SCALES[scale] if not isinstance(scale, dict) else scale
+        self.scale = scale if not isinstance(scale, dict) else 'custom'
+        self.seed = seed
+        self.device_count = counts['devices']
+        self.incident_count = counts['incidents']
+        self.token_count = counts['tokens']
+        self.flock_count = counts['flocks']
+        self.events_per_incident = float(counts['events']) / max(1, counts['incidents'])
+
+        self.node_ids = ['{0:016x}'.format(self._rng('node', i).getrandbits(64)) for i in range(self.device_count)]
+        self.flock_ids = ['flock:default'] + ['flock:{0:032x}'.format(i) for i in range(1, self.flock_count)]
+
+        # what the console filters incidents on, kept for every incident
+        self.incidents_meta = [self._incident_meta(i) for i in range(self.incident_count)]
+        self.unacknowledged_by_node = dict()
+        for meta in self.incidents_meta:
+            if not meta['acknowledged']:
+                self.unacknowledged_by_node.setdefault(meta['node_id'], []).append(meta['id'])
+
+    def counts(self):
+        """Number of records of each kind
+
+        :return: Dictionary of counts
+        """
+        return {'devices': self.device_count, 'incidents': self.incident_count,
+                'events': sum(meta['events'] for meta in self.incidents_meta),
+                'tokens': self.token_count, 'flocks': self.flock_count}
+
+    def _rng(self, kind, index):
+        return random.Random('{0}:{1}:{2}'.format(self.seed, kind, index))
+
+    def _incident_meta(self, index):
+        rng = self._rng('incident', index)
+        kind = rng.choices(range(len(INCIDENT_KINDS)), _KIND_WEIGHTS)[0]
+        # most incidents are a few events, a handful of brute force attempts are hundreds
+        roll = rng.random()
+        mean = self.events_per_incident
+        if roll < 0.7:
+            events = rng.randint(1, max(1, int(mean * 0.3)))
+        elif roll < 0.95:
+            events = rng.randint(max(1, int(mean * 0.5)), max(1, int(mean * 2)))
+        else:
+            events = rng.randint(max(1, int(mean * 5)), max(1, int(mean * 20)))
+        # a few devices see most of the incidents
+        node = int(self.device_count * rng.random() ** 2)
+        created = END_TIME - PERIOD + int(PERIOD * float(index) / max(1, self.incident_count))
+        return {
+            'id': 'incident:{0}:{1:024x}:{2}'.format(INCIDENT_KINDS[kind][0].lower().replace(' ', ''),
+                                                     rng.getrandbits(96), created),
+            'kind': kind,
+            'events': events,
+            'node': node,
+            'node_id': self.node_ids[node],
+            'acknowledged': rng.random() >= UNACKNOWLEDGED,
+            'created': created,
+            'updated': created + events * rng.randint(1, 30),
+        }
+
+    def device(self, index):
+        """JSON data of a device, as listed by ``devices/all``
+
+        :param index: Index of the device
+        :return: Dictionary of the device's fields
+        """
+        rng = self._rng('device', index)
+        node_id = self.node_ids[index]
+        first_seen = END_TIME - PERIOD - rng.randint(0, 365 * 24 * 3600)
+        live = rng.random() < 0.9
+        return {
+            'id': node_id,
+            'name': 'canary-{0:05d}'.format(index),
+            'description': 'Rack {0}, row {1}'.format(rng.randint(1, 40), rng.randint(1, 12)),
+            'device_live': str(live),
+            'ghost': 'False',
+            'ip_address': '10.{0}.{1}.{2}'.format(index >> 16 & 255, index >> 8 & 255, index & 255),
+            'mac_address': '00:16:3e:{0:02x}:{1:02x}:{2:02x}'.format(rng.randint(0, 255), rng.randint(0, 255),
+                                                                     rng.randint(0, 255)),
+            'flock_id': self.flock_ids[index % len(self.flock_ids)],
+            'first_seen': first_seen,
+            'first_seen_std': std_time(first_seen),
+            'first_seen_age': '{0} days'.format((END_TIME - first_seen) // 86400),
+            'last_seen_std': std_time(END_TIME - rng.randint(0, 600)),
+            'last_heartbeat_age': '{0} seconds'.format(rng.randint(0, 600)),
+            'uptime': rng.randint(0, 30 * 24 * 3600),
+            'uptime_age': '{0} days'.format(rng.randint(0, 30)),
+            'need_reboot': 'False',
+            'reconnect_count': str(rng.randint(0, 20)),
+            'service_count': str(rng.randint(1, 12)),
+            'ippers': 'win2016',
+            'sensor': 'Canary',
+            'ignore_notifications_disconnect': 'False',
+            'ignore_notifications_general': 'False',
+            'notify_after_horizon_reconnect': 'False',
+            'device_id_hash': '{0:032x}'.format(rng.getrandbits(128)),
+            'unacknowleged_incidents': [{'key': incident_id}
+                                        for incident_id in self.unacknowledged_by_node.get(node_id, ())],
+        }
+
+    def device_info(self, index):
+        """JSON data of a device, as returned by ``device/getinfo``
+
+        :param index: Index of the device
+        :return: Dictionary of the device's fields, including its settings
+        """
+        device = self.device(index)
+        device['settings'] = {'device.name': device['name'], 'ssh.enabled': True, 'ssh.port': 22,
+                              'smb.enabled': True, 'http.enabled': True, 'http.port': 80}
+        return device
+
+    def device_index(self, node_id):
+        """Find a device by node id
+
+        :param node_id: The device's node id
+        :return: Index of the device, ``None`` if there's no such device
+        """
+        if not hasattr(self, '_device_indexes'):
+            self._device_indexes = dict((node_id, index) for index, node_id in enumerate(self.node_ids))
+        return self._device_indexes.get(node_id)
+
+    def devices(self, live=None):
+        """JSON data of all devices
+
+        :param live: Only live devices if ``True``, only dead devices if ``False``
+        :return: List of dictionaries
+        """
+        devices = [self.device(index) for index in range(self.device_count)]
+        if live is not None:
+            devices = [device for device in devices if (device['device_live'] == 'True') == live]
+        return devices
+
+    def incident(self, index, event_limit=None):
+        """JSON data of an incident with its events
+
+        :param index: Index of the incident
+        :param event_limit: Maximum number of events included
+        :return: Dictionary of the incident's fields
+        """
+        meta = self.incidents_meta[index]
+        rng = self._rng('events', index)
+        summary, logtype, dst_port, fields, _ = INCIDENT_KINDS[meta['kind']]
+        src_host = '{0}.{1}.{2}.{3}'.format(rng.randint(1, 223), rng.randint(0, 255), rng.randint(0, 255),
+                                            rng.randint(1, 254))
+        dst_host = '10.0.{0}.{1}'.format(rng.randint(0, 255), rng.randint(1, 254))
+
+        count = meta['events'] if event_limit is None else min(meta['events'], int(event_limit))
+        events = list()
+        step = max(1, (meta['updated'] - meta['created']) // max(1, meta['events']))
+        for number in range(count):
+            timestamp = meta['created'] + number * step
+            event = {'timestamp': timestamp, 'timestamp_std': std_time(timestamp), 'src_host': src_host,
+                     'src_port': rng.randint(1024, 65535), 'dst_host': dst_host, 'dst_port': dst_port,
+                     'logtype': logtype, 'node_id': meta['node_id']}
+            event.update(fields(rng))
+            events.append(event)
+
+        return {
+            'id': meta['id'],
+            'summary': summary,
+            'description': summary,
+            'node_id': meta['node_id'],
+            'flock_id': self.flock_ids[meta['node'] % len(self.flock_ids)],
+            'acknowledged': str(meta['acknowledged']),
+            'logtype': logtype,
+            'src_host': src_host,
+            'src_port': events[0]['src_port'] if events else 0,
+            'dst_host': dst_host,
+            'dst_port': dst_port,
+            'created': meta['created'],
+            'created_std': std_time(meta['created']),
+            'updated': meta['updated'],
+            'updated_std': std_time(meta['updated']),
+            'updated_id': index,
+            'events_count': meta['events'],
+            'local_time': std_time(meta['created'])[:19],
+            'events': events,
+        }
+
+    def incident_index(self, incident_id):
+        """Find an incident by id
+
+        :param incident_id: The incident's id
+        :return: Index of the incident, ``None`` if there's no such incident
+        """
+        if not hasattr(self, '_incident_indexes'):
+            self._incident_indexes = dict((meta['id'], index) for index, meta in enumerate(self.incidents_meta))
+        return self._incident_indexes.get(incident_id)
+
+    def select_incidents(self, acknowledged=None, node_id=None, newer_than=None):
+        """Indexes of the incidents a listing returns
+
+        :param acknowledged: Only acknowledged incidents if ``True``, only unacknowledged incidents if ``False``
+        :param node_id: Only incidents of this node
+        :param newer_than: Only incidents updated after this epoch time
+        :return: List of incident indexes
+        """
+        return [index for index, meta in enumerate(self.incidents_meta)
+                if (acknowledged is None or meta['acknowledged'] == acknowledged)
+                and (node_id is None or meta['node_id'] == node_id)
+                and (newer_than is None or meta['updated'] > newer_than)]
+
+    def token(self, index):
+        """JSON data of a Canarytoken
+
+        :param index: Index of the token
+        :return: Dictionary of the token's fields
+        """
+        rng = self._rng('token', index)
+        canarytoken = '{0:025x}'.format(rng.getrandbits(100))
+        created = END_TIME - rng.randint(0, PERIOD)
+        return {
+            'canarytoken': canarytoken,
+            'memo': 'Token {0} on the finance share'.format(index),
+            'kind': rng.choice(('http', 'dns', 'doc-msword', 'aws-id', 'web-image')),
+            'enabled': True,
+            'created': str(created),
+            'created_printable': std_time(created),
+            'hostname': '{0}.canarytokens.com'.format(canarytoken),
+            'url': 'http://canarytokens.com/static/{0}/index.html'.format(canarytoken),
+            'node_id': self.node_ids[index % max(1, self.device_count)],
+            'flock_id': self.flock_ids[index % len(self.flock_ids)],
+            'triggered_count': rng.randint(0, 3),
+        }
+
+    def tokens(self):
+        """JSON data of all Canarytokens
+
+        :return: List of dictionaries
+        """
+        return [self.token(index) for index in range(self.token_count)]
+
+    def flocks(self):
+        """Names of all flocks
+
+        :return: Dictionary of flock names keyed by flock id
+        """
+        return dict((flock_id, 'Flock {0}'.format(index) if index else 'Default Flock')
+                    for index, flock_id in enumerate(self.flock_ids))
+
+    def updates(self):
+        """JSON data of the available device updates
+
+        :return: List of dictionaries
+        """
+        return [{'tag': '{0:032x}'.format(self._rng('update', index).getrandbits(128)),
+                 'version': '2.{0}.{1}'.format(index // 10, index % 10),
+                 'description': 'Canary update 2.{0}.{1}'.format(index // 10, index % 10),
+                 'filename': 'canary-2.{0}.{1}.bin'.format(index // 10, index % 10),
+                 'ignore': False, 'supported_versions': ['2.0.0']} for index in range(20)]
+
+    def bundles(self, node_id):
+        """JSON data of a device's data bundles
+
+        :param node_id: The device's node id
+        :return: List of dictionaries
+        """
+        rng = self._rng('bundles', node_id)
+        return [{'settings_key': '{0:032x}'.format(rng.getrandbits(128)), 'req_len': 1, 'bytes_copied': 2048,
+                 'name': 'Settings', 'checksum': '{0:032x}'.format(rng.getrandbits(128)),
+                 'ended_time': END_TIME, 'tag': 'settings', 'type_': 'settings', 'bundle_size': 2048,
+                 'state': 'DONE', 'node_id': node_id, 'started_time': END_TIME - 10,
+                 'created_time': END_TIME - 20, 'updated_time': END_TIME} for _ in range(5)]
@@ -0,0 +1,314 @@
+"""A local HTTP stand-in for the ``/api/v1/`` endpoints of a Canary console, serving a synthetic
+:class:`Dataset <benchmarks.data.Dataset>`.
+
+The server runs in its own process, so rendering responses doesn't compete with the client being measured
+for the GIL. It can also be run on its own to point other tools at::
+
+    python -m benchmarks.fakeconsole --scale small --port 8000
+"""
+import argparse
+import datetime
+import json
+import multiprocessing
+import random
+import threading
+import time
+
+from collections import OrderedDict
+
+try:
+    from http.server import BaseHTTPRequestHandler, HTTPServer
+    from socketserver import ThreadingMixIn
+    from urllib.parse import parse_qs, urlparse
+except ImportError:
+    raise ImportError('The benchmarks need python 3')
+
+from .data import Dataset
+
+API_PREFIX = '/api/v1/'
+
+CONTROL_PREFIX = '/_bench/'
+
+NEWER_THAN_FORMAT = '%Y-%m-%d-%H:%M:%S'
+
+# number of rendered listings kept, they're large at the bigger scales
+CACHED_BODIES = 4
+
+SUCCESS = {'result': 'success'}
+
+
+class FakeConsoleApp(object):
+    def __init__(self, dataset, latency=0.0, fault_rate=0.0, seed=0):
+        """Answers API requests from a dataset
+
+        :param dataset: The :class:`Dataset <benchmarks.data.Dataset>` served
+        :param latency: Seconds added to every response
+        :param fault_rate: Share of requests answered with a 429 or 503 instead, for retry benchmarks
+        :param seed: Seed of the fault injection
+        """
+        self.dataset = dataset
+        self.latency = latency
+        self.fault_rate = fault_rate
+        self.counts = dict()
+        self._faults = random.Random(seed)
+        self._bodies = OrderedDict()
+        self._lock = threading.Lock()
+
+    def handle(self, method, path, params):
+        """Answer a request
+
+        :param method: The HTTP method
+        :param path: Path of the url
+        :param params: Dictionary of query and form parameters
+        :return: Status code, dictionary of headers and the body
+        """
+        if path.startswith(CONTROL_PREFIX):
+            return self.control(path[len(CONTROL_PREFIX):], params)
+
+        endpoint = path[len(API_PREFIX):] if path.startswith(API_PREFIX) else path
+        with self._lock:
+            self.counts[endpoint] = self.counts.get(endpoint, 0) + 1
+            fault = self.fault_rate and self._faults.random() < self.fault_rate
+            retry_after = self._faults.random() < 0.5
+
+        if self.latency:
+            time.sleep(self.latency)
+        if fault:
+            if retry_after:
+                return 429, {'Retry-After': '0'}, b'{"result": "error", "message": "Rate limited"}'
+            return 503, {}, b'<html><body>503 Service Unavailable</body></html>'
+        if params.get('auth_token') is None:
+            return 200, {}, self.dumps({'result': 'error', 'message': 'Invalid auth_token'})
+
+        if method != 'GET':
+            return 200, {}, self.dumps(self.mutation(endpoint, params))
+
+        key = (endpoint, tuple(sorted((name, value) for name, value in params.items()
+                                      if name not in ('auth_token', 'tz'))))
+        with self._lock:
+            body = self._bodies.get(key)
+            if body is not None:
+                self._bodies.move_to_end(key)
+        if body is None:
+            body = self.dumps(self.read(endpoint, params))
+            with self._lock:
+                self._bodies[key] = body
+                while len(self._bodies) > CACHED_BODIES:
+                    self._bodies.popitem(last=False)
+        return 200, {}, body
+
+    def dumps(self, data):
+        return json.dumps(data, separators=(',', ':')).encode('utf-8')
+
+    def read(self, endpoint, params):
+        """JSON data of a GET request
+
+        :param endpoint: The API endpoint, e.g. ``devices/all``
+        :param params: Dictionary of parameters
+        :return: The response's JSON data
+        """
+        dataset = self.dataset
+        if endpoint == 'ping':
+            return SUCCESS
+        if endpoint in ('devices/all', 'devices/live', 'devices/dead'):
+            live = {'devices/all': None, 'devices/live': True, 'devices/dead': False}[endpoint]
+            return {'result': 'success', 'devices': dataset.devices(live=live)}
+        if endpoint == 'device/getinfo':
+            index = dataset.device_index(params.get('node_id'))
+            if index is None:
+                return {'result': 'error', 'message': 'Device not found'}
+            return {'result': 'success', 'device': dataset.device_info(index)}
+        if endpoint == 'bundles/list':
+            return {'result': 'success', 'bundles': dataset.bundles(params.get('node_id'))}
+        if endpoint in ('incidents/all', 'incidents/unacknowledged', 'incidents/acknowledged'):
+            acknowledged = {'incidents/all': None, 'incidents/unacknowledged': False,
+                            'incidents/acknowledged': True}[endpoint]
+            newer_than = params.get('newer_than')
+            if newer_than:
+                newer_than = (datetime.datetime.strptime(newer_than, NEWER_THAN_FORMAT) -
+                              datetime.datetime(1970, 1, 1)).total_seconds()
+            indexes = dataset.select_incidents(acknowledged=acknowledged, node_id=params.get('node_id'),
+                                               newer_than=newer_than)
+            event_limit = params.get('event_limit')
+            return {'result': 'success', 'incidents': [dataset.incident(index, event_limit) for index in indexes]}
+        if endpoint == 'incident/fetch':
+            index = dataset.incident_index(params.get('incident'))
+            if index is None:
+                return {'result': 'error', 'message': 'Incident not found'}
+            return {'result': 'success', 'incident': dataset.incident(index)}
+        if endpoint == 'canarytokens/fetch':
+            return {'result': 'success', 'tokens': dataset.tokens()}
+        if endpoint == 'canarytoken/fetch':
+            tokens = [token for token in dataset.tokens() if token['canarytoken'] == params.get('canarytoken')]
+            return {'result': 'success', 'token': tokens[0]} if tokens else \
+                {'result': 'error', 'message': 'Canarytoken not found'}
+        if endpoint == 'flocks/list':
+            return {'result': 'success', 'flocks': dataset.flocks()}
+        if endpoint == 'updates/list':
+            return {'result': 'success', 'updates': dataset.updates()}
+        if endpoint == 'settings/is_ip_whitelisted':
+            return {'result': 'success', 'is_ip_whitelisted': False, 'is_whitelist_enabled': True}
+        return {'result': 'error', 'message': 'Unknown endpoint {0}'.format(endpoint)}
+
+    def mutation(self, endpoint, params):
+        """JSON data of a POST or DELETE request. Nothing is changed, so runs can be repeated
+
+        :param endpoint: The API endpoint, e.g. ``incident/acknowledge``
+        :param params: Dictionary of parameters
+        :return: The response's JSON data
+        """
+        if endpoint == 'canarytoken/create':
+            token = self.dataset.token(0)
+            token['memo'] = params.get('memo', token['memo'])
+            return {'result': 'success', 'canarytoken': token}
+        if endpoint == 'flock/create':
+            return {'result': 'success', 'flock_id': self.dataset.flock_ids[0]}
+        if endpoint == 'flock/delete' and params.get('flock_id') == self.dataset.flock_ids[0]:
+            return {'result': 'error', 'message': 'Cannot delete default flock'}
+        return SUCCESS
+
+    def control(self, command, params):
+        """Requests to the server itself rather than the API
+
+        ``requests`` returns the number of requests per endpoint, resetting them if ``reset`` is set.
+        """
+        if command == 'requests':
+            with self._lock:
+                counts = dict(self.counts)
+                if params.get('reset'):
+                    self.counts.clear()
+            return 200, {}, self.dumps(counts)
+        return 404, {}, b'{}'
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    # buffer the response so headers and body go out together
+    wbufsize = -1
+
+    def log_message(self, *args):
+        pass
+
+    def _handle(self):
+        url = urlparse(self.path)
+        params = dict((name, values[0]) for name, values in parse_qs(url.query).items())
+        length = int(self.headers.get('Content-Length') or 0)
+        body = self.rfile.read(length) if length else b''
+        if body and self.headers.get('Content-Type', '').startswith('application/x-www-form-urlencoded'):
+            params.update((name, values[0]) for name, values in parse_qs(body.decode('utf-8')).items())
+
+        status, headers, body = self.server.app.handle(self.command, url.path, params)
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json' if body[:1] == b'{' else 'text/html')
+        self.send_header('Content-Length', str(len(body)))
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    do_GET = do_POST = do_DELETE = _handle
+
+
+class _Server(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+    request_queue_size = 128
+
+
+def _serve(conn, scale, seed, latency, fault_rate, host, port):
+    """Run the fake console, sending its port through ``conn`` once it's listening"""
+    server = _Server((host, port), _Handler)
+    server.app = FakeConsoleApp(Dataset(scale, seed), latency=latency, fault_rate=fault_rate, seed=seed)
+    conn.send(server.server_address[1])
+    conn.close()
+    server.serve_forever()
+
+
+class FakeConsole(object):
+    def __init__(self, scale='small', seed=0, latency=0.0, fault_rate=0.0, host='127.0.0.1', port=0):
+        """A fake console running in a separate process
+
+        :param scale: Name of one of the dataset scales, or a dictionary of record counts
+        :param seed: Seed of the random data
+        :param latency: Seconds added to every response
+        :param fault_rate: Share of requests answered with a 429 or 503 instead
+        :param host: Address the server listens on
+        :param port: Port the server listens on, a free port by default
+
+        Usage::
+
+            >>> with FakeConsole(scale='small') as fake:
+            >>>     console = canarytools.Console('bench', 'key', base_url=fake.base_url)
+            >>>     console.devices.all()
+            >>>     fake.requests()
+            {'devices/all': 1, 'incidents/unacknowledged': 1}
+        """
+        self.scale = scale
+        self.seed = seed
+        self.latency = latency
+        self.fault_rate = fault_rate
+        self.host = host
+        self.port = port
+        self._process = None
+
+    @property
+    def base_url(self):
+        """Base url of the fake console's API, used as a Console's ``base_url``"""
+        return 'http://{host}:{port}{prefix}'.format(host=self.host, port=self.port, prefix=API_PREFIX)
+
+    def start(self):
+        """Start the server. Returns once it's listening"""
+        parent, child = multiprocessing.Pipe()
+        self._process = multiprocessing.Process(
+            target=_serve, args=(child, self.scale, self.seed, self.latency, self.fault_rate, self.host, self.port))
+        self._process.daemon = True
+        self._process.start()
+        self.port = parent.recv()
+        return self
+
+    def stop(self):
+        """Stop the server"""
+        if self._process is not None:
+            self._process.terminate()
+            self._process.join()
+            self._process = None
+
+    def requests(self, reset=True):
+        """Number of requests received per endpoint
+
+        :param reset: Start counting from zero again
+        :return: Dictionary of request counts keyed by endpoint
+        """
+        import requests
+        url = 'http://{host}:{port}{prefix}requests'.format(host=self.host, port=self.port, prefix=CONTROL_PREFIX)
+        return requests.get(url, params={'reset': '1'} if reset else {}).json()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Serve a fake Canary console API')
+    parser.add_argument('--scale', default='small', help='Dataset scale: tiny, small, medium or full')
+    parser.add_argument('--seed', type=int, default=0, help='Seed of the random data')
+    parser.add_argument('--latency', type=float, default=0.0, help='Seconds added to every response')
+    parser.add_argument('--fault-rate', type=float, default=0.0, help='Share of requests answered with 429/503')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8000)
+    args = parser.parse_args()
+
+    server = _Server((args.host, args.port), _Handler)
+    server.app = FakeConsoleApp(Dataset(args.scale, args.seed), latency=args.latency,
+                                fault_rate=args.fault_rate, seed=args.seed)
+    print('Serving a {scale} fake console on http://{host}:{port}{prefix}'.format(
+        scale=args.scale, host=args.host, port=args.port, prefix=API_PREFIX))
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
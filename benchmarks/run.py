@@ -0,0 +1,588 @@
+"""Run the benchmarks against a local fake console and write the results to JSON.
+
+Each benchmark makes public API calls with a fresh :class:`Console <canarytools.Console>` and records the
+wall time, the HTTP requests the fake console received, the time spent on the network, decoding JSON and
+building objects, the peak memory allocated by the client and the memory still held by the objects it
+returned. Compare with an earlier run to spot regressions::
+
+    python -m benchmarks.run --scale small --output results.json
+    python -m benchmarks.run --scale small --output new.json --baseline results.json
+"""
+import argparse
+import datetime
+import gc
+import io
+import json
+import logging
+import os
+import platform
+import shutil
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+
+from collections import namedtuple
+
+import canarytools
+
+from canarytools import export
+from canarytools.models.base import parse_timestamp
+
+from .data import Dataset, std_time
+from .fakeconsole import FakeConsole
+
+Case = namedtuple('Case', 'name fn server transport console_kwargs')
+
+CASES = list()
+
+
+def case(name, server='default', transport=None, **console_kwargs):
+    """Register a benchmark. The function is called with a fresh Console and the run's :class:`Context`,
+        and returns the number of items it processed, or the objects it built, e.g. a list of incidents.
+        Returned objects are kept while the retained memory is measured
+
+    :param name: Name of the benchmark, ``<group>.<name>``
+    :param server: The fake console used: ``default``, ``faulty`` (answers 20% of requests with 429 or 503)
+        or ``None`` for benchmarks that make no requests
+    :param transport: Transport used instead of the one chosen on the command line
+    :param console_kwargs: Extra arguments of the Console
+    """
+    def register(fn):
+        CASES.append(Case(name, fn, server, transport, console_kwargs))
+        return fn
+    return register
+
+
+class Context(object):
+    def __init__(self, args):
+        """Fake consoles and settings shared by the benchmarks of a run
+
+        :param args: The parsed command line arguments
+        """
+        self.args = args
+        self.dataset = Dataset(args.scale, args.seed)
+        self._servers = dict()
+
+    def server(self, name):
+        """Get a fake console, starting it on first use
+
+        :param name: ``default`` or ``faulty``
+        :return: A running :class:`FakeConsole <benchmarks.fakeconsole.FakeConsole>`
+        """
+        if name not in self._servers:
+            fault_rate = 0.2 if name == 'faulty' else 0.0
+            self._servers[name] = FakeConsole(scale=self.args.scale, seed=self.args.seed, latency=self.args.latency,
+                                              fault_rate=fault_rate).start()
+        return self._servers[name]
+
+    def transport(self, name=None):
+        name = name or self.args.transport
+        if name == 'urllib3':
+            return canarytools.Urllib3Transport(maxsize=32)
+        if name == 'requests_per_thread':
+            return canarytools.RequestsTransport(pool_maxsize=32, per_thread=True)
+        return canarytools.RequestsTransport(pool_maxsize=32)
+
+    def console(self, bench, console_class=canarytools.Console):
+        """A fresh Console pointed at the benchmark's fake console"""
+        kwargs = dict(bench.console_kwargs)
+        if console_class is canarytools.Console:
+            kwargs['transport'] = self.transport(bench.transport)
+        server = self.server(bench.server or 'default')
+        return console_class('bench', 'bench-key', base_url=server.base_url, **kwargs)
+
+    def close(self):
+        for server in self._servers.values():
+            server.stop()
+
+
+# console
+
+@case('console.ping')
+def ping(console, ctx):
+    for _ in range(200):
+        console.ping()
+    return 200
+
+
+@case('console.ping_debug_info', debug=True, debug_level=logging.INFO)
+def ping_debug_info(console, ctx):
+    return ping(console, ctx)
+
+
+@case('console.ping_debug', debug=True, debug_level=logging.DEBUG)
+def ping_debug(console, ctx):
+    return ping(console, ctx)
+
+
+# devices
+
+@case('devices.all')
+def devices_all(console, ctx):
+    return console.devices.all()
+
+
+@case('devices.live')
+def devices_live(console, ctx):
+    return console.devices.live()
+
+
+@case('devices.dead')
+def devices_dead(console, ctx):
+    return console.devices.dead()
+
+
+@case('devices.all_unacknowledged_incidents')
+def devices_all_unacknowledged_incidents(console, ctx):
+    devices = console.devices.all()
+    for device in devices:
+        device.unacknowleged_incidents
+    return devices
+
+
+@case('devices.all_hydrated_100')
+def devices_all_hydrated(console, ctx):
+    devices = console.devices.all(hydrate=True)[:100]
+    for device in devices:
+        device.settings
+    return devices
+
+
+@case('devices.get_device_50')
+def devices_get_device(console, ctx):
+    for node_id in ctx.dataset.node_ids[:50]:
+        console.devices.get_device(node_id)
+    return min(50, len(ctx.dataset.node_ids))
+
+
+# incidents
+
+@case('incidents.all')
+def incidents_all(console, ctx):
+    return console.incidents.all()
+
+
+# debug logging with a large response, where logging the body costs the most
+@case('incidents.all_debug_info', debug=True, debug_level=logging.INFO)
+def incidents_all_debug_info(console, ctx):
+    return incidents_all(console, ctx)
+
+
+@case('incidents.all_debug', debug=True, debug_level=logging.DEBUG)
+def incidents_all_debug(console, ctx):
+    return incidents_all(console, ctx)
+
+
+@case('incidents.all_compact', compact_models=True)
+def incidents_all_compact(console, ctx):
+    return incidents_all(console, ctx)
+
+
+@case('incidents.all_lazy_timestamps', lazy_timestamps=True)
+def incidents_all_lazy(console, ctx):
+    return incidents_all(console, ctx)
+
+
+@case('incidents.all_compact_lazy_timestamps', compact_models=True, lazy_timestamps=True)
+def incidents_all_compact_lazy(console, ctx):
+    return incidents_all(console, ctx)
+
+
+@case('incidents.all_every_event')
+def incidents_all_every_event(console, ctx):
+    incidents = console.incidents.all()
+    events = list()
+    for incident in incidents:
+        for event in incident.events:
+            event.timestamp
+            events.append(event)
+    return events
+
+
+@case('incidents.all_every_event_compact_lazy_timestamps', compact_models=True, lazy_timestamps=True)
+def incidents_all_every_event_compact_lazy(console, ctx):
+    return incidents_all_every_event(console, ctx)
+
+
+@case('incidents.unacknowledged')
+def incidents_unacknowledged(console, ctx):
+    return console.incidents.unacknowledged()
+
+
+@case('incidents.acknowledged')
+def incidents_acknowledged(console, ctx):
+    return console.incidents.acknowledged()
+
+
+@case('incidents.iter_all')
+def incidents_iter_all(console, ctx):
+    return sum(1 for _ in console.incidents.iter_all())
+
+
+@case('incidents.iter_all_compact', compact_models=True)
+def incidents_iter_all_compact(console, ctx):
+    return incidents_iter_all(console, ctx)
+
+
+@case('incidents.get_incident_50')
+def incidents_get_incident(console, ctx):
+    incident_ids = [meta['id'] for meta in ctx.dataset.incidents_meta[:50]]
+    for incident_id in incident_ids:
+        console.incidents.get_incident(incident_id)
+    return len(incident_ids)
+
+
+@case('incidents.sync_twice')
+def incidents_sync(console, ctx):
+    directory = tempfile.mkdtemp()
+    try:
+        state_path = os.path.join(directory, 'incidents.state')
+        first = console.incidents.sync(state_path)
+        second = console.incidents.sync(state_path)
+        return len(first) + len(second)
+    finally:
+        shutil.rmtree(directory)
+
+
+@case('incidents.acknowledge_many_500', transport='requests_per_thread')
+def incidents_acknowledge_many(console, ctx):
+    incident_ids = [meta['id'] for meta in ctx.dataset.incidents_meta[:500]]
+    return len(console.incidents.acknowledge_many(incident_ids))
+
+
+# Canarytokens, flocks and updates
+
+@case('tokens.all')
+def tokens_all(console, ctx):
+    return console.tokens.all()
+
+
+@case('tokens.get_token_20')
+def tokens_get_token(console, ctx):
+    canarytokens = [ctx.dataset.token(index)['canarytoken'] for index in range(min(20, ctx.dataset.token_count))]
+    for canarytoken in canarytokens:
+        console.tokens.get_token(canarytoken)
+    return len(canarytokens)
+
+
+@case('flocks.all')
+def flocks_all(console, ctx):
+    return console.flocks.all()
+
+
+@case('updates.list_updates')
+def updates_list(console, ctx):
+    return console.updates.list_updates()
+
+
+# export
+
+@case('export.event_columns')
+def export_event_columns(console, ctx):
+    columns = export.event_columns(console.incidents.all())
+    return len(columns['incident_id'])
+
+
+@case('export.write_ndjson_events')
+def export_write_ndjson(console, ctx):
+    output = _Counter()
+    export.write_ndjson(console.incidents.iter_all(), output, events=True)
+    return output.lines
+
+
+@case('export.write_csv_events')
+def export_write_csv(console, ctx):
+    output = _Counter()
+    export.write_csv(console.incidents.iter_all(), output, events=True)
+    return output.lines - 1
+
+
+class _Counter(io.StringIO):
+    """A file counting the lines written to it without keeping them"""
+    lines = 0
+
+    def write(self, text):
+        self.lines += text.count('\n')
+        return len(text)
+
+
+# parsing, without requests
+
+_timestamps = list()
+
+
+def timestamps(count):
+    """Timestamps in the console's format, generated once"""
+    while len(_timestamps) < count:
+        _timestamps.append(std_time(1600000000 + len(_timestamps) * 37))
+    return _timestamps[:count]
+
+
+@case('parse.timestamps_100k', server=None)
+def parse_timestamps(console, ctx):
+    values = timestamps(100000)
+    for value in values:
+        parse_timestamp(value)
+    return len(values)
+
+
+# dateutil is slow, so fewer timestamps; compare items_per_second
+@case('parse.timestamps_10k_dateutil', server=None)
+def parse_timestamps_dateutil(console, ctx):
+    from dateutil.parser import parse
+    values = timestamps(10000)
+    for value in values:
+        parse(value)
+    return len(values)
+
+
+# transports, 8 threads sharing a thread safe Console. requests sessions aren't thread safe, so each thread
+# gets its own; a urllib3 pool is shared
+
+def _threaded_pings(console, threads=8, calls=100):
+    def worker():
+        for _ in range(calls):
+            console.ping()
+    workers = [threading.Thread(target=worker) for _ in range(threads)]
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+    return threads * calls
+
+
+@case('transport.requests_8_threads', transport='requests_per_thread', thread_safe=True)
+def transport_requests(console, ctx):
+    return _threaded_pings(console)
+
+
+@case('transport.urllib3_8_threads', transport='urllib3', thread_safe=True)
+def transport_urllib3(console, ctx):
+    return _threaded_pings(console)
+
+
+# coalescing, 8 threads asking for the same devices at once
+
+def _threaded_get_devices(console, ctx, threads=8):
+    node_ids = ctx.dataset.node_ids[:20]
+
+    def worker():
+        for node_id in node_ids:
+            console.devices.get_device(node_id)
+    workers = [threading.Thread(target=worker) for _ in range(threads)]
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+    return threads * len(node_ids)
+
+
+@case('coalesce.get_device_8_threads', transport='requests_per_thread', thread_safe=True)
+def get_device_threads(console, ctx):
+    return _threaded_get_devices(console, ctx)
+
+
+@case('coalesce.get_device_8_threads_coalesced', transport='requests_per_thread', thread_safe=True,
+      coalesce=True)
+def get_device_threads_coalesced(console, ctx):
+    return _threaded_get_devices(console, ctx)
+
+
+# retries, against a console answering 20% of requests with 429 or 503
+
+@case('retry.ping_faulty', server='faulty', retry=canarytools.RetryPolicy(retries=5, backoff=0.01))
+def retry_ping(console, ctx):
+    for _ in range(100):
+        console.ping()
+    return 100
+
+
+@case('retry.devices_all_faulty', server='faulty', retry=canarytools.RetryPolicy(retries=5, backoff=0.01))
+def retry_devices_all(console, ctx):
+    return console.devices.all()
+
+
+# asyncio
+
+@case('aio.get_device_50_concurrent')
+def aio_get_device(console, ctx):
+    import asyncio
+
+    async def main():
+        async with console:
+            await asyncio.gather(*[console.devices.get_device(node_id) for node_id in ctx.dataset.node_ids[:50]])
+    asyncio.run(main())
+    return min(50, len(ctx.dataset.node_ids))
+
+
+def _console_stats(console):
+    """Totals of the console's metrics over all endpoints"""
+    totals = dict.fromkeys(('count', 'bytes', 'network_time', 'decode_time', 'build_time', 'retries'), 0)
+    for stats in console.stats().values():
+        for key in totals:
+            totals[key] += stats.get(key, 0)
+    return totals
+
+
+def run_case(bench, ctx, repeat, memory):
+    """Run a benchmark
+
+    :param bench: The :class:`Case`
+    :param ctx: The run's :class:`Context`
+    :param repeat: Number of timed runs
+    :param memory: Also run once with ``tracemalloc`` to measure the peak memory
+    :return: Dictionary of results
+    """
+    console_class = canarytools.Console
+    if bench.name.startswith('aio.'):
+        console_class = getattr(canarytools, 'AsyncConsole', None)
+        if console_class is None:
+            return {'skipped': 'aiohttp is not installed'}
+
+    server = ctx.server(bench.server) if bench.server else None
+
+    def make_console():
+        return ctx.console(bench, console_class) if server is not None else None
+
+    times = list()
+    for _ in range(repeat):
+        console = make_console()
+        if server is not None:
+            server.requests(reset=True)
+        gc.collect()
+        start = time.perf_counter()
+        result = bench.fn(console, ctx)
+        times.append(time.perf_counter() - start)
+        items = result if isinstance(result, int) else len(result)
+        result = None
+    requests = server.requests(reset=True) if server is not None else dict()
+    stats = _console_stats(console) if console is not None else dict()
+
+    peak = retained = None
+    if memory:
+        console = make_console()
+        gc.collect()
+        tracemalloc.start()
+        result = bench.fn(console, ctx)
+        peak = tracemalloc.get_traced_memory()[1]
+        gc.collect()
+        # what the returned objects still hold on to
+        retained = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        result = None
+
+    times.sort()
+    median = times[len(times) // 2]
+    parse_time = stats.get('decode_time', 0) + stats.get('build_time', 0)
+    return {
+        'items': items,
+        'runs': repeat,
+        'wall': {'min': times[0], 'median': median, 'max': times[-1]},
+        'items_per_second': items / median if median else None,
+        'http_requests': sum(requests.values()),
+        'requests': requests,
+        'retries': stats.get('retries', 0),
+        'bytes': stats.get('bytes', 0),
+        'phases': {'network': stats.get('network_time', 0), 'decode': stats.get('decode_time', 0),
+                   'build': stats.get('build_time', 0)},
+        'parse_mb_per_second': stats['bytes'] / parse_time / 1e6 if parse_time and stats.get('bytes') else None,
+        'peak_memory': peak,
+        'retained_memory': retained,
+    }
+
+
+def compare(results, baseline, threshold):
+    """Print how the results changed from a baseline run
+
+    :param results: The results of this run
+    :param baseline: The results of the baseline run
+    :param threshold: Percentage slower, or more memory, reported as a regression
+    :return: Names of the benchmarks that regressed
+    """
+    regressions = list()
+    print('\n{0:<55} {1:>10} {2:>10}'.format('benchmark', 'time', 'memory'))
+    for name, result in sorted(results['results'].items()):
+        before = baseline['results'].get(name)
+        if not before or 'wall' not in result or 'wall' not in before:
+            continue
+        changes = list()
+        for now, then in ((result['wall']['median'], before['wall']['median']),
+                          (result['peak_memory'], before['peak_memory'])):
+            changes.append((now - then) * 100.0 / then if now is not None and then else None)
+        regressed = any(change is not None and change > threshold for change in changes)
+        if regressed:
+            regressions.append(name)
+        print('{0:<55} {1:>10} {2:>10}{3}'.format(
+            name, *['{0:+.1f}%'.format(change) if change is not None else '-' for change in changes],
+            '  REGRESSION' if regressed else ''))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark canarytools against a local fake console')
+    parser.add_argument('--scale', default='small', help='Dataset scale: tiny, small, medium or full')
+    parser.add_argument('--seed', type=int, default=0, help='Seed of the random data')
+    parser.add_argument('--repeat', type=int, default=3, help='Timed runs of each benchmark')
+    parser.add_argument('--only', action='append', default=[],
+                        help='Only run benchmarks whose name starts with this, can be repeated')
+    parser.add_argument('--transport', default='requests', choices=('requests', 'urllib3'))
+    parser.add_argument('--latency', type=float, default=0.0, help='Seconds the fake console adds to responses')
+    parser.add_argument('--no-memory', dest='memory', action='store_false', help="Don't measure peak memory")
+    parser.add_argument('--output', help='Write the results to this JSON file')
+    parser.add_argument('--baseline', help='Compare with the results in this JSON file')
+    parser.add_argument('--threshold', type=float, default=10.0,
+                        help='Percentage slower, or more memory, than the baseline reported as a regression')
+    args = parser.parse_args(argv)
+
+    # measure the cost of building log messages, not of writing them to a terminal
+    canarytools.console.logger.handlers = [logging.NullHandler()]
+
+    ctx = Context(args)
+    results = {
+        'meta': {
+            'date': datetime.datetime.utcnow().isoformat(),
+            'canarytools': canarytools.__version__,
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'scale': args.scale,
+            'seed': args.seed,
+            'transport': args.transport,
+            'latency': args.latency,
+        },
+        'dataset': ctx.dataset.counts(),
+        'results': dict(),
+    }
+    try:
+        for bench in CASES:
+            if args.only and not any(bench.name.startswith(prefix) for prefix in args.only):
+                continue
+            result = run_case(bench, ctx, args.repeat, args.memory)
+            results['results'][bench.name] = result
+            if 'skipped' in result:
+                print('{0:<55} skipped: {1}'.format(bench.name, result['skipped']))
+                continue
+            memory = ''
+            if result['peak_memory'] is not None:
+                memory = '{0:>7.1f}MB peak {1:>7.1f}MB kept'.format(result['peak_memory'] / 1e6,
+                                                                  result['retained_memory'] / 1e6)
+            print('{0:<55} {1:>9.1f}ms {2:>7} items {3:>5} requests {4}'.format(
+                bench.name, result['wall']['median'] * 1000, result['items'], result['http_requests'], memory))
+    finally:
+        ctx.close()
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        if compare(results, baseline, args.threshold):
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,171 @@
+"""Concurrency stress test of a thread-safe :class:`Console <canarytools.Console>` against the local fake console.
+
+Many threads share one Console and run a mix of API calls for a while. Every answer is checked against the
+dataset, so a response handed to the wrong thread is caught, as are errors that share an exception object,
+shared device listings loading their incident index more than once, and requests missing from the console's
+metrics. Exits with status 1 if anything went wrong::
+
+    python -m benchmarks.stress --threads 32 --seconds 10
+"""
+import argparse
+import json
+import random
+import sys
+import threading
+import time
+
+import canarytools
+
+from .data import Dataset
+from .fakeconsole import FakeConsole
+
+
+class Failure(Exception):
+    """An answer that doesn't match the request"""
+
+
+def _check(condition, message, *args):
+    if not condition:
+        raise Failure(message.format(*args))
+
+
+def get_device(console, dataset, rng, shared):
+    node_id = rng.choice(dataset.node_ids)
+    device = console.devices.get_device(node_id)
+    _check(device.node_id == node_id, 'asked for device {0}, got {1}', node_id, device.node_id)
+
+
+def get_incident(console, dataset, rng, shared):
+    incident_id = rng.choice(dataset.incidents_meta)['id']
+    incident = console.incidents.get_incident(incident_id)
+    _check(incident.id == incident_id, 'asked for incident {0}, got {1}', incident_id, incident.id)
+
+
+def unacknowledged_for_node(console, dataset, rng, shared):
+    node_id = rng.choice(dataset.node_ids)
+    incidents = console.incidents.unacknowledged(node_id=node_id)
+    _check(all(incident.node_id == node_id for incident in incidents),
+           'asked for the incidents of {0}, got some of another device', node_id)
+
+
+def shared_listing(console, dataset, rng, shared):
+    # devices of one listing share an incident index, which threads load on first use
+    device = rng.choice(shared['devices'])
+    expected = set(dataset.unacknowledged_by_node.get(device.node_id, ()))
+    incidents = device.unacknowleged_incidents
+    _check(all(incident.node_id == device.node_id for incident in incidents),
+           'incidents of another device listed for {0}', device.node_id)
+    _check(len(incidents) == len(expected), '{0} has {1} unacknowledged incidents, {2} listed',
+           device.node_id, len(expected), len(incidents))
+
+
+def missing_device(console, dataset, rng, shared):
+    try:
+        console.devices.get_device('0000000000000000')
+    except canarytools.DeviceNotFoundError as e:
+        shared['errors'].append(e)
+    else:
+        raise Failure('a missing device was found')
+
+
+def delete_default_flock(console, dataset, rng, shared):
+    try:
+        shared['default_flock'].delete()
+    except canarytools.FlockError as e:
+        _check(str(e) == 'Cannot delete default flock', 'unexpected flock error: {0}', e)
+        shared['errors'].append(e)
+    else:
+        raise Failure('the default flock was deleted')
+
+
+OPERATIONS = (get_device, get_incident, unacknowledged_for_node, shared_listing, missing_device,
+              delete_default_flock)
+
+
+def run(console, dataset, threads, seconds, seed):
+    """Run the operations from many threads sharing a console
+
+    :param console: A thread-safe Console pointed at the fake console
+    :param dataset: The :class:`Dataset <benchmarks.data.Dataset>` the fake console serves
+    :param threads: Number of threads
+    :param seconds: Seconds each thread keeps running operations
+    :param seed: Seed of the operations picked
+    :return: Dictionary of results
+    """
+    default_flock = [flock for flock in console.flocks.all() if flock.flock_id == dataset.flock_ids[0]][0]
+    shared = {'devices': console.devices.all(), 'default_flock': default_flock, 'errors': list()}
+    counts = dict((operation.__name__, 0) for operation in OPERATIONS)
+    failures = list()
+    lock = threading.Lock()
+    start = threading.Event()
+
+    def worker(index):
+        rng = random.Random('{0}:{1}'.format(seed, index))
+        done = dict.fromkeys(counts, 0)
+        start.wait()
+        deadline = time.time() + seconds
+        while time.time() < deadline:
+            operation = rng.choice(OPERATIONS)
+            try:
+                operation(console, dataset, rng, shared)
+            except Exception as e:
+                with lock:
+                    failures.append('{0}: {1}: {2}'.format(operation.__name__, type(e).__name__, e))
+            done[operation.__name__] += 1
+        with lock:
+            for name, count in done.items():
+                counts[name] += count
+
+    workers = [threading.Thread(target=worker, args=(index,)) for index in range(threads)]
+    for thread in workers:
+        thread.start()
+    began = time.time()
+    start.set()
+    for thread in workers:
+        thread.join()
+    elapsed = time.time() - began
+
+    errors = shared['errors']
+    if len(set(id(error) for error in errors)) != len(errors):
+        failures.append('threads raised the same exception object')
+    operations = sum(counts.values())
+    return {'threads': threads, 'seconds': elapsed, 'operations': counts,
+            'operations_per_second': operations / elapsed if elapsed else None,
+            'failures': failures}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Stress test a Console shared by many threads')
+    parser.add_argument('--threads', type=int, default=32)
+    parser.add_argument('--seconds', type=float, default=10.0, help='Seconds each thread runs')
+    parser.add_argument('--scale', default='tiny', help='Dataset scale: tiny, small, medium or full')
+    parser.add_argument('--seed', type=int, default=0, help='Seed of the data and of the operations picked')
+    parser.add_argument('--transport', default='requests', choices=('requests', 'urllib3'))
+    parser.add_argument('--latency', type=float, default=0.0, help='Seconds the fake console adds to responses')
+    args = parser.parse_args(argv)
+
+    dataset = Dataset(args.scale, args.seed)
+    with FakeConsole(scale=args.scale, seed=args.seed, latency=args.latency) as fake:
+        if args.transport == 'urllib3':
+            transport = canarytools.Urllib3Transport(maxsize=args.threads)
+        else:
+            transport = canarytools.RequestsTransport(pool_maxsize=args.threads, per_thread=True)
+        console = canarytools.Console('stress', 'stress-key', base_url=fake.base_url, transport=transport,
+                                      thread_safe=True)
+        fake.requests(reset=True)
+        result = run(console, dataset, args.threads, args.seconds, args.seed)
+
+        # every request the fake console received was recorded once in the console's metrics
+        received = sum(fake.requests().values())
+        recorded = sum(stats['count'] for stats in console.stats().values())
+        result['requests'] = received
+        if received != recorded:
+            result['failures'].append('{0} requests received, {1} in the console metrics'.format(
+                received, recorded))
+
+    print(json.dumps(dict(result, failures=result['failures'][:20]), indent=2))
+    return 1 if result['failures'] else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
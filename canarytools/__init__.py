@@ -1,7 +1,19 @@
 from .console import Console
+from .pool import ConsolePool, PoolResult
+from .cache import ResponseCache
+from .retry import RetryPolicy
+from .ratelimit import RateLimiter
+from .hedge import HedgePolicy
+from .transport import Transport, RequestsTransport, Urllib3Transport
+
+try:
+    from .aio import AsyncConsole
+except SyntaxError:
+    # python 2, asyncio support needs python 3.6+
+    pass
 
 from .exceptions import ConsoleError, ConfigurationError, InvalidAuthTokenError, ConnectionError, \
-    DeviceNotFoundError, IncidentNotFoundError, InvalidParameterError, UpdateError, FileNotFound, \
+    RequestTimeoutError, DeviceNotFoundError, IncidentNotFoundError, InvalidParameterError, UpdateError, FileNotFound, \
     CanaryTokenError, IncidentError, FlockError
 
 from .models.incidents import Incident, IncidentDeviceReconnected, IncidentDeviceDied, IncidentFTPLogin, \
@@ -10,9 +22,10 @@ from .models.incidents import Incident, IncidentDeviceReconnected, IncidentDevic
     IncidentNTPMonlist, IncidentVNCLogin, IncidentGitCloneRequest, IncidentTCPBannerRequest, IncidentModbusRequest, \
     IncidentRedisCommand, IncidentUser, IncidentSNMPRequest, IncidentSIPRequest, IncidentSMBFileOpen, \
     IncidentCanarytokenTriggered, IncidentHostPortScan, IncidentNetworkPortScan, IncidentConsolidatedNetworkPortScan,\
-    Event
+    Event, EventList, IncidentIndex, CompactIncident, CompactEvent
 from .models.canarytokens import CanaryToken, CanaryTokenKinds
 from .models.flocks import Flock
+from .models.ports import PortSet
 from .models.devices import Device
 from .models.databundles import DataBundle
 from .models.update import Update
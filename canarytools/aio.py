@@ -0,0 +1,867 @@
+import asyncio
+import copy
+import json
+import logging
+import os
+import sys
+import time
+
+import pytz
+
+from datetime import datetime
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+from .console import Console, RESULT_ERROR, RESULT_SUCCESS
+from .exceptions import ConfigurationError, ConsoleError, InvalidParameterError
+from .jsonstream import JSONArrayStream
+from .metrics import RequestRecord
+from .models.devices import Devices
+from .models.incidents import Incidents, IncidentIndex
+from .models.settings import Settings
+from .models.canarytokens import CanaryTokens
+from .models.flocks import Flocks
+from .models.update import Updates
+
+
+def _raw(data):
+    """Parser returning the JSON data untouched"""
+    return data
+
+
+class AsyncConsole(Console):
+    def __init__(self, domain=None, api_key=None, timezone=pytz.utc, debug=False, debug_level=logging.DEBUG,
+                 base_url=None, metrics_callback=None, compact_models=False, lazy_timestamps=False,
+                 retry=None, rate_limit=None, max_connections=100, coalesce=False, hedge=None):
+        """Initialize an asyncio Console object. Takes the same configuration as :class:`Console <Console>`,
+            but every API call is a coroutine, so a single event loop can drive many concurrent calls.
+            Requires ``aiohttp``.
+
+        The returned objects are the same :class:`Device <Device>`, :class:`Incident <Incident>`,
+        :class:`CanaryToken <CanaryToken>`, :class:`Flock <Flock>` and :class:`Update <Update>` objects used
+        by :class:`Console <Console>`. Their own methods that make API calls (e.g. ``Device.reboot``) are not
+        awaitable; use the equivalent methods on the console's interfaces instead.
+
+        :param max_connections: Maximum number of simultaneous connections to the console
+
+        :except ConfigurationError: Domain and/or API auth token not set, or ``aiohttp`` is not installed
+
+        Usage::
+
+            >>> import canarytools
+            >>> async with canarytools.AsyncConsole(domain='console_domain', api_key='test_key') as console:
+            >>>     devices, incidents = await asyncio.gather(
+            >>>         console.devices.all(), console.incidents.unacknowledged())
+        """
+        if aiohttp is None:
+            raise ConfigurationError("aiohttp is required to use AsyncConsole. "
+                                     "Install it with 'pip install canarytools[async]'.")
+
+        self.max_connections = max_connections
+        self._session = None
+        # futures of the GET requests in flight, keyed by the coalescer's request key
+        self._in_flight = dict()
+
+        super(AsyncConsole, self).__init__(domain=domain, api_key=api_key, timezone=timezone,
+                                           debug=debug, debug_level=debug_level, base_url=base_url,
+                                           metrics_callback=metrics_callback, compact_models=compact_models,
+                                           lazy_timestamps=lazy_timestamps, retry=retry, rate_limit=rate_limit,
+                                           coalesce=coalesce, hedge=hedge)
+
+    def _create_transport(self):
+        """Requests are sent with an aiohttp session instead. aiohttp sessions must be created inside
+            a running event loop, so this happens on the first request
+        """
+        return None
+
+    def _create_managers(self):
+        """Create the awaitable interfaces used to access the API endpoints"""
+        self.devices = AsyncDevices(self)
+        self.incidents = AsyncIncidents(self)
+        self.settings = AsyncSettings(self)
+        self.tokens = AsyncCanaryTokens(self)
+        self.flocks = AsyncFlocks(self)
+        self.updates = AsyncUpdates(self)
+
+    @property
+    def session(self):
+        """The aiohttp session requests are sent with, ``None`` until the first request"""
+        return self._session
+
+    def _get_session(self):
+        """Get the aiohttp session, creating it if needed
+
+        :return: An ``aiohttp.ClientSession``
+        """
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(limit=self.max_connections)
+            self._session = aiohttp.ClientSession(connector=connector)
+        return self._session
+
+    async def close(self):
+        """Close the underlying HTTP session"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def ping(self):
+        """Tests the connection to the Canary Console
+
+            :return: Returns ``True`` if a connection could be established
+                and ``False`` otherwise
+            :rtype: bool
+
+            Usage::
+
+              >>> import canarytools
+              >>> console = canarytools.AsyncConsole()
+              >>> await console.ping()
+              True
+            """
+        result = await self.get('ping', {})
+        return result.result == RESULT_SUCCESS
+
+    async def post(self, url, params, parser=None, files={}):
+        """Post request
+
+        :param url: Url of the API endpoint
+        :param params: List of parameters to be sent
+        :param parser: The function used to parse JSON data into an specific object
+        :param files: Files to be uploaded
+        :return: Object(s) or a Result Indicator Object
+        """
+        data = self._clean_params(params)
+        if files:
+            form = aiohttp.FormData()
+            for key, value in data.items():
+                form.add_field(key, value)
+            for key, (filename, f, mimetype) in files.items():
+                form.add_field(key, f, filename=filename, content_type=mimetype)
+            data = form
+        return await self._request('POST', url, parser, data=data, log_params=params)
+
+    async def get(self, url, params, parser=None):
+        """Get request
+
+        :param url: Url of the API endpoint
+        :param params: List of parameters to be sent
+        :param parser: The function used to parse JSON data into an specific object
+        :return: Object(s) or a Result Indicator Object
+        """
+        return await self._request('GET', url, parser, params=self._clean_params(params), log_params=params)
+
+    async def delete(self, url, params, parser=None):
+        """Delete request
+
+        :param url: Url of the API endpoint
+        :param params: List of parameters to be sent
+        :param parser: The function used to parse JSON data into an specific object
+        :return: Object(s) or a Result Indicator Object
+        """
+        return await self._request('DELETE', url, parser, params=self._clean_params(params), log_params=params)
+
+    async def _request(self, method, url, parser, params=None, data=None, log_params=None):
+        """Make a request and handle the response
+
+        :param method: The HTTP method
+        :param url: Url of the API endpoint
+        :param parser: The function used to parse JSON data into an specific object
+        :param params: Query string parameters
+        :param data: Form data
+        :param log_params: The parameters as passed by the caller, for logging
+        :return: Object(s) or a Result Indicator Object
+        """
+        query = {'auth_token': self.api_key}
+        query.update(params or {})
+
+        logging_enabled = self.logging_enabled()
+        if logging_enabled:
+            self.log('[{datetime}] {method} to {ROOT}{url}.json: {params}'.format(
+                datetime=datetime.now(self.tz), method=method, ROOT=self.root, url=url, params=log_params))
+
+        record = RequestRecord(method, url)
+        try:
+            if self.coalescer is not None and method == 'GET':
+                response = await self._coalesced_fetch(url, record, logging_enabled, query)
+            else:
+                response = await self._fetch(method, url, record, logging_enabled, params=query, data=data)
+
+            start = time.time()
+            result = self.handle_response(response, parser)
+            record.build_time = time.time() - start
+            return result
+        except Exception as e:
+            record.error = type(e).__name__
+            raise
+        finally:
+            if self.coalescer is not None and method != 'GET':
+                # later reads don't wait for a response from before the change
+                self._in_flight.clear()
+            self.metrics.record(record)
+            for profile in list(self._profiles):
+                profile.record(record, sys._getframe())
+
+    async def stream(self, url, params, key, chunk_size=64 * 1024):
+        """Streaming get request. Yields the items of an array in the JSON response one at a time
+            as the response is downloaded, instead of loading the whole response into memory.
+            An asynchronous generator, use it with ``async for``.
+
+        :param url: Url of the API endpoint
+        :param params: List of parameters to be sent
+        :param key: The key of the array in the JSON response, e.g. 'incidents'
+        :param chunk_size: Number of bytes read from the response at a time
+        :return: Asynchronous generator of JSON data, one item of the array at a time
+        """
+        query = {'auth_token': self.api_key}
+        query.update(self._clean_params(params))
+
+        logging_enabled = self.logging_enabled()
+        if logging_enabled:
+            self.log('[{datetime}] GET (streamed) to {ROOT}{url}.json: {params}'.format(
+                datetime=datetime.now(self.tz), ROOT=self.root, url=url, params=params))
+
+        record = RequestRecord('GET', url)
+        resp = None
+        try:
+            resp, _ = await self._send('GET', url, record, logging_enabled, params=query, stream=True)
+
+            if logging_enabled:
+                self.log('[{datetime}] Received {response_code} in {:.2f}ms, streaming response'.format(
+                    record.network_time * 1000, datetime=datetime.now(self.tz), response_code=resp.status))
+
+            items = JSONArrayStream(None, key)
+            chunks = resp.content.iter_chunked(chunk_size)
+            while True:
+                start = time.time()
+                try:
+                    chunk = await chunks.__anext__()
+                except StopAsyncIteration:
+                    chunk = None
+                record.network_time += time.time() - start
+
+                start = time.time()
+                if chunk is None:
+                    items.close()
+                else:
+                    items.feed(chunk)
+                parsed = list(items.items())
+                record.decode_time += time.time() - start
+                record.bytes = items.bytes
+                for item in parsed:
+                    yield item
+                if chunk is None:
+                    break
+
+            if items.extra.get('result') == RESULT_ERROR:
+                self.handle_exception(items.extra)
+        except Exception as e:
+            record.error = type(e).__name__
+            raise
+        finally:
+            if resp is not None:
+                resp.release()
+            self.metrics.record(record)
+            for profile in list(self._profiles):
+                profile.record(record, sys._getframe())
+
+    async def _fetch(self, method, url, record, logging_enabled, params=None, data=None):
+        """Send a request and decode its JSON response
+
+        :param method: The HTTP method
+        :param url: Url of the API endpoint
+        :param record: The :class:`RequestRecord <RequestRecord>` of the call
+        :param logging_enabled: Log the response
+        :param params: Query string parameters, including the auth token
+        :param data: Form data
+        :return: The JSON data
+        """
+        resp, body = await self._send(method, url, record, logging_enabled, params=params, data=data)
+        record.bytes = len(body)
+
+        if logging_enabled:
+            self.log(
+                '[{datetime}] Received {response_code} in {:.2f}ms: '.format(
+                    record.network_time * 1000, datetime=datetime.now(self.tz), response_code=resp.status),
+                data=lambda: body.decode('utf-8', 'replace'))
+
+        start = time.time()
+        try:
+            response = json.loads(body.decode('utf-8'))
+        except ValueError:
+            # e.g. an error page from a proxy in front of the console
+            raise ConsoleError('The console returned a response that is not JSON (HTTP {status})'.format(
+                status=resp.status))
+        record.decode_time = time.time() - start
+        return response
+
+    async def _coalesced_fetch(self, url, record, logging_enabled, params):
+        """Send a GET request, or wait for the response of an identical request already in flight
+
+        :param url: Url of the API endpoint
+        :param record: The :class:`RequestRecord <RequestRecord>` of the call
+        :param logging_enabled: Log the response
+        :param params: Query string parameters, including the auth token
+        :return: The JSON data
+        """
+        key = self.coalescer.key(url, params)
+        future = self._in_flight.get(key)
+        if future is not None:
+            try:
+                # shielded, so a caller giving up doesn't cancel the request the others wait for
+                response = await asyncio.shield(future)
+            except asyncio.CancelledError:
+                if not future.cancelled():
+                    raise
+                # the caller that sent the request gave up on it, send our own
+            except Exception as e:
+                raise copy.copy(e)
+            else:
+                record.coalesced = True
+                if logging_enabled:
+                    self.log('[{datetime}] Shared the response of an identical request in flight'.format(
+                        datetime=datetime.now(self.tz)))
+                return response
+            return await self._fetch('GET', url, record, logging_enabled, params=params)
+
+        future = self._in_flight[key] = asyncio.get_event_loop().create_future()
+        try:
+            response = await self._fetch('GET', url, record, logging_enabled, params=params)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # retrieved, so an error nobody else waited for isn't reported as never retrieved
+            future.exception()
+            raise
+        else:
+            future.set_result(response)
+            return response
+        finally:
+            if self._in_flight.get(key) is future:
+                del self._in_flight[key]
+
+    async def _send(self, method, url, record, logging_enabled, **kwargs):
+        """Send a request, waiting for the rate limiter and retrying failed attempts as the retry policy allows
+
+        :param method: The HTTP method
+        :param url: Url of the API endpoint
+        :param record: The :class:`RequestRecord <RequestRecord>` of the call
+        :param logging_enabled: Log retries
+        :param kwargs: Extra arguments of the request, e.g. ``params``. With ``stream=True`` the body isn't
+            read, and the caller releases the response
+        :return: The last response and its body, ``None`` when streamed
+        """
+        retry = self.retry
+        stream = kwargs.pop('stream', False)
+        hedge = self.hedge if self.hedge is not None and self.hedge.applies(method, url) and not stream else None
+        attempt = 0
+        while True:
+            if self.rate_limiter is not None:
+                wait = self.rate_limiter.reserve()
+                if wait > 0:
+                    await asyncio.sleep(wait)
+                    record.wait_time += wait
+
+            start = time.time()
+            try:
+                if stream:
+                    resp, body = await self._get_session().request(
+                        method, "{0}{1}".format(self.root, url), **kwargs), None
+                elif hedge is not None:
+                    resp, body = await self._hedged_read(hedge, method, url, record, kwargs)
+                else:
+                    resp, body = await self._read(method, url, kwargs)
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                record.network_time += time.time() - start
+                wait = None
+                if retry is not None and retry.should_retry(method, attempt, error=e):
+                    wait = retry.delay(attempt)
+                if wait is None:
+                    if isinstance(e, asyncio.TimeoutError):
+                        self.throw_timeout_error()
+                    self.throw_connection_error()
+                reason = type(e).__name__
+            else:
+                record.network_time += time.time() - start
+                record.status_code = resp.status
+                wait = None
+                if retry is not None and retry.should_retry(method, attempt, status_code=resp.status):
+                    wait = retry.delay(attempt, resp.headers.get('Retry-After'))
+                if wait is None:
+                    return resp, body
+                if stream:
+                    resp.release()
+                reason = 'HTTP {status}'.format(status=resp.status)
+
+            if logging_enabled:
+                self.log('[{datetime}] {reason}, retrying {method} to {url} in {wait:.2f}s'.format(
+                    datetime=datetime.now(self.tz), reason=reason, method=method, url=url, wait=wait))
+            await asyncio.sleep(wait)
+            record.wait_time += wait
+            attempt += 1
+            record.retries = attempt
+
+    async def _read(self, method, url, kwargs):
+        """Send a request and read its response
+
+        :param method: The HTTP method
+        :param url: Url of the API endpoint
+        :param kwargs: Extra arguments of the request, e.g. ``params``
+        :return: The response and its body
+        """
+        async with self._get_session().request(method, "{0}{1}".format(self.root, url), **kwargs) as resp:
+            body = await resp.read()
+        return resp, body
+
+    async def _hedged_read(self, hedge, method, url, record, kwargs):
+        """Send a request, and a second copy of it if the first is slow to answer. The slower one is cancelled
+
+        :param hedge: The :class:`HedgePolicy <HedgePolicy>`
+        :param method: The HTTP method
+        :param url: Url of the API endpoint
+        :param record: The :class:`RequestRecord <RequestRecord>` of the call, updated if the request was hedged
+        :param kwargs: Extra arguments of the request, e.g. ``params``
+        :return: The first response and its body
+        """
+        hedge.earn()
+        delay = hedge.hedge_delay(self.metrics, url)
+        if delay is None:
+            return await self._read(method, url, kwargs)
+
+        first = asyncio.ensure_future(self._read(method, url, kwargs))
+        second = None
+        try:
+            done, _ = await asyncio.wait([first], timeout=delay)
+            if done or not hedge.spend():
+                return await first
+
+            record.hedged = True
+            second = asyncio.ensure_future(self._read(method, url, kwargs))
+            pending = set([first, second])
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in (first, second):
+                    if task in done and task.exception() is None:
+                        record.hedge_won = task is second
+                        return task.result()
+            # both failed, retrieve the second's error so it isn't reported as never retrieved
+            second.exception()
+            return first.result()
+        finally:
+            for task in (first, second):
+                if task is not None and not task.done():
+                    task.cancel()
+
+    def _clean_params(self, params):
+        """Drop unset parameters and convert values to strings, as ``requests`` does
+
+        :param params: Dictionary of parameters
+        :return: Dictionary of parameters aiohttp can encode
+        """
+        return dict((key, str(value)) for key, value in (params or {}).items() if value is not None)
+
+
+class AsyncDevices(Devices):
+    """Awaitable version of :class:`Devices <Devices>`. ``all``, ``live``, ``dead`` and ``get_device``
+        fetch the unacknowledged incidents once the devices are in, if any device has some, so
+        ``Device.unacknowleged_incidents`` never needs a request of its own.
+    """
+
+    async def all(self):
+        """Get all registered devices
+
+        :return: List of all devices
+        :rtype: List of :class:`Device <Device>` objects
+        """
+        return await self._list('devices/all')
+
+    async def live(self):
+        """Get all registered connected devices
+
+        :return: List of live devices
+        :rtype: List of :class:`Device <Device>` objects
+        """
+        return await self._list('devices/live')
+
+    async def dead(self):
+        """Get all registered disconnected devices
+
+        :return: List of dead devices
+        :rtype: List of :class:`Device <Device>` objects
+        """
+        return await self._list('devices/dead')
+
+    async def _list(self, url):
+        params = {'tz': self.console.tz}
+        return await self._parse_with_index(await self.console.get(url, params, _raw))
+
+    async def _parse_with_index(self, data, node_id=None):
+        """Parse devices along with an index of their unacknowledged incidents. Model attributes aren't
+            awaitable, so the index is fetched up front, and only if a device has unacknowledged incidents
+
+        :param data: JSON data of a device or a device listing
+        :param node_id: Index the incidents of this node only
+        :return: Device object or a list of Device objects
+        """
+        devices = data.get('devices') or [data.get('device') or {}]
+        if any(device.get('unacknowleged_incidents') for device in devices):
+            index = await self.console.incidents.unacknowledged_index(node_id=node_id)
+        else:
+            index = IncidentIndex()
+        return self.parse(data, index=index)
+
+    async def get_device(self, node_id):
+        """Get information on a particular device
+
+        :param node_id: Get device with specific node id
+        :return: Device with all information
+        :rtype: A :class:`Device <Device>` object
+
+        :except DeviceNotFoundError: The device could not be found
+        """
+        params = {'node_id': node_id}
+        return await self._parse_with_index(await self.console.get('device/getinfo', params, _raw), node_id)
+
+    async def reboot(self, node_id):
+        """Reboot a device
+
+        :param node_id: The node_id of the device to be rebooted
+        :return: Result object
+        :rtype: :class:`Result <Result>` object
+
+        :except DeviceNotFoundError: The device could not be found
+        """
+        params = {'node_id': node_id}
+        return await self.console.post('device/reboot', params)
+
+    async def update(self, node_id, update_tag):
+        """Update a device
+
+        :param node_id: The node_id of the device to be updated
+        :param update_tag: The tag of the update
+        :return: Result object
+        :rtype: :class:`Result <Result>` object
+
+        :except UpdateError: Device update not permitted. Automatic updates are not configured. Or the update tag does
+            not exist.
+        :except DeviceNotFoundError: The device could not be found
+        """
+        params = {'node_id': node_id, 'update_tag': update_tag}
+        return await self.console.post('device/update', params)
+
+    async def list_databundles(self, node_id):
+        """Lists all DataBundles of a device
+
+        :param node_id: The node_id of the device
+        :return: List of DataBundle objects
+        :rtype: List of :class:`DataBundle <DataBundle>`
+        """
+        from .models.databundles import DataBundles
+
+        params = {'node_id': node_id}
+        return await self.console.get('bundles/list', params, DataBundles(self.console).parse)
+
+    async def refresh(self, device):
+        """Refresh a Device object by pulling all changes
+
+        :param device: The :class:`Device <Device>` to refresh
+
+        :except DeviceNotFoundError: The device could not be found
+        """
+        new_device = await self.get_device(device.node_id)
+        device._update(new_device)
+
+
+class AsyncIncidents(Incidents):
+    """Awaitable version of :class:`Incidents <Incidents>`"""
+
+    async def unacknowledged_index(self, node_id=None, event_limit=None, newer_than=None):
+        """Get an index of unacknowledged incidents, keyed by node id and incident id
+
+        :param node_id: Index unacknowledged incidents for a specific node only
+        :param event_limit: Specify the maximum number of event logs to be returned with the incident.
+        :param str newer_than: limit to incidents newer than a date like '2019-12-25-12:00:00' (UTC)
+        :return: An index of unacknowledged incidents
+        :rtype: :class:`IncidentIndex <IncidentIndex>` object
+        """
+        incidents = await self.unacknowledged(node_id=node_id, event_limit=event_limit, newer_than=newer_than)
+        return IncidentIndex(incidents=incidents)
+
+    async def sync(self, state_path, node_id=None, event_limit=None, overlap=300):
+        """Get incidents that are new or have changed since the last sync, as :meth:`Incidents.sync
+            <Incidents.sync>` does
+
+        :param state_path: Path of the file used to keep the sync state. Created if it doesn't exist, in
+            which case all incidents are returned
+        :param node_id: Sync incidents for a specific node only. Use a separate state file per node
+        :param event_limit: Specify the maximum number of event logs to be returned with the incident.
+        :param overlap: Seconds before the last sync's newest incident from which incidents are fetched
+            again, to allow for incidents that were updated around the time of the last sync
+        :return: List of new or changed Incident objects
+        :rtype: List of :class:`Incident <Incident>` objects
+        """
+        state = self._load_sync_state(state_path)
+        incidents = await self.all(node_id=node_id, event_limit=event_limit,
+                                   newer_than=self._sync_newer_than(state, overlap))
+        return self._sync_changes(state_path, state, incidents, overlap)
+
+    async def iter_all(self, node_id=None, event_limit=None, newer_than=None):
+        """Iterate over all incidents for this console as the response is downloaded. Use it with
+            ``async for``
+
+        :param node_id: Get all incidents for a specific node
+        :param event_limit: Specify the maximum number of event logs to be returned with the incident.
+        :param str newer_than: limit to incidents newer than a date like '2019-12-25-12:00:00' (UTC)
+        :return: Asynchronous generator of Incident objects
+        :rtype: Asynchronous generator of :class:`Incident <Incident>` objects
+        """
+        params = {'tz': self.console.tz, 'node_id': node_id, 'event_limit': event_limit, 'newer_than': newer_than}
+        async for incident in self.console.stream('incidents/all', params, 'incidents'):
+            yield self.parse_incident(incident)
+
+    async def iter_unacknowledged(self, node_id=None, event_limit=None, newer_than=None):
+        """Iterate over all unacknowledged incidents for this console as the response is downloaded. Use it
+            with ``async for``
+
+        :param node_id: Get all unacknowledged incidents for a specific node
+        :param event_limit: Specify the maximum number of event logs to be returned with the incident.
+        :param str newer_than: limit to incidents newer than a date like '2019-12-25-12:00:00' (UTC)
+        :return: Asynchronous generator of Incident objects
+        :rtype: Asynchronous generator of :class:`Incident <Incident>` objects
+        """
+        params = {'tz': self.console.tz, 'node_id': node_id, 'event_limit': event_limit, 'newer_than': newer_than}
+        async for incident in self.console.stream('incidents/unacknowledged', params, 'incidents'):
+            yield self.parse_incident(incident)
+
+    async def acknowledge_incident(self, incident_id):
+        """Mark a single incident as acknowledged
+
+        :param incident_id: The id of the Incident
+        :return: Result indicator of the API call
+        :rtype: :class:`Result <Result>` object
+        """
+        params = {'incident': incident_id}
+        return await self.console.post('incident/acknowledge', params)
+
+    async def unacknowledge_incident(self, incident_id):
+        """Mark a single incident as unacknowledged
+
+        :param incident_id: The id of the Incident
+        :return: Result indicator of the API call
+        :rtype: :class:`Result <Result>` object
+        """
+        params = {'incident': incident_id}
+        return await self.console.post('incident/unacknowledge', params)
+
+    async def delete_incident(self, incident_id):
+        """Delete a single acknowledged incident
+
+        :param incident_id: The id of the Incident
+        :return: Result indicator of the API call
+        :rtype: :class:`Result <Result>` object
+        """
+        params = {'incident': incident_id}
+        return await self.console.delete('incident/delete', params)
+
+    async def acknowledge_many(self, incidents, max_workers=8, refresh=False):
+        """Acknowledge a list of incidents, several at a time
+
+        :param incidents: List of incident ids or Incident objects
+        :param max_workers: Maximum number of requests made at the same time
+        :param refresh: Update the Incident objects passed in from a single listing of acknowledged
+            incidents once all calls are done. Otherwise only their ``acknowledged`` attribute is set
+        :return: Dictionary of :class:`Result <Result>` objects keyed by incident id
+        """
+        return await self._bulk(self.console.post, 'incident/acknowledge', incidents, max_workers,
+                                self.acknowledged if refresh else None, acknowledged=True)
+
+    async def unacknowledge_many(self, incidents, max_workers=8, refresh=False):
+        """Unacknowledge a list of incidents, several at a time
+
+        :param incidents: List of incident ids or Incident objects
+        :param max_workers: Maximum number of requests made at the same time
+        :param refresh: Update the Incident objects passed in from a single listing of unacknowledged
+            incidents once all calls are done. Otherwise only their ``acknowledged`` attribute is set
+        :return: Dictionary of :class:`Result <Result>` objects keyed by incident id
+        """
+        return await self._bulk(self.console.post, 'incident/unacknowledge', incidents, max_workers,
+                                self.unacknowledged if refresh else None, acknowledged=False)
+
+    async def delete_many(self, incidents, max_workers=8):
+        """Delete a list of acknowledged incidents, several at a time
+
+        :param incidents: List of incident ids or Incident objects
+        :param max_workers: Maximum number of requests made at the same time
+        :return: Dictionary of :class:`Result <Result>` objects keyed by incident id
+        """
+        return await self._bulk(self.console.delete, 'incident/delete', incidents, max_workers)
+
+    async def _bulk(self, request, url, incidents, max_workers, listing=None, acknowledged=None):
+        incidents = list(incidents)
+        incident_ids = [getattr(incident, 'id', incident) for incident in incidents]
+        semaphore = asyncio.Semaphore(max(1, max_workers))
+
+        async def call(incident_id):
+            async with semaphore:
+                try:
+                    return await request(url, {'incident': incident_id})
+                except Exception as e:
+                    return self._error_result(e)
+
+        results = dict(zip(incident_ids, await asyncio.gather(*[call(incident_id) for incident_id in incident_ids])))
+        params = self._listing_params(incidents) if listing is not None else None
+        if params is not None:
+            self._refresh_from(incidents, await listing(**params))
+        elif acknowledged is not None:
+            # model methods aren't awaitable, so the incidents can't refresh themselves when stale
+            self._acknowledged_locally(incidents, results, acknowledged, stale=False)
+        return results
+
+    async def refresh(self, incident):
+        """Refresh an Incident object by pulling all changes
+
+        :param incident: The :class:`Incident <Incident>` to refresh
+        """
+        new_incident = await self.get_incident(incident_id=incident.id)
+        incident._update(new_incident)
+
+
+class AsyncSettings(Settings):
+    """Awaitable version of :class:`Settings <Settings>`"""
+
+    async def is_ip_whitelisted(self, src_ip):
+        """Is IP address Whitelisted
+
+        :param src_ip: The IP address to be checked
+        :return: ``True`` if the IP address is whitelisted
+        :rtype: bool
+        """
+        params = {'src_ip': src_ip}
+        result = await self.console.get('settings/is_ip_whitelisted', params)
+        return bool(result.is_ip_whitelisted)
+
+
+class AsyncCanaryTokens(CanaryTokens):
+    """Awaitable version of :class:`CanaryTokens <CanaryTokens>`"""
+
+    async def create(self, memo, kind, web_image=None, cloned_web=None, mimetype=None):
+        """Create a new Canarytoken
+
+        :param memo: Use this to remind yourself where you placed the Canarytoken
+        :param kind: The type of Canarytoken
+        :param web_image: The path to an image file for use with web-image tokens.
+        :param cloned_web: Domain to be used in clonded-web tokens
+        :param mimetype: The type of image specified in web_image. e.g. 'image/png'
+        :return: A CanaryToken object
+        :rtype: :class:`CanaryToken <CanaryToken>` object
+
+        :except InvalidParameterError: One of the parameters was invalid
+        :except CanaryTokenError: Something went wrong while creating the CanaryToken
+        """
+        params = {'memo': memo, 'kind': kind, 'cloned_web': cloned_web}
+
+        if web_image:
+            if not mimetype:
+                raise InvalidParameterError("Mimetype cannot be null")
+
+            with open(web_image, 'rb') as f:
+                files = {'web_image': (os.path.basename(web_image), f, mimetype)}
+                return await self.console.post('canarytoken/create', params, self.parse, files)
+
+        return await self.console.post('canarytoken/create', params, self.parse)
+
+    async def update(self, canarytoken, memo):
+        """Update a Canarytoken memo
+
+        :param canarytoken: The key of the Canarytoken
+        :param memo: The new memo to be used
+        :return: A Result object
+        :rtype: :class:`Result <Result>` object
+        """
+        params = {'memo': memo, 'canarytoken': canarytoken}
+        return await self.console.post('canarytoken/update', params)
+
+    async def delete(self, canarytoken):
+        """Delete a Canarytoken
+
+        :param canarytoken: The key of the Canarytoken
+        :return: A Result object
+        :rtype: :class:`Result <Result>` object
+        """
+        params = {'canarytoken': canarytoken}
+        return await self.console.post('canarytoken/delete', params)
+
+    async def disable(self, canarytoken):
+        """Disable a Canarytoken
+
+        :param canarytoken: The key of the Canarytoken
+        :return: A Result object
+        :rtype: :class:`Result <Result>` object
+        """
+        params = {'canarytoken': canarytoken}
+        return await self.console.post('canarytoken/disable', params)
+
+    async def enable(self, canarytoken):
+        """Enable a Canarytoken
+
+        :param canarytoken: The key of the Canarytoken
+        :return: A Result object
+        :rtype: :class:`Result <Result>` object
+        """
+        params = {'canarytoken': canarytoken}
+        return await self.console.post('canarytoken/enable', params)
+
+
+class AsyncFlocks(Flocks):
+    """Awaitable version of :class:`Flocks <Flocks>`"""
+
+    async def create(self, name):
+        """Create a new Flock
+
+        :param name: Use this to give your Flock a human readable name
+        :return: The new Flock
+        :rtype: :class:`Flock <Flock>` object
+
+        :except FlockError: Something went wrong while creating the Flock
+        """
+        params = {'name': name}
+        data = await self.console.post('flock/create', params, _raw)
+        if data and 'flock_id' in data:
+            for flock in await self.all():
+                if flock.flock_id == data['flock_id']:
+                    return flock
+        return self.parse(data)
+
+    async def rename(self, flock_id, name):
+        """Rename a Flock
+
+        :param flock_id: Unique identifier for your Flock
+        :param name: The new name to be used
+        :return: A Result object
+        :rtype: :class:`Result <Result>` object
+        """
+        params = {'name': name, 'flock_id': flock_id}
+        return await self.console.post('flock/rename', params)
+
+    async def delete(self, flock_id):
+        """Delete a Flock
+
+        :param flock_id: Unique identifier for your Flock
+        :return: A Result object
+        :rtype: :class:`Result <Result>` object
+        """
+        params = {'flock_id': flock_id}
+        return await self.console.post('flock/delete', params)
+
+
+class AsyncUpdates(Updates):
+    """Awaitable version of :class:`Updates <Updates>`"""
@@ -0,0 +1,153 @@
+import threading
+import time
+
+from collections import OrderedDict
+
+# seconds a response stays fresh, per read endpoint
+DEFAULT_TTLS = {
+    'flocks/list': 300,
+    'updates/list': 300,
+    'devices/all': 30,
+    'canarytokens/fetch': 60,
+    'device/getinfo': 30,
+}
+
+# read endpoints made stale by a mutating endpoint
+DEFAULT_INVALIDATIONS = {
+    'flock/create': ['flocks/list'],
+    'flock/rename': ['flocks/list'],
+    'flock/delete': ['flocks/list'],
+    'device/reboot': ['devices/all', 'device/getinfo'],
+    'device/update': ['devices/all', 'device/getinfo', 'updates/list'],
+    'canarytoken/create': ['canarytokens/fetch'],
+    'canarytoken/update': ['canarytokens/fetch'],
+    'canarytoken/delete': ['canarytokens/fetch'],
+    'canarytoken/enable': ['canarytokens/fetch'],
+    'canarytoken/disable': ['canarytokens/fetch'],
+    # devices carry their unacknowledged incidents
+    'incident/acknowledge': ['devices/all', 'device/getinfo'],
+    'incident/unacknowledge': ['devices/all', 'device/getinfo'],
+    'incident/delete': ['devices/all', 'device/getinfo'],
+    'incidents/acknowledge': ['devices/all', 'device/getinfo'],
+    'incidents/unacknowledge': ['devices/all', 'device/getinfo'],
+    'incidents/delete': ['devices/all', 'device/getinfo'],
+}
+
+
+class ResponseCache(object):
+    def __init__(self, maxsize=256, ttls=None, invalidations=None):
+        """In-memory LRU cache of read endpoint responses, each endpoint with its own TTL.
+            Responses are stored as raw bodies, so every hit builds fresh objects. A cache can be shared by
+            consoles, each only sees the responses read with its own domain and API key.
+
+        :param maxsize: Maximum number of responses kept. The least recently used is evicted first
+        :param ttls: Dictionary of TTLs in seconds keyed by endpoint. Only these endpoints are cached.
+            Defaults to ``DEFAULT_TTLS``
+        :param invalidations: Dictionary of endpoint lists keyed by mutating endpoint. A request to the
+            mutating endpoint drops every cached response of the listed endpoints.
+            Defaults to ``DEFAULT_INVALIDATIONS``
+
+        Usage::
+
+            >>> import canarytools
+            >>> cache = canarytools.ResponseCache(ttls={'flocks/list': 600, 'devices/all': 10})
+            >>> console = canarytools.Console(cache=cache)
+        """
+        self.maxsize = maxsize
+        self.ttls = dict(DEFAULT_TTLS if ttls is None else ttls)
+        self.invalidations = dict(DEFAULT_INVALIDATIONS if invalidations is None else invalidations)
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state['_lock']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def cacheable(self, url):
+        """Is this endpoint cached?
+
+        :param url: Url of the API endpoint
+        :return: ``True`` if responses of the endpoint are cached
+        """
+        return url in self.ttls
+
+    def key(self, url, params, scope=None):
+        """Cache key of a request
+
+        :param url: Url of the API endpoint
+        :param params: Request parameters
+        :param scope: What else the response depends on, e.g. the console and API key it was read with,
+            so consoles sharing a cache never see each other's responses
+        :return: A hashable key
+        """
+        params = params or {}
+        return url, scope, tuple(sorted((key, str(value)) for key, value in params.items() if value is not None))
+
+    def get(self, url, params, scope=None):
+        """Get a cached response body
+
+        :param url: Url of the API endpoint
+        :param params: Request parameters
+        :param scope: The scope of the response, see :meth:`key`
+        :return: The response body, ``None`` if it isn't cached or has expired
+        """
+        key = self.key(url, params, scope)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires, body = entry
+            if expires < time.time():
+                del self._entries[key]
+                return None
+            # mark as most recently used
+            del self._entries[key]
+            self._entries[key] = entry
+            return body
+
+    def set(self, url, params, body, scope=None):
+        """Cache a response body
+
+        :param url: Url of the API endpoint
+        :param params: Request parameters
+        :param body: The raw response body
+        :param scope: The scope of the response, see :meth:`key`
+        """
+        if not self.cacheable(url):
+            return
+        key = self.key(url, params, scope)
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = (time.time() + self.ttls[url], body)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, url, scope=None):
+        """Drop cached responses made stale by a request
+
+        :param url: Url of the API endpoint that was called. Mutating endpoints drop the responses
+            of the endpoints they affect; read endpoints drop their own responses
+        :param scope: Only drop the responses of this scope, see :meth:`key`. All scopes by default
+        """
+        endpoints = set(self.invalidations.get(url, ()))
+        if url in self.ttls:
+            endpoints.add(url)
+        if not endpoints:
+            return
+        with self._lock:
+            for key in [key for key in self._entries
+                        if key[0] in endpoints and (scope is None or key[1] == scope)]:
+                del self._entries[key]
+
+    def clear(self):
+        """Drop all cached responses"""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
@@ -0,0 +1,80 @@
+import copy
+import threading
+
+
+class _Call(object):
+    def __init__(self):
+        """A request in flight, and what it returned or raised once done"""
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class RequestCoalescer(object):
+    def __init__(self):
+        """Shares a request between callers making the same GET request at the same time ("single flight").
+            The first caller sends the request and the others wait for its response instead of sending their
+            own, e.g. when many threads hydrate the same device at once. Each caller builds its own objects
+            from the shared response.
+        """
+        self._calls = dict()
+        self._lock = threading.Lock()
+
+    def __getstate__(self):
+        # requests in flight stay with the process that sent them
+        return dict()
+
+    def __setstate__(self, state):
+        self._calls = dict()
+        self._lock = threading.Lock()
+
+    def key(self, url, params):
+        """Key of a request. Requests with the same key share one response
+
+        :param url: Url of the API endpoint
+        :param params: Request parameters
+        :return: A hashable key
+        """
+        params = params or {}
+        return url, tuple(sorted((key, str(value)) for key, value in params.items() if value is not None))
+
+    def call(self, key, fn):
+        """Call a function, or wait for the call of another caller with the same key already in flight
+
+        :param key: The request's key
+        :param fn: Function sending the request
+        :return: Tuple of what the function returned, and whether it was shared with another caller's call
+        :except Exception: Whatever the function raised. Callers waiting on another's call raise a copy
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                # a copy, so threads don't share one exception and its traceback
+                raise copy.copy(call.error)
+            return call.result, True
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            # e.g. KeyboardInterrupt, so the waiters don't take the missing result for a response
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                if self._calls.get(key) is call:
+                    del self._calls[key]
+            call.done.set()
+        return call.result, False
+
+    def invalidate(self):
+        """Stop sharing the requests in flight, e.g. once a change is made. Requests started later send
+            their own request rather than waiting for a response that may predate the change
+        """
+        with self._lock:
+            self._calls = dict()
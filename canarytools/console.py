@@ -1,6 +1,6 @@
-import requests
 import pytz
 import os
+import json
 import logging
 import sys
 import time
@@ -21,10 +21,18 @@ from .models.canarytokens import CanaryTokens
 from .models.flocks import Flocks
 from .models.result import Result
 from .models.update import Updates
+from .metrics import ConsoleStats, Profile, RequestRecord
+from .cache import ResponseCache
+from .coalesce import RequestCoalescer
+from .hedge import HedgePolicy
+from .ratelimit import RateLimiter
+from .retry import RetryPolicy
+from .transport import RequestsTransport
+from .jsonstream import JSONArrayStream
 
 from .exceptions import ConfigurationError, ConsoleError, InvalidAuthTokenError, \
-    ConnectionError, DeviceNotFoundError, IncidentNotFoundError, InvalidParameterError, \
-    UpdateError, CanaryTokenError, FlockError
+    ConnectionError, RequestTimeoutError, DeviceNotFoundError, IncidentNotFoundError, \
+    InvalidParameterError, UpdateError, CanaryTokenError, FlockError
 
 ROOT = 'https://{0}.canary.tools/api/v1/'
 
@@ -37,7 +45,9 @@ logger.addHandler(logging.StreamHandler(sys.stderr))
 
 
 class Console(object):
-    def __init__(self, domain=None, api_key=None, timezone=pytz.utc, debug=False, debug_level=logging.DEBUG):
+    def __init__(self, domain=None, api_key=None, timezone=pytz.utc, debug=False, debug_level=logging.DEBUG,
+                 base_url=None, metrics_callback=None, cache=None, compact_models=False, lazy_timestamps=False,
+                 retry=None, rate_limit=None, transport=None, thread_safe=False, coalesce=False, hedge=None):
         """Initialize Console object. All API calls are made with this object
 
         :param domain: The domain of the Canary console
@@ -48,8 +58,42 @@ class Console(object):
         :param debug_level: Debug level. ``logging`` debug level used. ``logging.DEBUG`` will display all
             requests and responses as well as response data. ``logging.INFO`` will only log the requests and responses.
             The default is ``logging.DEBUG``
-
-        :except ConfigurationError: Domain and/or API auth token not set
+        :param base_url: The root url of the console's API. Defaults to ``https://<domain>.canary.tools/api/v1/``
+        :param metrics_callback: Function called with a :class:`RequestRecord <RequestRecord>` after every API call.
+            See :meth:`stats`
+        :param cache: Cache responses of read endpoints that rarely change. ``True`` uses a
+            :class:`ResponseCache <ResponseCache>` with the default TTLs, or pass a configured ``ResponseCache``.
+            Cached responses are dropped when a related endpoint is posted to
+        :param compact_models: Build incidents and events as compact objects, which keep their known fields in
+            ``__slots__`` rather than a per-object ``__dict__``. They behave like regular objects. On Python 3.11
+            a compact event takes about 40% of the memory of a regular one, and a compact incident about 85%. The
+            events' JSON data is kept as it is in ``incident.events.raw``, and is usually most of the memory held
+            for a listing, so the saving shows when the events are built
+        :param lazy_timestamps: Parse the timestamps of devices, incidents and events the first time they're
+            accessed rather than when the objects are built. Speeds up listings whose timestamps are mostly unused
+        :param retry: Retry requests that fail with a connection error or a transient status such as 429 or 503,
+            waiting between attempts. ``True`` uses a :class:`RetryPolicy <RetryPolicy>` with the defaults, or pass
+            a configured ``RetryPolicy``. By default each request is sent once
+        :param rate_limit: Limit how fast requests are sent. Either the number of requests per second, or a
+            :class:`RateLimiter <RateLimiter>`, which may be shared between consoles using the same API key
+        :param transport: The :class:`Transport <Transport>` sending the HTTP requests. Defaults to a
+            :class:`RequestsTransport <RequestsTransport>`; pass a configured one to tune connection pooling
+            and timeouts
+        :param thread_safe: Make the console safe to share between threads, e.g. the workers of a
+            ``ThreadPoolExecutor``. Each thread gets its own ``requests`` session from a shared pool of
+            connections, and the console's configuration can't be changed once it's created. A transport
+            passed in must be thread-safe too
+        :param coalesce: Share one request between identical GET requests (same endpoint and parameters) made at
+            the same time, e.g. by threads hydrating the same device. The callers waiting on another's request
+            each build their own objects from its response. Shared requests are counted in :meth:`stats`
+        :param hedge: Send a second copy of a slow GET request and use whichever response arrives first. ``True``
+            uses a :class:`HedgePolicy <HedgePolicy>` with the defaults, or pass a configured ``HedgePolicy``,
+            which may be shared between consoles to cap their extra requests together. Posts and deletes are
+            never hedged. Hedged requests are sent from several threads, so the transport must be thread-safe;
+            the default one gets a session per thread
+
+        :except ConfigurationError: Domain and/or API auth token not set, or ``thread_safe`` or ``hedge`` is set
+            and the transport isn't thread-safe
 
         Usage::
 
@@ -59,6 +103,10 @@ class Console(object):
               >>> import canarytools
               >>> import logging
               >>> console = canarytools.Console(debug=True)
+
+              >>> console = canarytools.Console(thread_safe=True)
+              >>> with ThreadPoolExecutor(max_workers=16) as executor:
+              >>>     devices = list(executor.map(console.devices.get_device, node_ids))
         """
         if domain is None and api_key is None:
             if 'CANARY_API_DOMAIN' in os.environ and 'CANARY_API_TOKEN' in os.environ:
@@ -79,14 +127,84 @@ class Console(object):
         self.domain = domain
         self.api_key = api_key
 
-        global ROOT
-        ROOT = ROOT.format(self.domain)
+        # kept per instance so consoles for different domains can be used side by side
+        self.root = base_url or ROOT.format(self.domain)
+        if not self.root.endswith('/'):
+            self.root += '/'
 
         self.tz = timezone
+        self.compact_models = compact_models
+        self.lazy_timestamps = lazy_timestamps
+
+        self.metrics = ConsoleStats(callback=metrics_callback)
+        self._profiles = []
+
+        if cache is True:
+            cache = ResponseCache()
+        elif cache is False:
+            cache = None
+        self.cache = cache
+        # responses depend on the console and the API key's permissions, a shared cache keeps them apart
+        self._cache_scope = (self.root, self.api_key)
+
+        if retry is True:
+            retry = RetryPolicy()
+        elif retry is False:
+            retry = None
+        self.retry = retry
+
+        if rate_limit is not None and not isinstance(rate_limit, RateLimiter):
+            rate_limit = RateLimiter(rate_limit)
+        self.rate_limiter = rate_limit
+
+        self.coalescer = RequestCoalescer() if coalesce else None
+
+        if hedge is True:
+            hedge = HedgePolicy()
+        elif hedge is False:
+            hedge = None
+        self.hedge = hedge
+
+        self.thread_safe = thread_safe
+        self.transport = transport if transport is not None else self._create_transport()
+        if self.transport is not None and not self.transport.thread_safe:
+            if thread_safe:
+                raise ConfigurationError("The transport of a thread-safe Console must be thread-safe, "
+                                         "e.g. RequestsTransport(per_thread=True).")
+            if self.hedge is not None:
+                raise ConfigurationError("Hedged requests are sent from several threads, the transport must be "
+                                         "thread-safe, e.g. RequestsTransport(per_thread=True).")
+        self._create_managers()
+        self._frozen = thread_safe
+
+    def __setattr__(self, key, value):
+        # the configuration of a thread-safe console is read by every thread, so it's fixed once created
+        if not key.startswith('_') and getattr(self, '_frozen', False):
+            raise AttributeError("Can't change '{key}' of a thread-safe Console".format(key=key))
+        super(Console, self).__setattr__(key, value)
+
+    def __delattr__(self, key):
+        if not key.startswith('_') and getattr(self, '_frozen', False):
+            raise AttributeError("Can't change '{key}' of a thread-safe Console".format(key=key))
+        super(Console, self).__delattr__(key)
+
+    @property
+    def session(self):
+        """The ``requests`` session the transport sends requests with, e.g. to set proxies or headers.
+            ``None`` if the transport doesn't use one. With a session per thread, it's the calling thread's
+        """
+        return getattr(self.transport, 'session', None)
+
+    def _create_transport(self):
+        """Create the transport used to send requests
 
-        self.session = requests.session()
-        self.session.params = {'auth_token': api_key}
+        :return: A :class:`RequestsTransport <RequestsTransport>`, with a session per thread for a
+            thread-safe console or when requests are hedged
+        """
+        return RequestsTransport(per_thread=self.thread_safe or self.hedge is not None)
 
+    def _create_managers(self):
+        """Create the interfaces used to access the API endpoints"""
         self.devices = Devices(self)
         self.incidents = Incidents(self)
         self.settings = Settings(self)
@@ -125,18 +243,7 @@ class Console(object):
         :param files: Files to be uploaded
         :return: Object(s) or a Result Indicator Object
         """
-        try:
-            self.log('[{datetime}] POST to {ROOT}{url}.json: {params}'.format(
-                datetime=datetime.now(self.tz), ROOT=ROOT, url=url, params=params))
-            start = time.time()
-            r = self.session.post(url="{0}{1}".format(ROOT, url), data=params, files=files)
-            complete = time.time() - start
-            self.log(
-                '[{datetime}] Received {response_code} in {:.2f}ms: '.format(
-                    complete * 1000, datetime=datetime.now(self.tz), response_code=r.status_code), data=r.text)
-        except requests.exceptions.ConnectionError:
-            self.throw_connection_error()
-        return self.handle_response(r.json(), parser)
+        return self._request('POST', url, parser, data=params, files=files)
 
     def get(self, url, params, parser=None):
         """Get request
@@ -146,18 +253,7 @@ class Console(object):
         :param parser: The function used to parse JSON data into an specific object
         :return: Object(s) or a Result Indicator Object
         """
-        try:
-            self.log('[{datetime}] GET to {ROOT}{url}.json: {params}'.format(
-                datetime=datetime.now(self.tz), ROOT=ROOT, url=url, params=params))
-            start = time.time()
-            resp = self.session.get(url="{0}{1}".format(ROOT, url), params=params)
-            complete = time.time() - start
-            self.log(
-                '[{datetime}] Received {response_code} in {:.2f}ms: '.format(
-                    complete * 1000, datetime=datetime.now(self.tz), response_code=resp.status_code), data=resp.text)
-        except requests.exceptions.ConnectionError:
-            self.throw_connection_error()
-        return self.handle_response(resp.json(), parser)
+        return self._request('GET', url, parser, params=params)
 
     def delete(self, url, params, parser=None):
         """Delete request
@@ -167,24 +263,294 @@ class Console(object):
         :param parser: The function used to parse JSON data into an specific object
         :return: Object(s) or a Result Indicator Object
         """
+        return self._request('DELETE', url, parser, params=params)
+
+    def _request(self, method, url, parser, params=None, data=None, files=None):
+        """Make a request and handle the response
+
+        :param method: The HTTP method
+        :param url: Url of the API endpoint
+        :param parser: The function used to parse JSON data into an specific object
+        :param params: Query string parameters
+        :param data: Form data
+        :param files: Files to be uploaded
+        :return: Object(s) or a Result Indicator Object
+        """
+        logging_enabled = self.logging_enabled()
+        if logging_enabled:
+            self.log('[{datetime}] {method} to {ROOT}{url}.json: {params}'.format(
+                datetime=datetime.now(self.tz), method=method, ROOT=self.root, url=url,
+                params=params if data is None else data))
+
+        cache = self.cache
+        if cache is not None and method != 'GET':
+            cache.invalidate(url, self._cache_scope)
+        elif cache is not None and not cache.cacheable(url):
+            cache = None
+
+        record = RequestRecord(method, url)
         try:
-            self.log('[{datetime}] DELETE to {ROOT}{url}.json: {params}'.format(
-                datetime=datetime.now(self.tz), ROOT=ROOT, url=url, params=params))
+            body = cache.get(url, params, self._cache_scope) if cache is not None else None
+            if body is not None:
+                record.cached = True
+                if logging_enabled:
+                    self.log('[{datetime}] Served from cache: '.format(datetime=datetime.now(self.tz)),
+                             data=lambda: body.decode('utf-8', 'replace'))
+
+                start = time.time()
+                response = json.loads(body.decode('utf-8'))
+                record.decode_time = time.time() - start
+            elif self.coalescer is not None and method == 'GET':
+                response, shared = self.coalescer.call(
+                    self.coalescer.key(url, params),
+                    lambda: self._fetch(method, url, record, logging_enabled, cache, params=params))
+                if shared:
+                    record.coalesced = True
+                    if logging_enabled:
+                        self.log('[{datetime}] Shared the response of an identical request in flight'.format(
+                            datetime=datetime.now(self.tz)))
+            else:
+                response = self._fetch(method, url, record, logging_enabled, cache, params=params, data=data,
+                                       files=files)
+
             start = time.time()
-            r = self.session.delete(url="{0}{1}".format(ROOT, url), params=params)
-            complete = time.time() - start
+            result = self.handle_response(response, parser)
+            record.build_time = time.time() - start
+            return result
+        except Exception as e:
+            record.error = type(e).__name__
+            raise
+        finally:
+            if cache is not None and method != 'GET':
+                # drop anything read while the change was being made
+                cache.invalidate(url, self._cache_scope)
+            if self.coalescer is not None and method != 'GET':
+                # later reads don't wait for a response from before the change
+                self.coalescer.invalidate()
+            self.metrics.record(record)
+            for profile in list(self._profiles):
+                profile.record(record, sys._getframe())
+
+    def _fetch(self, method, url, record, logging_enabled, cache, params=None, data=None, files=None):
+        """Send a request and decode its JSON response, caching it if the endpoint is cached
+
+        :param method: The HTTP method
+        :param url: Url of the API endpoint
+        :param record: The :class:`RequestRecord <RequestRecord>` of the call
+        :param logging_enabled: Log the response
+        :param cache: The :class:`ResponseCache <ResponseCache>` of the endpoint, ``None`` if it isn't cached
+        :param params: Query string parameters
+        :param data: Form data
+        :param files: Files to be uploaded
+        :return: The JSON data
+        """
+        r = self._send(method, url, record, logging_enabled, params=params, data=data, files=files)
+        record.bytes = len(r.content)
+
+        if logging_enabled:
             self.log(
                 '[{datetime}] Received {response_code} in {:.2f}ms: '.format(
-                    complete * 1000, datetime=datetime.now(self.tz), response_code=r.status_code), data=r.text)
-        except requests.exceptions.ConnectionError:
-            self.throw_connection_error()
-        return self.handle_response(r.json(), parser)
+                    record.network_time * 1000, datetime=datetime.now(self.tz), response_code=r.status_code),
+                data=lambda: r.text)
+
+        start = time.time()
+        try:
+            response = r.json()
+        except ValueError:
+            # e.g. an error page from a proxy in front of the console
+            raise ConsoleError('The console returned a response that is not JSON (HTTP {status})'.format(
+                status=r.status_code))
+        record.decode_time = time.time() - start
+
+        if cache is not None and r.status_code == 200 and response.get('result') != RESULT_ERROR:
+            cache.set(url, params, r.content, self._cache_scope)
+        return response
+
+    def _send(self, method, url, record, logging_enabled, **kwargs):
+        """Send a request, waiting for the rate limiter and retrying failed attempts as the retry policy allows
+
+        :param method: The HTTP method
+        :param url: Url of the API endpoint
+        :param record: The :class:`RequestRecord <RequestRecord>` of the call, updated with the network and
+            waiting times
+        :param logging_enabled: Log retries
+        :param kwargs: Extra arguments of the request, e.g. ``params``
+        :return: The last response
+        """
+        params = {'auth_token': self.api_key}
+        params.update(kwargs.get('params') or {})
+        kwargs['params'] = params
+
+        transport = self.transport
+        errors = transport.timeout_errors + transport.connection_errors
+        retry = self.retry
+        hedge = self.hedge
+        if hedge is not None and (kwargs.get('stream') or not hedge.applies(method, url)):
+            hedge = None
+        attempt = 0
+        while True:
+            if self.rate_limiter is not None:
+                record.wait_time += self.rate_limiter.acquire()
+
+            start = time.time()
+            try:
+                if hedge is not None:
+                    r = self._hedged_request(hedge, method, url, record, kwargs)
+                else:
+                    r = transport.request(method, "{0}{1}".format(self.root, url), **kwargs)
+            except errors as e:
+                record.network_time += time.time() - start
+                wait = None
+                if retry is not None and retry.should_retry(method, attempt, error=e):
+                    wait = retry.delay(attempt)
+                if wait is None:
+                    if isinstance(e, transport.timeout_errors):
+                        self.throw_timeout_error()
+                    self.throw_connection_error()
+                reason = type(e).__name__
+            else:
+                record.network_time += time.time() - start
+                record.status_code = r.status_code
+                wait = None
+                if retry is not None and retry.should_retry(method, attempt, status_code=r.status_code):
+                    wait = retry.delay(attempt, r.headers.get('Retry-After'))
+                if wait is None:
+                    return r
+                r.close()
+                reason = 'HTTP {status}'.format(status=r.status_code)
+
+            if logging_enabled:
+                self.log('[{datetime}] {reason}, retrying {method} to {url} in {wait:.2f}s'.format(
+                    datetime=datetime.now(self.tz), reason=reason, method=method, url=url, wait=wait))
+            time.sleep(wait)
+            record.wait_time += wait
+            attempt += 1
+            record.retries = attempt
+
+    def _hedged_request(self, hedge, method, url, record, kwargs):
+        """Send a request, and a second copy of it if the first is slow to answer
+
+        :param hedge: The :class:`HedgePolicy <HedgePolicy>`
+        :param method: The HTTP method
+        :param url: Url of the API endpoint
+        :param record: The :class:`RequestRecord <RequestRecord>` of the call, updated if the request was hedged
+        :param kwargs: Extra arguments of the request, e.g. ``params``
+        :return: The first response
+        """
+        full_url = "{0}{1}".format(self.root, url)
+        r, hedged, hedge_won = hedge.call(lambda: self.transport.request(method, full_url, **kwargs),
+                                          hedge.hedge_delay(self.metrics, url), discard=lambda r: r.close())
+        if hedged:
+            record.hedged = True
+            record.hedge_won = hedge_won
+        return r
+
+    def stream(self, url, params, key, chunk_size=64 * 1024):
+        """Streaming get request. Yields the items of an array in the JSON response one at a time
+            as the response is downloaded, instead of loading the whole response into memory.
+
+        :param url: Url of the API endpoint
+        :param params: List of parameters to be sent
+        :param key: The key of the array in the JSON response, e.g. 'incidents'
+        :param chunk_size: Number of bytes read from the response at a time
+        :return: Generator of JSON data, one item of the array at a time
+        """
+        logging_enabled = self.logging_enabled()
+        if logging_enabled:
+            self.log('[{datetime}] GET (streamed) to {ROOT}{url}.json: {params}'.format(
+                datetime=datetime.now(self.tz), ROOT=self.root, url=url, params=params))
+
+        record = RequestRecord('GET', url)
+        r = None
+        try:
+            r = self._send('GET', url, record, logging_enabled, params=params, stream=True)
+
+            if logging_enabled:
+                self.log('[{datetime}] Received {response_code} in {:.2f}ms, streaming response'.format(
+                    record.network_time * 1000, datetime=datetime.now(self.tz), response_code=r.status_code))
+
+            items = JSONArrayStream(r.iter_content(chunk_size=chunk_size), key)
+            iterator = iter(items)
+            while True:
+                start = time.time()
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    break
+                finally:
+                    record.decode_time += time.time() - start
+                    record.bytes = items.bytes
+                yield item
+
+            if items.extra.get('result') == RESULT_ERROR:
+                self.handle_exception(items.extra)
+        except Exception as e:
+            record.error = type(e).__name__
+            raise
+        finally:
+            if r is not None:
+                r.close()
+            self.metrics.record(record)
+            for profile in list(self._profiles):
+                profile.record(record, sys._getframe())
+
+    def stats(self):
+        """Request statistics for every endpoint called through this console
+
+        :return: Dictionary keyed by endpoint. Each entry has the request ``count``, ``cache_hits``, the
+            requests ``coalesced`` with an identical request and the ``coalescing_rate``, ``errors`` counted by
+            exception name, response ``bytes``, ``latency`` percentiles (``p50``, ``p95``,
+            ``p99``, ``max``) and the total ``network_time``, JSON ``decode_time`` and object ``build_time``,
+            all in seconds
+        :rtype: dict
+
+        Usage::
+
+            >>> import canarytools
+            >>> console = canarytools.Console()
+            >>> devices = console.devices.all()
+            >>> console.stats()['devices/all']['latency']['p95']
+            0.2213
+        """
+        return self.metrics.snapshot()
+
+    def profile(self):
+        """Profile the API calls made in a block of code. The block's time is split between the network,
+            decoding JSON, building objects and the block's own code, and the requests are attributed to the
+            client's method that made them, e.g. to show that a loop over devices triggers a request per device
+
+        :return: A :class:`Profile <canarytools.metrics.Profile>` object, used as a context manager
+        :rtype: Profile
+
+        Usage::
+
+            >>> import canarytools
+            >>> console = canarytools.Console()
+            >>> with console.profile() as p:
+            >>>     for device in console.devices.all():
+            >>>         print(device.settings, device.unacknowleged_incidents)
+            >>> print(p)
+            2.731s in 42 requests
+              network      2.406s   88.1%
+              decode       0.051s    1.9%
+              build        0.032s    1.2%
+              user         0.242s    8.9%
+              Device.__getattr__ x20: 20 requests (device/getinfo x20)
+              Device.unacknowleged_incidents x20: 20 requests (incidents/unacknowledged x20)
+              Devices.all x1: 1 requests (devices/all x1)
+        """
+        return Profile(self)
 
     def throw_connection_error(self):
         raise ConnectionError(
             "Failed to establish a new connection with console at domain: '{domain}'".format(
                 domain=self.domain))
 
+    def throw_timeout_error(self):
+        raise RequestTimeoutError(
+            "Timed out waiting for the console at domain: '{domain}'".format(
+                domain=self.domain))
+
     def read_config(self):
         """Read config from disk
 
@@ -230,57 +596,74 @@ class Console(object):
         if 'message' in response:
             message = response['message']
             if message in ERROR_MAP:
-                raise ERROR_MAP[message]
+                # a new exception each time, so threads raising the same error don't share its traceback
+                error, error_message = ERROR_MAP[message]
+                raise error() if error_message is None else error(error_message)
             elif 'Update with tag ' in message:
-                raise ERROR_MAP['Update with tag %s does not exist.'](message)
+                error, _ = ERROR_MAP['Update with tag %s does not exist.']
+                raise error(message)
             raise ConsoleError(message)
         raise ConsoleError()
 
+    def logging_enabled(self):
+        """Check whether requests are logged, so log messages are only built when needed
+
+        :return: ``True`` if debug logging is on and the logger accepts this level
+        """
+        return self.level in (logging.INFO, logging.DEBUG) and logger.isEnabledFor(self.level)
+
     def log(self, msg, data=None):
         """Log debug information based on level
+
+        :param msg: The message to log
+        :param data: The data payload, or a function returning it. Only materialised at ``logging.DEBUG``
         """
         if self.level == logging.INFO:
             log_msg = '{log_msg} Please set logging level to INFO, or greater, to see response data payload.'.format(
                 log_msg=msg)
             logger.info(log_msg)
-        elif self.level == logging.DEBUG:
+        elif self.level == logging.DEBUG and logger.isEnabledFor(logging.DEBUG):
+            if callable(data):
+                data = data()
             log_msg = '{log_msg} {data}'.format(log_msg=msg, data=data)
             logger.debug(log_msg)
 
     def __repr__(self):
         return '<Console %s>' % self.api_key
 
+# exception class and message raised for each error message of the console, ``None`` raises it without a message
 ERROR_MAP = {
-    'Invalid auth_token': InvalidAuthTokenError,
-    'Device not found': DeviceNotFoundError,
-    'Incident not found': IncidentNotFoundError,
+    'Invalid auth_token': (InvalidAuthTokenError, None),
+    'Device not found': (DeviceNotFoundError, None),
+    'Incident not found': (IncidentNotFoundError, None),
     'Settings does not permit updating this canary.':
-        UpdateError("Settings does not permit updating this canary. "
-                    "Check that automatic updates are not configured in the console."),
-    'Update with tag %s does not exist.': UpdateError,
+        (UpdateError, "Settings does not permit updating this canary. "
+                      "Check that automatic updates are not configured in the console."),
+    'Update with tag %s does not exist.': (UpdateError, None),
     'Parameter older_than was invalid.':
-        InvalidParameterError("Parameter older_than was invalid"),
+        (InvalidParameterError, "Parameter older_than was invalid"),
     'Cannot use src_host and node_id together':
-        InvalidParameterError("Cannot use src_host and node_id together"),
+        (InvalidParameterError, "Cannot use src_host and node_id together"),
     'Empty memo':
-        InvalidParameterError("Please specify a memo when creating a Canarytoken "
-                              "to remind yourself where you intend to use it :)"),
+        (InvalidParameterError, "Please specify a memo when creating a Canarytoken "
+                                "to remind yourself where you intend to use it :)"),
     'Supplied kind is not valid.':
-        InvalidParameterError("Supplied kind is not valid when creating a Canarytoken"),
+        (InvalidParameterError, "Supplied kind is not valid when creating a Canarytoken"),
     'Could not process the parameters':
-        InvalidParameterError("Error occurred while creating a Canarytoken. "
-                              "Please ensure all required parameters are present and in the correct format."),
+        (InvalidParameterError, "Error occurred while creating a Canarytoken. "
+                                "Please ensure all required parameters are present and in the correct format."),
     'Could not process the parameters. cloned_web is invalid, not enough domain labels':
-        InvalidParameterError("The parameter cloned_web is invalid, not enough domain labels"),
-    'Could not save Canarydrop': CanaryTokenError('Could not save Canarydrop'),
-    'Could not process the parameters': CanaryTokenError('Could not process the parameters'),
-    'Could not find the Canarytoken': CanaryTokenError('Could not find the Canarytoken'),
-    'Could not decode the memo': CanaryTokenError('Could not decode the memo'),
-    'Could not delete Canarydrop': CanaryTokenError('Could not delete Canarydrop'),
-    'File generation not supported.': CanaryTokenError('File generation not supported.'),
-    'Flock name cannot be empty.': FlockError('Flock name cannot be empty.'),
-    'Flock name longer than maximum (100 characters).': FlockError('Flock name longer than maximum (100 characters).'),
-    'Cannot delete a non-empty flock': FlockError('Cannot delete a non-empty flock'),
-    'Cannot delete default flock': FlockError('Cannot delete default flock'),
-    'Flock does not exist.': FlockError('Flock does not exist.')
+        (InvalidParameterError, "The parameter cloned_web is invalid, not enough domain labels"),
+    'Could not save Canarydrop': (CanaryTokenError, 'Could not save Canarydrop'),
+    'Could not process the parameters': (CanaryTokenError, 'Could not process the parameters'),
+    'Could not find the Canarytoken': (CanaryTokenError, 'Could not find the Canarytoken'),
+    'Could not decode the memo': (CanaryTokenError, 'Could not decode the memo'),
+    'Could not delete Canarydrop': (CanaryTokenError, 'Could not delete Canarydrop'),
+    'File generation not supported.': (CanaryTokenError, 'File generation not supported.'),
+    'Flock name cannot be empty.': (FlockError, 'Flock name cannot be empty.'),
+    'Flock name longer than maximum (100 characters).':
+        (FlockError, 'Flock name longer than maximum (100 characters).'),
+    'Cannot delete a non-empty flock': (FlockError, 'Cannot delete a non-empty flock'),
+    'Cannot delete default flock': (FlockError, 'Cannot delete default flock'),
+    'Flock does not exist.': (FlockError, 'Flock does not exist.')
 }
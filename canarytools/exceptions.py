@@ -29,6 +29,10 @@ class ConnectionError(ConsoleError):
     """Connection error occurred"""
 
 
+class RequestTimeoutError(ConnectionError):
+    """The console didn't respond in time"""
+
+
 class DeviceNotFoundError(ConsoleError):
     """Device could not be found"""
     """Invalid Authorization Token"""
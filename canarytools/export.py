@@ -0,0 +1,390 @@
+import csv
+import datetime
+import json
+import uuid
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import pyarrow
+    import pyarrow.dataset
+except ImportError:
+    pyarrow = None
+
+from .exceptions import ConfigurationError
+from .models.incidents import EPOCH, _epoch
+from .models.ports import PortSet
+
+# one row per incident
+INCIDENT_COLUMNS = ('id', 'node_id', 'summary', 'logtype', 'src_host', 'dst_host', 'dst_port', 'acknowledged',
+                    'created', 'updated')
+
+# one row per event, with the fields of its incident it doesn't carry itself
+EVENT_COLUMNS = ('incident_id', 'node_id', 'logtype', 'src_host', 'dst_host', 'dst_port', 'acknowledged',
+                 'timestamp')
+
+# columns that aren't strings. Times are epoch seconds
+INT_COLUMNS = ('dst_port', 'created', 'updated', 'timestamp')
+BOOL_COLUMNS = ('acknowledged',)
+
+# default CSV columns
+CSV_INCIDENT_FIELDS = ('id', 'summary', 'node_id', 'src_host', 'dst_host', 'dst_port', 'logtype', 'acknowledged',
+                       'created_std', 'updated_std')
+CSV_EVENT_FIELDS = ('incident_id', 'node_id', 'timestamp', 'logtype', 'src_host', 'src_port', 'dst_host', 'dst_port')
+
+# value of missing integers in NumPy arrays
+MISSING_INT = -1
+
+SECONDS_PER_DAY = 86400
+
+# file extension of each dataset format
+EXTENSIONS = {'parquet': 'parquet', 'ipc': 'arrow'}
+
+
+def incident_columns(incidents, as_numpy=False):
+    """Convert incidents to columns, one row per incident. The incidents aren't modified.
+
+    :param incidents: Iterable of Incident objects
+    :param as_numpy: Return NumPy arrays instead of lists. Requires ``numpy``
+    :return: Dictionary of columns keyed by name, see ``INCIDENT_COLUMNS``. ``created`` and ``updated``
+        are epoch seconds; missing values are ``None``, or ``MISSING_INT`` in integer NumPy arrays
+
+    Usage::
+
+        >>> import canarytools
+        >>> from canarytools.export import incident_columns
+        >>> columns = incident_columns(console.incidents.unacknowledged())
+        >>> columns['src_host'][:2]
+        ['10.0.0.2', '10.0.0.5']
+    """
+    columns = dict((name, list()) for name in INCIDENT_COLUMNS)
+    ids, node_ids, summaries, logtypes = columns['id'], columns['node_id'], columns['summary'], columns['logtype']
+    src_hosts, dst_hosts, dst_ports = columns['src_host'], columns['dst_host'], columns['dst_port']
+    acknowledged, created, updated = columns['acknowledged'], columns['created'], columns['updated']
+
+    for incident in incidents:
+        ids.append(getattr(incident, 'id', None))
+        node_ids.append(getattr(incident, 'node_id', None))
+        summaries.append(getattr(incident, 'summary', None))
+        logtypes.append(_str(getattr(incident, 'logtype', None)))
+        src_hosts.append(getattr(incident, 'src_host', None))
+        dst_hosts.append(getattr(incident, 'dst_host', None))
+        dst_ports.append(_int(getattr(incident, 'dst_port', None)))
+        acknowledged.append(bool(getattr(incident, 'acknowledged', False)))
+        created.append(_int(_epoch(getattr(incident, 'created_std', None))))
+        updated.append(_int(_epoch(getattr(incident, 'updated_std', None))))
+
+    if as_numpy:
+        return to_numpy(columns)
+    return columns
+
+
+def event_columns(incidents, as_numpy=False):
+    """Convert the events of incidents to columns, one row per event. Fields an event doesn't carry
+        itself are taken from its incident. The incidents and events aren't modified.
+
+    :param incidents: Iterable of Incident objects
+    :param as_numpy: Return NumPy arrays instead of lists. Requires ``numpy``
+    :return: Dictionary of columns keyed by name, see ``EVENT_COLUMNS``. ``timestamp`` is epoch
+        seconds; missing values are ``None``, or ``MISSING_INT`` in integer NumPy arrays
+
+    Usage::
+
+        >>> import canarytools
+        >>> from canarytools.export import event_columns
+        >>> columns = event_columns(console.incidents.unacknowledged(), as_numpy=True)
+        >>> (columns['dst_port'] == 22).sum()
+        1532
+    """
+    columns = dict((name, list()) for name in EVENT_COLUMNS)
+    incident_ids, node_ids, logtypes = columns['incident_id'], columns['node_id'], columns['logtype']
+    src_hosts, dst_hosts, dst_ports = columns['src_host'], columns['dst_host'], columns['dst_port']
+    acknowledged, timestamps = columns['acknowledged'], columns['timestamp']
+
+    for incident in incidents:
+        incident_id = getattr(incident, 'id', None)
+        node_id = getattr(incident, 'node_id', None)
+        logtype = _str(getattr(incident, 'logtype', None))
+        src_host = getattr(incident, 'src_host', None)
+        dst_host = getattr(incident, 'dst_host', None)
+        dst_port = _int(getattr(incident, 'dst_port', None))
+        is_acknowledged = bool(getattr(incident, 'acknowledged', False))
+
+        for event in getattr(incident, 'events', None) or ():
+            incident_ids.append(incident_id)
+            node_ids.append(node_id)
+            logtypes.append(_str(getattr(event, 'logtype', logtype)))
+            src_hosts.append(getattr(event, 'src_host', src_host))
+            dst_hosts.append(getattr(event, 'dst_host', dst_host))
+            dst_ports.append(_int(getattr(event, 'dst_port', dst_port)))
+            acknowledged.append(is_acknowledged)
+            timestamps.append(_int(_epoch(getattr(event, 'timestamp', None))))
+
+    if as_numpy:
+        return to_numpy(columns)
+    return columns
+
+
+def to_numpy(columns):
+    """Convert columns to NumPy arrays. Integer columns become ``int64`` arrays with missing values set
+        to ``MISSING_INT``, ``acknowledged`` a ``bool`` array and the others ``object`` arrays.
+
+    :param columns: Dictionary of column lists, as returned by :func:`incident_columns` or :func:`event_columns`
+    :return: Dictionary of NumPy arrays keyed by name
+
+    :except ConfigurationError: numpy isn't installed
+    """
+    if numpy is None:
+        raise ConfigurationError("numpy is required for NumPy exports. "
+                                 "Install it with 'pip install canarytools[export]'.")
+
+    arrays = dict()
+    for name, values in columns.items():
+        if name in INT_COLUMNS:
+            arrays[name] = numpy.array([MISSING_INT if value is None else value for value in values],
+                                       dtype=numpy.int64)
+        elif name in BOOL_COLUMNS:
+            arrays[name] = numpy.array(values, dtype=numpy.bool_)
+        else:
+            arrays[name] = numpy.array(values, dtype=object)
+    return arrays
+
+
+def to_arrow(columns):
+    """Convert columns to an Arrow table. Integer columns are ``int64`` with missing values as nulls.
+
+    :param columns: Dictionary of column lists, as returned by :func:`incident_columns` or :func:`event_columns`
+    :return: A ``pyarrow.Table``
+
+    :except ConfigurationError: pyarrow isn't installed
+    """
+    _require_pyarrow()
+    arrays, names = list(), list()
+    for name, values in columns.items():
+        if name in INT_COLUMNS:
+            kind = pyarrow.int64()
+        elif name in BOOL_COLUMNS:
+            kind = pyarrow.bool_()
+        else:
+            kind = pyarrow.string()
+        arrays.append(pyarrow.array(values, type=kind))
+        names.append(name)
+    return pyarrow.Table.from_arrays(arrays, names=names)
+
+
+def write_parquet(incidents, path, events=True, partition_by_day=True):
+    """Write incidents or their events to Parquet files
+
+    :param incidents: Iterable of Incident objects
+    :param path: Directory the files are written to
+    :param events: Write one row per event if ``True``, one row per incident otherwise
+    :param partition_by_day: Write each UTC day to its own ``day=YYYY-MM-DD`` directory, by event
+        timestamp or incident creation time
+    :return: The ``pyarrow.Table`` that was written. Each export adds its own files, so exporting again
+        into the same directory keeps the rows written before
+
+    :except ConfigurationError: pyarrow isn't installed
+
+    Usage::
+
+        >>> import canarytools
+        >>> from canarytools.export import write_parquet
+        >>> write_parquet(console.incidents.all(), '/data/canary/events')
+    """
+    return _write(incidents, path, 'parquet', events, partition_by_day)
+
+
+def write_arrow(incidents, path, events=True, partition_by_day=True):
+    """Write incidents or their events to Arrow IPC (Feather) files
+
+    :param incidents: Iterable of Incident objects
+    :param path: Directory the files are written to
+    :param events: Write one row per event if ``True``, one row per incident otherwise
+    :param partition_by_day: Write each UTC day to its own ``day=YYYY-MM-DD`` directory, by event
+        timestamp or incident creation time
+    :return: The ``pyarrow.Table`` that was written. Each export adds its own files, so exporting again
+        into the same directory keeps the rows written before
+
+    :except ConfigurationError: pyarrow isn't installed
+    """
+    return _write(incidents, path, 'ipc', events, partition_by_day)
+
+
+def write_ndjson(incidents, fileobj, events=False, fast_json=True):
+    """Write incidents or their events as newline delimited JSON, one object per line. Each incident is
+        written as soon as it's read, so an incident generator (e.g. :meth:`Incidents.iter_all`) is
+        exported in constant memory. The incidents aren't modified.
+
+    :param incidents: Iterable of Incident objects
+    :param fileobj: Text file object the lines are written to
+    :param events: Write one line per event if ``True``, one line per incident (with its events) otherwise.
+        Event lines include the ``incident_id`` and ``node_id`` of their incident
+    :param fast_json: Encode with ``orjson`` if it's installed. Times are ISO 8601 with their UTC offset either
+        way, and a time the console sent in a format that can't be parsed is written as it was sent
+    :return: Number of lines written
+
+    Usage::
+
+        >>> import canarytools
+        >>> from canarytools.export import write_ndjson
+        >>> with open('incidents.ndjson', 'w') as f:
+        >>>     write_ndjson(console.incidents.iter_all(), f)
+    """
+    encode = _json_encoder(fast_json)
+    count = 0
+    for row in _rows(incidents, events):
+        fileobj.write(encode(row))
+        fileobj.write('\n')
+        count += 1
+    return count
+
+
+def write_csv(incidents, fileobj, events=True, fields=None):
+    """Write incidents or their events as CSV, with a header line. Each incident is written as soon as
+        it's read, so an incident generator is exported in constant memory. The incidents aren't modified.
+
+    :param incidents: Iterable of Incident objects
+    :param fileobj: Text file object the rows are written to, opened with ``newline=''``
+    :param events: Write one row per event if ``True``, one row per incident otherwise
+    :param fields: The columns to write. Defaults to ``CSV_EVENT_FIELDS`` or ``CSV_INCIDENT_FIELDS``.
+        Missing values are empty, and dictionaries and lists are written as JSON
+    :return: Number of rows written
+
+    Usage::
+
+        >>> import canarytools
+        >>> from canarytools.export import write_csv
+        >>> with open('events.csv', 'w', newline='') as f:
+        >>>     write_csv(console.incidents.iter_unacknowledged(), f, fields=['incident_id', 'timestamp', 'src_host'])
+    """
+    if fields is None:
+        fields = CSV_EVENT_FIELDS if events else CSV_INCIDENT_FIELDS
+    writer = csv.writer(fileobj)
+    writer.writerow(fields)
+    count = 0
+    for row in _rows(incidents, events, include_events=False):
+        writer.writerow([_csv_value(row.get(field)) for field in fields])
+        count += 1
+    return count
+
+
+def _rows(incidents, events, include_events=True):
+    """Dictionaries of each incident, or of each event with its incident's id and node id. Times are left
+        as datetimes, for the writers to encode as ISO 8601
+    """
+    for incident in incidents:
+        if events:
+            incident_id = getattr(incident, 'id', None)
+            node_id = getattr(incident, 'node_id', None)
+            for event in getattr(incident, 'events', None) or ():
+                row = _row(event)
+                row['incident_id'] = incident_id
+                row.setdefault('node_id', node_id)
+                yield row
+        else:
+            row = _row(incident)
+            incident_events = row.pop('events', None)
+            if include_events:
+                row['events'] = [_row(event) for event in incident_events or ()]
+            yield row
+
+
+def _row(model):
+    """The public attributes of an incident or event, rather than ``to_dict()`` which formats event times
+        without their timezone
+
+    :param model: An Incident or Event object, or an event's JSON data
+    :return: Dictionary of attributes
+    """
+    if type(model) is dict:
+        return dict(model)
+    row = model._attributes(private=False)
+    row.pop('console', None)
+    return row
+
+
+def _json_default(value):
+    """Encode values the JSON encoders don't know"""
+    if isinstance(value, (datetime.datetime, datetime.date)):
+        return value.isoformat()
+    if isinstance(value, PortSet):
+        return value.to_dict()
+    return str(value)
+
+
+def _json_encoder(fast_json):
+    """Function encoding a value as a JSON string"""
+    if fast_json and orjson is not None:
+        return lambda value: orjson.dumps(value, default=_json_default).decode('utf-8')
+    return lambda value: json.dumps(value, default=_json_default, separators=(',', ':'))
+
+
+def _csv_value(value):
+    if value is None:
+        return ''
+    if isinstance(value, (datetime.datetime, datetime.date)):
+        return value.isoformat()
+    if isinstance(value, (dict, list, tuple, PortSet)):
+        return json.dumps(value, default=_json_default, separators=(',', ':'))
+    return value
+
+
+def _write(incidents, path, file_format, events, partition_by_day):
+    _require_pyarrow()
+    if events:
+        columns, time_column = event_columns(incidents), 'timestamp'
+    else:
+        columns, time_column = incident_columns(incidents), 'created'
+
+    partitioning = None
+    if partition_by_day:
+        columns['day'] = _days(columns[time_column])
+        partitioning = pyarrow.dataset.partitioning(pyarrow.schema([('day', pyarrow.string())]), flavor='hive')
+
+    table = to_arrow(columns)
+    # files named per export, so exporting a day already in the dataset adds to it rather than overwriting it
+    basename = 'part-{0}-{{i}}.{1}'.format(uuid.uuid4().hex, EXTENSIONS[file_format])
+    pyarrow.dataset.write_dataset(table, path, format=file_format, partitioning=partitioning,
+                                  basename_template=basename, existing_data_behavior='overwrite_or_ignore')
+    return table
+
+
+def _days(times):
+    """UTC day of each epoch time, formatted as YYYY-MM-DD"""
+    names = dict()
+    days = list()
+    for value in times:
+        if value is None:
+            days.append(None)
+            continue
+        day = value // SECONDS_PER_DAY
+        name = names.get(day)
+        if name is None:
+            name = names[day] = (EPOCH + datetime.timedelta(days=day)).strftime('%Y-%m-%d')
+        days.append(name)
+    return days
+
+
+def _require_pyarrow():
+    if pyarrow is None:
+        raise ConfigurationError("pyarrow is required for Arrow and Parquet exports. "
+                                 "Install it with 'pip install canarytools[export]'.")
+
+
+def _int(value):
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _str(value):
+    return None if value is None else str(value)
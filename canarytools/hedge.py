@@ -0,0 +1,176 @@
+import threading
+
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+
+# only reads are hedged, sending a change twice isn't harmless
+HEDGED_METHODS = ('GET',)
+
+
+class HedgePolicy(object):
+    def __init__(self, delay=None, percentile=95, min_samples=20, budget=0.05, burst=10, endpoints=None,
+                 max_workers=32):
+        """When to send a second copy of a slow read ("hedged requests"). If a GET request hasn't been answered
+            after a delay, the same request is sent again and whichever response arrives first is used. This cuts
+            the tail latency caused by the occasional slow connection. Only GET requests are hedged, never posts
+            or deletes.
+
+        Extra requests are capped by a budget: every hedgeable request earns ``budget`` of a hedge, up to
+        ``burst``, and every hedge spends one. Share a policy between consoles to cap their extra load together.
+
+        :param delay: Seconds to wait for a response before hedging. By default, the ``percentile`` latency
+            observed for the endpoint
+        :param percentile: Latency percentile used as the delay when ``delay`` isn't set
+        :param min_samples: Number of responses of an endpoint needed before its latency is used. Requests to
+            endpoints with fewer aren't hedged
+        :param budget: Hedges allowed per hedgeable request, e.g. 0.05 sends at most 5% extra requests
+        :param burst: Maximum number of hedges sent back to back when the budget has built up
+        :param endpoints: Only hedge these endpoints, e.g. ``['incident/fetch', 'device/getinfo']``. Defaults to
+            every endpoint read with a GET request
+        :param max_workers: Number of threads sending hedgeable requests. Hedging needs to wait for two requests
+            at once, so they're sent from a pool of threads shared by the consoles using the policy. Requests
+            made while every thread is busy are sent from the caller's thread without hedging, rather than
+            waiting for a thread
+
+        Usage::
+
+            >>> import canarytools
+            >>> hedge = canarytools.HedgePolicy(endpoints=['incident/fetch', 'device/getinfo'], budget=0.02)
+            >>> console = canarytools.Console(hedge=hedge)
+        """
+        self.delay = delay
+        self.percentile = percentile
+        self.min_samples = min_samples
+        self.budget = budget
+        self.burst = float(burst)
+        self.endpoints = frozenset(endpoints) if endpoints is not None else None
+        self.max_workers = max_workers
+        self._tokens = self.burst
+        self._executor = None
+        self._lock = threading.Lock()
+        # threads of the pool free to take a request, so nothing waits in the pool's queue
+        self._idle = threading.Semaphore(max_workers)
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state['_lock']
+        del state['_idle']
+        state['_executor'] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+        self._idle = threading.Semaphore(self.max_workers)
+
+    def applies(self, method, url):
+        """Can a request be hedged?
+
+        :param method: The HTTP method
+        :param url: Url of the API endpoint
+        :return: ``True`` for GET requests to the hedged endpoints
+        """
+        return method in HEDGED_METHODS and (self.endpoints is None or url in self.endpoints)
+
+    def hedge_delay(self, stats, url):
+        """Seconds to wait for a response before hedging a request
+
+        :param stats: The :class:`ConsoleStats <canarytools.metrics.ConsoleStats>` of the console sending it
+        :param url: Url of the API endpoint
+        :return: Seconds, ``None`` if the endpoint's latency isn't known yet
+        """
+        if self.delay is not None:
+            return self.delay
+        return stats.latency(url, self.percentile, min_samples=self.min_samples)
+
+    def earn(self):
+        """Count a hedgeable request towards the budget"""
+        with self._lock:
+            self._tokens = min(self.burst, self._tokens + self.budget)
+
+    def spend(self):
+        """Take a hedge from the budget
+
+        :return: ``True`` if the budget allows another hedge
+        """
+        with self._lock:
+            if self._tokens < 1.0:
+                return False
+            self._tokens -= 1.0
+            return True
+
+    def call(self, fn, delay, discard=None):
+        """Call a function sending a request, and call it again if it hasn't returned after ``delay`` seconds
+            and the budget allows
+
+        :param fn: Function sending the request and returning its response
+        :param delay: Seconds to wait before hedging, ``None`` to send the request without hedging
+        :param discard: Function called with the response of the slower call, e.g. to release its connection
+        :return: Tuple of the first response, whether the request was hedged and whether the hedge answered
+            first
+        :except Exception: Whatever the first call raised, if both calls failed
+        """
+        self.earn()
+        first = self._submit(fn) if delay is not None else None
+        if first is None:
+            # not hedged, or every thread is busy: send it from the caller's thread
+            return fn(), False, False
+
+        done, _ = wait([first], timeout=delay)
+        if done or not self.spend():
+            return first.result(), False, False
+
+        second = self._submit(fn)
+        if second is None:
+            # no thread free for the hedge, give the budget back
+            self._refund()
+            return first.result(), False, False
+        pending = set([first, second])
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in (first, second):
+                if future in done and future.exception() is None:
+                    self._discard(second if future is first else first, discard)
+                    return future.result(), True, future is second
+        return first.result(), True, False
+
+    def _refund(self):
+        """Return an unused hedge to the budget"""
+        with self._lock:
+            self._tokens = min(self.burst, self._tokens + 1.0)
+
+    def _submit(self, fn):
+        """Send a request from the pool if one of its threads is free
+
+        :param fn: Function sending the request
+        :return: The future of the call, ``None`` if every thread is busy
+        """
+        if not self._idle.acquire(False):
+            return None
+        try:
+            return self._get_executor().submit(self._run, fn)
+        except Exception:
+            self._idle.release()
+            raise
+
+    def _run(self, fn):
+        try:
+            return fn()
+        finally:
+            self._idle.release()
+
+    def _discard(self, future, discard):
+        """Discard the response of the slower call once it's done"""
+        if discard is None:
+            return
+
+        def done(future):
+            if future.exception() is None:
+                discard(future.result())
+        future.add_done_callback(done)
+
+    def _get_executor(self):
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        return self._executor
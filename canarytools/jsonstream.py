@@ -0,0 +1,184 @@
+import codecs
+import json
+import re
+
+WHITESPACE = re.compile(r'[ \t\n\r]*')
+NUMBER_START = u'-0123456789'
+NUMBER_CHARS = u'-+.eE0123456789'
+
+# buffered text is trimmed once this much of it has been consumed
+COMPACT_AFTER = 64 * 1024
+
+# where the parser is in the document
+_START, _OBJECT, _ARRAY, _END = range(4)
+
+
+class _NeedData(Exception):
+    """The buffered data ends before the value being parsed"""
+
+
+class JSONArrayStream(object):
+    def __init__(self, chunks, key):
+        """Incrementally parse a JSON object, yielding the items of one of its array values
+            one at a time. Only the item being parsed is held in memory.
+
+        The data is either pulled from ``chunks`` by iterating, or pushed with :meth:`feed` and :meth:`close`
+        and the items parsed so far taken with :meth:`items`, e.g. when chunks arrive asynchronously.
+
+        :param chunks: Iterable of byte strings making up the JSON document, ``None`` to push the data
+        :param key: The top level key of the array to stream
+
+        **Attributes:**
+            - **extra (dict)** -- The other top level values of the object, complete once iteration ends
+            - **bytes (int)** -- Number of bytes read so far
+        """
+        self.key = key
+        self.extra = dict()
+        self.bytes = 0
+        self._chunks = iter(chunks) if chunks is not None else None
+        self._decoder = codecs.getincrementaldecoder('utf-8')()
+        self._json = json.JSONDecoder()
+        self._buffer = u''
+        self._pos = 0
+        self._eof = False
+        self._state = _START
+
+    def __iter__(self):
+        while True:
+            try:
+                found, item = self._next()
+            except _NeedData:
+                if not self._read():
+                    raise ValueError('Unexpected end of JSON data')
+                continue
+            if not found:
+                return
+            yield item
+
+    def feed(self, chunk):
+        """Add the next chunk of the document
+
+        :param chunk: Byte string
+        """
+        self.bytes += len(chunk)
+        self._buffer += self._decoder.decode(chunk)
+
+    def close(self):
+        """Mark the end of the document, once every chunk has been fed"""
+        self._eof = True
+        self._buffer += self._decoder.decode(b'', final=True)
+
+    def items(self):
+        """Parse the items that are complete in the data fed so far
+
+        :return: Generator of items
+        :except ValueError: The data isn't a JSON object, or it ended early once closed
+        """
+        while True:
+            try:
+                found, item = self._next()
+            except _NeedData:
+                if self._eof:
+                    raise ValueError('Unexpected end of JSON data')
+                return
+            if not found:
+                return
+            yield item
+
+    def _next(self):
+        """Parse up to the next item of the array. Each step either completes or leaves the position where
+            it was, so parsing resumes from there once more data is buffered
+
+        :return: Tuple of whether an item was found, and the item
+        :except _NeedData: More data is needed to finish the step
+        """
+        while self._state != _END:
+            start = self._pos
+            try:
+                if self._state == _START:
+                    self._skip_whitespace()
+                    self._expect(u'{')
+                    self._state = _OBJECT
+                elif self._state == _OBJECT:
+                    self._skip_whitespace()
+                    char = self._peek()
+                    if char == u'}':
+                        self._pos += 1
+                        self._state = _END
+                    elif char == u',':
+                        self._pos += 1
+                    else:
+                        key = self._value()
+                        self._skip_whitespace()
+                        self._expect(u':')
+                        self._skip_whitespace()
+                        if key == self.key and self._peek() == u'[':
+                            self._pos += 1
+                            self._state = _ARRAY
+                        else:
+                            self.extra[key] = self._value()
+                else:
+                    self._skip_whitespace()
+                    char = self._peek()
+                    if char == u']':
+                        self._pos += 1
+                        self._state = _OBJECT
+                    elif char == u',':
+                        self._pos += 1
+                    else:
+                        item = self._value()
+                        self._compact()
+                        return True, item
+            except _NeedData:
+                self._pos = start
+                raise
+        return False, None
+
+    def _read(self):
+        """Read the next chunk into the buffer
+
+        :return: ``False`` once there is nothing left to read
+        """
+        if self._eof or self._chunks is None:
+            return False
+        try:
+            chunk = next(self._chunks)
+        except StopIteration:
+            self.close()
+            return False
+        self.feed(chunk)
+        return True
+
+    def _compact(self):
+        if self._pos > COMPACT_AFTER:
+            self._buffer = self._buffer[self._pos:]
+            self._pos = 0
+
+    def _peek(self):
+        if self._pos >= len(self._buffer):
+            raise _NeedData()
+        return self._buffer[self._pos]
+
+    def _expect(self, char):
+        if self._peek() != char:
+            raise ValueError("Expected '{char}' at position {pos} of JSON data".format(
+                char=char, pos=self._pos))
+        self._pos += 1
+
+    def _skip_whitespace(self):
+        self._pos = WHITESPACE.match(self._buffer, self._pos).end()
+
+    def _value(self):
+        """Decode the JSON value at the current position"""
+        try:
+            value, end = self._json.raw_decode(self._buffer, self._pos)
+        except ValueError:
+            if self._eof:
+                raise
+            raise _NeedData()
+        # a number that reaches the end of the buffer may continue in the next chunk
+        if not self._eof and self._buffer[self._pos] in NUMBER_START and \
+                (end == len(self._buffer) or self._buffer[end] in NUMBER_CHARS):
+            raise _NeedData()
+        self._pos = end
+        return value
@@ -0,0 +1,404 @@
+import logging
+import threading
+import time
+
+from collections import deque
+
+logger = logging.getLogger('canarytools')
+
+
+class RequestRecord(object):
+    def __init__(self, method, endpoint):
+        """Measurements of a single API call
+
+        :param method: The HTTP method
+        :param endpoint: Url of the API endpoint
+
+        **Attributes:**
+            - **method (str)** -- The HTTP method
+            - **endpoint (str)** -- Url of the API endpoint, e.g. 'incidents/unacknowledged'
+            - **status_code (int)** -- HTTP status code, ``None`` if no response was received
+            - **bytes (int)** -- Size of the response body
+            - **network_time (float)** -- Seconds spent waiting for the response
+            - **decode_time (float)** -- Seconds spent parsing the JSON body
+            - **build_time (float)** -- Seconds spent building objects from the JSON data
+            - **error (str)** -- Name of the exception raised by the call, ``None`` on success
+            - **cached (bool)** -- Was the response served from the console's cache?
+            - **coalesced (bool)** -- Was the response shared from an identical request in flight? Its network
+              and decoding times are counted on that request
+            - **hedged (bool)** -- Was a second copy of the request sent because the first was slow?
+            - **hedge_won (bool)** -- Did the second copy answer first?
+            - **retries (int)** -- Number of times the request was retried
+            - **wait_time (float)** -- Seconds spent waiting for the rate limiter and between retries
+        """
+        self.method = method
+        self.endpoint = endpoint
+        self.status_code = None
+        self.bytes = 0
+        self.network_time = 0.0
+        self.decode_time = 0.0
+        self.build_time = 0.0
+        self.error = None
+        self.cached = False
+        self.coalesced = False
+        self.hedged = False
+        self.hedge_won = False
+        self.retries = 0
+        self.wait_time = 0.0
+
+    @property
+    def elapsed(self):
+        """Total seconds spent on the call"""
+        return self.network_time + self.decode_time + self.build_time + self.wait_time
+
+
+def percentile(samples, percent):
+    """Nearest-rank percentile
+
+    :param samples: Sorted list of values
+    :param percent: The percentile, between 0 and 100
+    :return: The value at the percentile, ``None`` if there are no samples
+    """
+    if not samples:
+        return None
+    rank = int(round(percent / 100.0 * len(samples) + 0.5)) - 1
+    return samples[max(0, min(rank, len(samples) - 1))]
+
+
+class EndpointStats(object):
+    def __init__(self, sample_size=1024):
+        """Aggregated measurements for one endpoint
+
+        :param sample_size: Number of recent latencies kept to compute percentiles
+        """
+        self.count = 0
+        self.cache_hits = 0
+        self.coalesced = 0
+        self.hedged = 0
+        self.hedge_wins = 0
+        self.errors = dict()
+        self.bytes = 0
+        self.network_time = 0.0
+        self.decode_time = 0.0
+        self.build_time = 0.0
+        self.retries = 0
+        self.wait_time = 0.0
+        self.latencies = deque(maxlen=sample_size)
+
+    def add(self, record):
+        """Add a request's measurements
+
+        :param record: A :class:`RequestRecord <RequestRecord>` object
+        """
+        self.count += 1
+        self.bytes += record.bytes
+        self.network_time += record.network_time
+        self.decode_time += record.decode_time
+        self.build_time += record.build_time
+        self.retries += record.retries
+        self.wait_time += record.wait_time
+        if record.cached:
+            self.cache_hits += 1
+        elif record.coalesced:
+            self.coalesced += 1
+        else:
+            self.latencies.append(record.network_time)
+        if record.hedged:
+            self.hedged += 1
+            if record.hedge_won:
+                self.hedge_wins += 1
+        if record.error:
+            self.errors[record.error] = self.errors.get(record.error, 0) + 1
+
+    def snapshot(self):
+        """Current statistics
+
+        :return: Dictionary of statistics. Times are in seconds
+        """
+        latencies = sorted(self.latencies)
+        return {
+            'count': self.count,
+            'cache_hits': self.cache_hits,
+            'coalesced': self.coalesced,
+            'coalescing_rate': float(self.coalesced) / self.count if self.count else 0.0,
+            'hedged': self.hedged,
+            'hedge_wins': self.hedge_wins,
+            'errors': dict(self.errors),
+            'bytes': self.bytes,
+            'latency': {
+                'p50': percentile(latencies, 50),
+                'p95': percentile(latencies, 95),
+                'p99': percentile(latencies, 99),
+                'max': latencies[-1] if latencies else None,
+            },
+            'network_time': self.network_time,
+            'decode_time': self.decode_time,
+            'build_time': self.build_time,
+            'retries': self.retries,
+            'wait_time': self.wait_time,
+        }
+
+
+class ConsoleStats(object):
+    def __init__(self, callback=None, sample_size=1024):
+        """Per-endpoint request statistics of a Console
+
+        :param callback: Function called with a :class:`RequestRecord <RequestRecord>` after every API call
+        :param sample_size: Number of recent latencies kept per endpoint to compute percentiles
+        """
+        self.callback = callback
+        self.sample_size = sample_size
+        self._endpoints = dict()
+        self._lock = threading.Lock()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state['_lock']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def record(self, record):
+        """Record a request's measurements
+
+        :param record: A :class:`RequestRecord <RequestRecord>` object
+        """
+        with self._lock:
+            stats = self._endpoints.get(record.endpoint)
+            if stats is None:
+                stats = self._endpoints[record.endpoint] = EndpointStats(self.sample_size)
+            stats.add(record)
+
+        if self.callback is not None:
+            try:
+                self.callback(record)
+            except Exception:
+                logger.exception('Request metrics callback failed')
+
+    def latency(self, endpoint, percent, min_samples=1):
+        """Latency percentile of an endpoint
+
+        :param endpoint: Url of the API endpoint
+        :param percent: The percentile, between 0 and 100
+        :param min_samples: Number of latencies needed to compute the percentile
+        :return: Latency in seconds, ``None`` if the endpoint has fewer latencies
+        """
+        with self._lock:
+            stats = self._endpoints.get(endpoint)
+            latencies = sorted(stats.latencies) if stats else []
+        if len(latencies) < min_samples:
+            return None
+        return percentile(latencies, percent)
+
+    def snapshot(self):
+        """Current statistics of every endpoint
+
+        :return: Dictionary of statistics keyed by endpoint
+        """
+        with self._lock:
+            return dict((endpoint, stats.snapshot()) for endpoint, stats in self._endpoints.items())
+
+    def reset(self):
+        """Discard all statistics"""
+        with self._lock:
+            self._endpoints = dict()
+
+
+# modules whose frames are part of the client when attributing requests to the method that made them
+_CLIENT_MODULE = 'canarytools'
+
+PHASES = ('network', 'decode', 'build', 'user')
+
+
+def _is_client_frame(frame):
+    name = frame.f_globals.get('__name__', '')
+    return name == _CLIENT_MODULE or name.startswith(_CLIENT_MODULE + '.')
+
+
+def _calling_method(frame):
+    """The outermost frame of the client's code that led to a request, and its name
+
+    :param frame: A frame inside the client, e.g. the one making the request
+    :return: Tuple of the frame and its name, e.g. ``'Devices.all'``
+    """
+    top = frame
+    frame = frame.f_back
+    while frame is not None and _is_client_frame(frame):
+        top = frame
+        frame = frame.f_back
+    code = top.f_code
+    owner = top.f_locals.get('self') if code.co_argcount else None
+    if owner is not None:
+        return top, '{cls}.{name}'.format(cls=type(owner).__name__, name=code.co_name)
+    return top, '{module}.{name}'.format(module=top.f_globals.get('__name__'), name=code.co_name)
+
+
+class MethodProfile(object):
+    def __init__(self):
+        """Requests made by one of the client's methods during a profile
+
+        **Attributes:**
+            - **calls (int)** -- Number of calls of the method that made requests
+            - **requests (int)** -- Number of requests made
+            - **endpoints (dict)** -- Number of requests keyed by endpoint
+        """
+        self.calls = 0
+        self.requests = 0
+        self.endpoints = dict()
+        self._frame = None
+
+    def to_dict(self):
+        return {'calls': self.calls, 'requests': self.requests, 'endpoints': dict(self.endpoints)}
+
+
+class Profile(object):
+    def __init__(self, console):
+        """Breakdown of where the time of a block of code using a Console goes. Returned by
+            :meth:`Console.profile <canarytools.console.Console.profile>`
+
+        The time spent in the block is split into four phases:
+
+        - **network** -- waiting for responses, including waits for the rate limiter and between retries
+        - **decode** -- parsing the JSON of responses
+        - **build** -- building objects from the JSON data, including events and timestamps built on first
+          access
+        - **user** -- everything else, i.e. the code in the block
+
+        Requests made from several threads at once overlap, so their phases can add up to more than the
+        block's wall time. The user phase is never negative.
+
+        :param console: The :class:`Console <canarytools.console.Console>` profiled
+
+        **Attributes:**
+            - **wall (float)** -- Seconds spent in the block, up to now if it's still running
+            - **network (float)** -- Seconds spent waiting for responses
+            - **decode (float)** -- Seconds spent parsing JSON
+            - **build (float)** -- Seconds spent building objects
+            - **user (float)** -- Seconds spent in the block's own code
+            - **requests (int)** -- Number of requests made
+            - **methods (dict)** -- :class:`MethodProfile <MethodProfile>` objects keyed by the name of the
+              client's method that made the requests, e.g. ``'Devices.all'``. Attributes loaded on first
+              access are listed under the object's ``__getattr__``, e.g. ``'Device.__getattr__'``
+        """
+        self.console = console
+        self.network = 0.0
+        self.decode = 0.0
+        self.build = 0.0
+        self.requests = 0
+        self.methods = dict()
+        self._start = None
+        self._end = None
+        self._lock = threading.Lock()
+
+    @property
+    def wall(self):
+        if self._start is None:
+            return 0.0
+        return (self._end if self._end is not None else time.time()) - self._start
+
+    @property
+    def user(self):
+        return max(0.0, self.wall - self.network - self.decode - self.build)
+
+    def record(self, record, frame):
+        """Add a request's measurements
+
+        :param record: A :class:`RequestRecord <RequestRecord>` object
+        :param frame: The frame that made the request, used to find the client's method that led to it
+        """
+        top, name = _calling_method(frame)
+        with self._lock:
+            self.requests += 1
+            self.network += record.network_time + record.wait_time
+            self.decode += record.decode_time
+            self.build += record.build_time
+            method = self.methods.get(name)
+            if method is None:
+                method = self.methods[name] = MethodProfile()
+            if method._frame is not top:
+                # a new call of the method, rather than another request from the same call
+                method._frame = top
+                method.calls += 1
+            method.requests += 1
+            method.endpoints[record.endpoint] = method.endpoints.get(record.endpoint, 0) + 1
+
+    def add_build(self, seconds):
+        """Add time spent building objects outside of a request, e.g. events built on first access
+
+        :param seconds: Seconds spent
+        """
+        with self._lock:
+            self.build += seconds
+
+    def phases(self):
+        """Seconds spent in each phase
+
+        :return: Dictionary of seconds keyed by phase: ``network``, ``decode``, ``build`` and ``user``
+        """
+        return {'network': self.network, 'decode': self.decode, 'build': self.build, 'user': self.user}
+
+    def to_dict(self):
+        """The profile as a dictionary
+
+        :return: Dictionary with the ``wall`` time, the ``phases``, the number of ``requests`` and the requests
+            of each of the client's ``methods``
+        """
+        with self._lock:
+            methods = dict((name, method.to_dict()) for name, method in self.methods.items())
+        return {'wall': self.wall, 'phases': self.phases(), 'requests': self.requests, 'methods': methods}
+
+    def report(self):
+        """The profile as a table
+
+        :return: String listing the time of each phase and the requests made by each of the client's methods
+        """
+        wall = self.wall
+        lines = ['{wall:.3f}s in {requests} requests'.format(wall=wall, requests=self.requests)]
+        for phase, seconds in sorted(self.phases().items(), key=lambda item: PHASES.index(item[0])):
+            lines.append('  {phase:<8} {seconds:9.3f}s {share:6.1f}%'.format(
+                phase=phase, seconds=seconds, share=100.0 * seconds / wall if wall else 0.0))
+        with self._lock:
+            methods = sorted(self.methods.items(), key=lambda item: -item[1].requests)
+            for name, method in methods:
+                lines.append('  {name} x{calls}: {requests} requests ({endpoints})'.format(
+                    name=name, calls=method.calls, requests=method.requests,
+                    endpoints=', '.join('{0} x{1}'.format(endpoint, count)
+                                        for endpoint, count in sorted(method.endpoints.items()))))
+        return '\n'.join(lines)
+
+    def __enter__(self):
+        self._start = time.time()
+        self._end = None
+        self.console._profiles.append(self)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._end = time.time()
+        self.console._profiles.remove(self)
+        for method in self.methods.values():
+            method._frame = None
+
+    def __str__(self):
+        return self.report()
+
+
+def profiled_build(console, factory, *args):
+    """Build an object, counting the time in the console's running profiles
+
+    :param console: The Console the object belongs to
+    :param factory: Function building the object
+    :param args: Arguments of the function
+    :return: The object
+    """
+    profiles = getattr(console, '_profiles', None)
+    if not profiles:
+        return factory(*args)
+    start = time.time()
+    try:
+        return factory(*args)
+    finally:
+        elapsed = time.time() - start
+        for profile in list(profiles):
+            profile.add_build(elapsed)
@@ -1,4 +1,57 @@
+import datetime
+
+import pytz
+
+from dateutil.parser import parse
+
+from ..metrics import profiled_build
+
+# unparsed timestamps of lazily parsed models are stored under this prefix, e.g. '_raw_timestamp'
+RAW_PREFIX = '_raw_'
+
+# tzinfo of each UTC offset seen, e.g. '+0200'
+_timezones = dict()
+
+
+def parse_timestamp(value):
+    """Parse a timestamp in the console's standardised format, e.g. '2019-12-25 12:00:00 UTC+0000'.
+        Other formats fall back to ``dateutil``.
+
+    'UTC+0200' is read as two hours ahead of UTC, as the console means it. ``dateutil`` reads it the
+    POSIX way, as two hours behind, which is how event and device times were parsed before.
+
+    :param value: The timestamp string
+    :return: A timezone aware datetime
+
+    :except ValueError: The value isn't a timestamp
+    """
+    try:
+        if value[4] == '-' and value[10] == ' ' and value[13] == ':' and value[19] == ' ' and value[-5] in '+-':
+            offset = value[-5:]
+            tz = _timezones.get(offset)
+            if tz is None:
+                minutes = int(offset[1:3]) * 60 + int(offset[3:5])
+                tz = _timezones[offset] = pytz.FixedOffset(-minutes if offset[0] == '-' else minutes)
+            return datetime.datetime(int(value[0:4]), int(value[5:7]), int(value[8:10]),
+                                     int(value[11:13]), int(value[14:16]), int(value[17:19]), 0, tz)
+    except (IndexError, TypeError, ValueError):
+        pass
+    return parse(value)
+
+
+def _lazy_timestamp(value):
+    """Parse a lazily parsed timestamp, keeping values that can't be parsed as they are"""
+    if not value:
+        return None
+    try:
+        return parse_timestamp(value)
+    except (ValueError, OverflowError):
+        return value
+
+
 class CanaryToolsBase(object):
+    __slots__ = ()
+
     @classmethod
     def parse(cls, console, data):
         """Initialize model
@@ -24,3 +77,190 @@ class CanaryToolsBase(object):
                     setattr(self, attribute, value)
             elif type(data) is list:
                 setattr(self, "details", data)
+
+    def __getattr__(self, key):
+        """Parse a timestamp kept unparsed by a console with ``lazy_timestamps`` on first access,
+            and refresh a stale object the first time a missing attribute is accessed
+        """
+        if not key.startswith('_'):
+            raw_key = RAW_PREFIX + key
+            try:
+                raw = getattr(self, raw_key)
+            except AttributeError:
+                pass
+            else:
+                value = profiled_build(self.console, _lazy_timestamp, raw)
+                delattr(self, raw_key)
+                super(CanaryToolsBase, self).__setattr__(key, value)
+                return value
+
+        fallback = getattr(super(CanaryToolsBase, self), '__getattr__', None)
+        if fallback is not None:
+            try:
+                return fallback(key)
+            except AttributeError:
+                pass
+
+        if not key.startswith('_') and getattr(self, '_stale', False):
+            # cleared first, so a failed refresh isn't retried on every access
+            super(CanaryToolsBase, self).__setattr__('_stale', False)
+            self.refresh()
+            return getattr(self, key)
+        raise AttributeError(key)
+
+    def _mark_stale(self, *keys):
+        """Mark the object as changed locally without being refreshed. It's refreshed the first
+            time a missing attribute is accessed.
+
+        :param keys: Attributes the change made out of date. They're removed, so accessing one
+            refreshes the object
+        """
+        for key in keys:
+            for name in (key, RAW_PREFIX + key):
+                try:
+                    delattr(self, name)
+                except AttributeError:
+                    pass
+        super(CanaryToolsBase, self).__setattr__('_stale', True)
+
+    def _store_timestamp(self, key, value, strict=True):
+        """Store a timestamp attribute, parsed now or on first access depending on the console
+
+        :param key: Name of the attribute
+        :param value: The timestamp string
+        :param strict: Raise if the value can't be parsed. Otherwise it's stored as it is. Timestamps
+            parsed on first access are never strict
+        """
+        if getattr(self.console, 'lazy_timestamps', False):
+            super(CanaryToolsBase, self).__setattr__(RAW_PREFIX + key, value)
+        elif strict:
+            super(CanaryToolsBase, self).__setattr__(key, parse_timestamp(value) if value else None)
+        else:
+            super(CanaryToolsBase, self).__setattr__(key, _lazy_timestamp(value))
+
+    def _attributes(self, resolve=True, private=True):
+        """Get the object's attributes, including those kept in ``__slots__``
+
+        :param resolve: Parse lazily parsed timestamps. If ``False`` they're returned unparsed,
+            under their ``RAW_PREFIX`` names
+        :param private: Include the object's own bookkeeping, the attributes starting with '_' such as
+            ``_stale``. Leave them out when handing the attributes to users
+        :return: Dictionary of attributes. For regular objects with private attributes included this is
+            the object's own ``__dict__``
+        """
+        slots = _slot_names(type(self))
+        if not slots:
+            if resolve:
+                for key in [key for key in self.__dict__ if key.startswith(RAW_PREFIX)]:
+                    getattr(self, key[len(RAW_PREFIX):])
+            if not private:
+                return dict((key, value) for key, value in self.__dict__.items() if not key.startswith('_'))
+            return self.__dict__
+
+        attributes = dict()
+        for slot in slots:
+            try:
+                attributes[slot] = object.__getattribute__(self, slot)
+            except AttributeError:
+                pass
+        extra = attributes.pop('_extra', ())
+        attributes.update(zip(extra[::2], extra[1::2]))
+        if resolve:
+            for key in [key for key in attributes if key.startswith(RAW_PREFIX)]:
+                del attributes[key]
+                key = key[len(RAW_PREFIX):]
+                attributes[key] = getattr(self, key)
+        if not private:
+            attributes = dict((key, value) for key, value in attributes.items() if not key.startswith('_'))
+        return attributes
+
+    def _update(self, other):
+        """Copy all attributes of another object onto this one, e.g. when refreshing
+
+        :param other: An object of the same model
+        """
+        own = set(self._attributes(resolve=False))
+        for attribute, value in list(other._attributes(resolve=False).items()):
+            # drop this object's parsed or unparsed version of the attribute
+            if attribute.startswith(RAW_PREFIX):
+                stale = attribute[len(RAW_PREFIX):]
+            else:
+                stale = RAW_PREFIX + attribute
+            if stale in own:
+                delattr(self, stale)
+            super(CanaryToolsBase, self).__setattr__(attribute, value)
+        # the object is up to date again
+        if '_stale' in own:
+            delattr(self, '_stale')
+
+
+# overflow keys of compact models, see CompactModel.__setattr__
+_extra_keys = dict()
+
+
+class CompactModel(object):
+    """Storage for compact models. Known fields are kept in ``__slots__`` and any other attribute
+        in ``_extra``, a flat ``(key, value, key, value, ...)`` tuple which is only created when one
+        is set. Compact classes list this class after the model class, so the model's own attribute
+        processing runs first.
+    """
+    __slots__ = ()
+
+    def __setattr__(self, key, value):
+        try:
+            super(CompactModel, self).__setattr__(key, value)
+        except AttributeError:
+            try:
+                extra = object.__getattribute__(self, '_extra')
+            except AttributeError:
+                extra = ()
+            for i in range(0, len(extra), 2):
+                if extra[i] == key:
+                    extra = extra[:i] + extra[i + 2:]
+                    break
+            # share one copy of each key between all objects
+            key = _extra_keys.setdefault(key, key)
+            object.__setattr__(self, '_extra', extra + (key, value))
+
+    def __getattr__(self, key):
+        try:
+            extra = object.__getattribute__(self, '_extra')
+        except AttributeError:
+            raise AttributeError(key)
+        for i in range(0, len(extra), 2):
+            if extra[i] == key:
+                return extra[i + 1]
+        raise AttributeError(key)
+
+    def __delattr__(self, key):
+        try:
+            super(CompactModel, self).__delattr__(key)
+        except AttributeError:
+            try:
+                extra = object.__getattribute__(self, '_extra')
+            except AttributeError:
+                raise AttributeError(key)
+            for i in range(0, len(extra), 2):
+                if extra[i] == key:
+                    object.__setattr__(self, '_extra', extra[:i] + extra[i + 2:])
+                    return
+            raise AttributeError(key)
+
+    def __getstate__(self):
+        return self._attributes(resolve=False)
+
+    def __setstate__(self, state):
+        # the values are already processed, so store them as they are
+        for key, value in state.items():
+            CompactModel.__setattr__(self, key, value)
+
+
+def _slot_names(cls):
+    """Get all slot names of a class, including those of its base classes"""
+    names = list()
+    for klass in cls.__mro__:
+        slots = klass.__dict__.get('__slots__', ())
+        if isinstance(slots, str):
+            slots = (slots,)
+        names.extend(slot for slot in slots if slot not in ('__dict__', '__weakref__'))
+    return names
@@ -1,7 +1,11 @@
 from .base import CanaryToolsBase
 from .databundles import DataBundles
+from .incidents import IncidentIndex
 
-from dateutil.parser import parse
+# attributes a reboot puts out of date, dropped so the next access refreshes the device
+REBOOT_STALE = ('live', 'uptime', 'uptime_age', 'last_heartbeat_age', 'last_seen', 'reconnect_count')
+# an update installs new software and restarts the device
+UPDATE_STALE = REBOOT_STALE + ('version', 'need_reboot')
 
 
 class Devices(object):
@@ -12,9 +16,12 @@ class Devices(object):
         """
         self.console = console
 
-    def all(self):
-        """Get all registered devices
+    def all(self, hydrate=False):
+        """Get all registered devices. Devices are built straight from the listing, so
+            this is a single request regardless of the size of the fleet.
 
+        :param hydrate: If ``True``, attributes not included in the listing are fetched
+            lazily from ``device/getinfo`` the first time one of them is accessed
         :return: List of all devices
         :rtype: List of :class:`Device <Device>` objects
 
@@ -24,11 +31,13 @@ class Devices(object):
               >>> devices = console.devices.all()
         """
         params = {'tz': self.console.tz}
-        return self.console.get('devices/all', params, self.parse)
+        return self.console.get('devices/all', params, lambda data: self.parse(data, hydrate=hydrate))
 
-    def live(self):
+    def live(self, hydrate=False):
         """Get all registered connected devices
 
+        :param hydrate: If ``True``, attributes not included in the listing are fetched
+            lazily from ``device/getinfo`` the first time one of them is accessed
         :return: List of live devices
         :rtype: List of :class:`Device <Device>` objects
 
@@ -38,11 +47,13 @@ class Devices(object):
               >>> devices = console.devices.live()
         """
         params = {'tz': self.console.tz}
-        return self.console.get('devices/live', params, self.parse)
+        return self.console.get('devices/live', params, lambda data: self.parse(data, hydrate=hydrate))
 
-    def dead(self):
+    def dead(self, hydrate=False):
         """Get all registered disconnected devices
 
+        :param hydrate: If ``True``, attributes not included in the listing are fetched
+            lazily from ``device/getinfo`` the first time one of them is accessed
         :return: List of dead devices
         :rtype: List of :class:`Device <Device>` objects
 
@@ -52,7 +63,7 @@ class Devices(object):
               >>> devices = console.devices.dead()
         """
         params = {'tz': self.console.tz}
-        return self.console.get('devices/dead', params, self.parse)
+        return self.console.get('devices/dead', params, lambda data: self.parse(data, hydrate=hydrate))
 
     def get_device(self, node_id):
         """Get information on a particular device
@@ -71,19 +82,32 @@ class Devices(object):
         params = {'node_id': node_id}
         return self.console.get('device/getinfo', params, self.parse)
 
-    def parse(self, data):
+    def parse(self, data, hydrate=False, index=None):
         """Parse JSON data
 
         :param data: JSON data
+        :param hydrate: Lazily fetch the full device info for attributes missing
+            from a device listing
+        :param index: :class:`IncidentIndex <IncidentIndex>` used to look up unacknowledged
+            incidents. By default one is fetched lazily for a device listing
         :return: Device object or a list if Device objects
         """
         if data and 'devices' in data:
             devices = list()
+            # one fetch of unack'd incidents shared by every device in the listing
+            if index is None:
+                index = self.console.incidents.unacknowledged_index(lazy=True)
             for device in data['devices']:
-                devices.append(self.get_device(device['id']))
+                device = Device.parse(self.console, device)
+                device._hydrate = hydrate
+                device._incident_index = index
+                devices.append(device)
             return devices
         elif data and 'device' in data:
-            return Device.parse(self.console, data['device'])
+            device = Device.parse(self.console, data['device'])
+            if index is not None:
+                device._incident_index = index
+            return device
         return list()
 
 
@@ -121,6 +145,25 @@ class Device(CanaryToolsBase):
         """
         super(Device, self).__init__(console, data)
 
+        # device listings only carry the id, which doubles as the node id
+        if 'node_id' not in self.__dict__ and 'id' in self.__dict__:
+            self.node_id = self.id
+
+    def __getattr__(self, key):
+        """Fetch the full device info the first time an attribute that wasn't part of
+            a device listing is accessed. Only applies to devices listed with ``hydrate=True``.
+        """
+        try:
+            # lazily parsed timestamps
+            return super(Device, self).__getattr__(key)
+        except AttributeError:
+            if key.startswith('_') or not self.__dict__.get('_hydrate'):
+                raise
+
+        self._hydrate = False
+        self.refresh()
+        return getattr(self, key)
+
     def __setattr__(self, key, value):
         """Override base class implementation."""
         # json attributes to ignore
@@ -140,31 +183,17 @@ class Device(CanaryToolsBase):
                             'notify_after_horizon_reconnect', 'device_live']:
             value = value == 'True'
 
-        # get unack'd incidents for this device and look them up
+        # keep the keys of unack'd incidents, they're looked up on first access
         if 'unacknowleged_incidents' == key:
-            unacknowleged_incidents = list()
-
-            if hasattr(self, 'id'):
-                node_id = self.id
-            else:
-                node_id = None
-
-            all_unacked_incidents = self.console.incidents.unacknowledged(node_id=node_id)
-
-            for device_incident in value:
-                for incident in all_unacked_incidents:
-                    if device_incident['key'] == incident.id:
-                        unacknowleged_incidents.append(incident)
-                        break
-            value = unacknowleged_incidents
+            super(Device, self).__setattr__('_unacknowleged_incident_keys',
+                                            [device_incident['key'] for device_incident in value])
+            super(Device, self).__setattr__('_unacknowleged_incidents', None)
+            return
 
         # remove 'std' from key name and create datetime object from date string
         if key in ['first_seen_std', 'last_seen_std']:
-            key = key[:-4]
-            if value:
-                value = parse(value)
-            else:
-                value = None
+            self._store_timestamp(key[:-4], value)
+            return
 
         if key in ['uptime']:
             try:
@@ -177,6 +206,28 @@ class Device(CanaryToolsBase):
 
         super(Device, self).__setattr__(key, value)
 
+    @property
+    def unacknowleged_incidents(self):
+        """List of unacknowledged incidents for the device. Looked up in the incident index
+            shared by the device listing this device came from, otherwise fetched on first access.
+        """
+        incidents = self.__dict__.get('_unacknowleged_incidents')
+        if incidents is None:
+            keys = self.__dict__.get('_unacknowleged_incident_keys')
+            if keys is None:
+                raise AttributeError('unacknowleged_incidents')
+
+            if keys:
+                index = self.__dict__.get('_incident_index')
+                if index is None:
+                    index = IncidentIndex(
+                        incidents=self.console.incidents.unacknowledged(node_id=self.__dict__.get('id')))
+                incidents = [index.by_id[key] for key in keys if index.get(key) is not None]
+            else:
+                incidents = list()
+            self._unacknowleged_incidents = incidents
+        return incidents
+
     def __str__(self):
         """Helper method"""
         # ghost devices won't have an ip, so check
@@ -189,9 +240,12 @@ class Device(CanaryToolsBase):
                 name=self.name, ip=ip_address,
                 location=self.description, live=self.live)
 
-    def reboot(self):
+    def reboot(self, refresh=True):
         """Reboot the device
 
+        :param refresh: Refresh the device afterwards. If ``False`` only ``need_reboot`` is updated and the
+            device is marked :attr:`stale`, costing one request instead of two. The attributes the reboot
+            changes (``live``, ``uptime``, ``last_seen``...) are dropped, so reading one refreshes the device
         :return: Result object
         :rtype: :class:`Result <Result>` object
 
@@ -206,14 +260,21 @@ class Device(CanaryToolsBase):
         params = {'node_id': self.node_id}
         r = self.console.post('device/reboot', params)
 
-        self.refresh()
+        if refresh:
+            self.refresh()
+        else:
+            self.__dict__['need_reboot'] = True
+            self._mark_stale(*REBOOT_STALE)
 
         return r
 
-    def update(self, update_tag):
+    def update(self, update_tag, refresh=True):
         """Update the device
 
         :param update_tag: The tag of the update
+        :param refresh: Refresh the device afterwards. If ``False`` the device is marked :attr:`stale`
+            instead, costing one request instead of two. The attributes the update changes are dropped, so
+            reading one refreshes the device
         :return: Result object
         :rtype: :class:`Result <Result>` object
 
@@ -230,10 +291,20 @@ class Device(CanaryToolsBase):
         params = {'node_id': self.node_id, 'update_tag': update_tag}
         r = self.console.post('device/update', params)
 
-        self.refresh()
+        if refresh:
+            self.refresh()
+        else:
+            self._mark_stale(*UPDATE_STALE)
 
         return r
 
+    @property
+    def stale(self):
+        """``True`` if the device was changed without being refreshed. A stale device refreshes itself
+            the first time an attribute it doesn't have is accessed, or use :meth:`refresh`
+        """
+        return self.__dict__.get('_stale', False)
+
     def list_databundles(self):
         """Lists all DataBundles
 
@@ -264,4 +335,6 @@ class Device(CanaryToolsBase):
         devices = Devices(self.console)
         device = devices.get_device(self.node_id)
 
-        self.__dict__.update(device.__dict__)
+        self._update(device)
+        # a shared listing index is out of date now
+        self._incident_index = None
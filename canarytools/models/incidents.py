@@ -1,8 +1,37 @@
 import datetime
-from dateutil.parser import parse
-
-from .base import CanaryToolsBase
+import json
+import os
+import threading
+
+try:
+    # python 3
+    from collections.abc import Sequence
+except ImportError:
+    # python 2
+    from collections import Sequence
+
+from concurrent.futures import ThreadPoolExecutor
+
+from .base import CanaryToolsBase, CompactModel
+from .ports import PortSet
+from .result import Result
 from ..exceptions import IncidentError
+from ..metrics import profiled_build
+
+
+# the incident fields kept on Incident objects
+INCIDENT_FIELDS = ('console', 'id', 'description', 'summary', 'logtype', 'events', 'acknowledged',
+                   'dst_host', 'src_host', 'node_id', 'dst_port', 'src_port', 'created_std', 'updated_std',
+                   'flock_id')
+
+# the fields shared by nearly every event, kept in __slots__ by CompactEvent objects. Type specific
+# fields go to the overflow tuple, as an unused slot costs as much memory as a set one
+EVENT_FIELDS = ('console', 'logtype', 'node_id', 'src_host', 'src_port', 'dst_host', 'dst_port', 'timestamp',
+                'local_time')
+
+# format of the newer_than parameter, always UTC
+NEWER_THAN_FORMAT = '%Y-%m-%d-%H:%M:%S'
+EPOCH = datetime.datetime(1970, 1, 1)
 
 
 class Incidents(object):
@@ -45,6 +74,170 @@ class Incidents(object):
         params = {'tz': self.console.tz, 'node_id': node_id, 'event_limit': event_limit, 'newer_than': newer_than}
         return self.console.get('incidents/unacknowledged', params, self.parse)
 
+    def sync(self, state_path, node_id=None, event_limit=None, overlap=300):
+        """Get incidents that are new or have changed since the last sync. The newest incident time
+            and the ids of recently seen incidents are kept in a state file, so only incidents newer than
+            the last sync are downloaded, even across process restarts.
+
+        :param state_path: Path of the file used to keep the sync state. Created if it doesn't exist, in
+            which case all incidents are returned
+        :param node_id: Sync incidents for a specific node only. Use a separate state file per node
+        :param event_limit: Specify the maximum number of event logs to be returned with the incident.
+        :param overlap: Seconds before the last sync's newest incident from which incidents are fetched
+            again, to allow for incidents that were updated around the time of the last sync
+        :return: List of new or changed Incident objects
+        :rtype: List of :class:`Incident <Incident>` objects
+
+        Usage::
+
+            >>> import canarytools
+            >>> while True:
+            >>>     for incident in console.incidents.sync('/var/lib/canary/incidents.state'):
+            >>>         print(incident.summary, incident.src_host)
+            >>>     time.sleep(60)
+        """
+        state = self._load_sync_state(state_path)
+        incidents = self.all(node_id=node_id, event_limit=event_limit,
+                             newer_than=self._sync_newer_than(state, overlap))
+        return self._sync_changes(state_path, state, incidents, overlap)
+
+    def _sync_newer_than(self, state, overlap):
+        """The ``newer_than`` parameter fetching the incidents since the last sync
+
+        :param state: The sync state
+        :param overlap: Seconds before the last sync's newest incident to fetch again
+        :return: A date like '2019-12-25-12:00:00', ``None`` on the first sync
+        """
+        if state['watermark'] is None:
+            return None
+        return (EPOCH + datetime.timedelta(seconds=state['watermark'] - overlap)).strftime(NEWER_THAN_FORMAT)
+
+    def _sync_changes(self, state_path, state, incidents, overlap):
+        """Pick the new or changed incidents out of those fetched, and save the updated sync state
+
+        :param state_path: Path of the state file
+        :param state: The sync state
+        :param incidents: Incidents fetched since the last sync
+        :param overlap: Seconds before the newest incident to keep tracking incidents
+        :return: List of new or changed Incident objects
+        """
+        seen = state['seen']
+        watermark = state['watermark']
+        changed = list()
+        for incident in incidents:
+            updated = getattr(incident, 'updated_std', None) or getattr(incident, 'created_std', None)
+            timestamp = _epoch(updated)
+            signature = str(updated)
+
+            previous = seen.get(incident.id)
+            if previous is None or previous[0] != signature:
+                changed.append(incident)
+            seen[incident.id] = [signature, timestamp]
+
+            if timestamp is not None and (watermark is None or timestamp > watermark):
+                watermark = timestamp
+
+        # incidents before the overlap window won't be fetched again, so stop tracking them
+        if watermark is not None:
+            cutoff = watermark - overlap
+            seen = dict((incident_id, value) for incident_id, value in seen.items()
+                        if value[1] is None or value[1] >= cutoff)
+
+        self._save_sync_state(state_path, {'watermark': watermark, 'seen': seen})
+        return changed
+
+    def _load_sync_state(self, state_path):
+        """Load the sync state, a new state if the file doesn't exist
+
+        :param state_path: Path of the state file
+        :return: Dictionary with the ``watermark`` epoch time and the ``seen`` incidents
+        """
+        try:
+            with open(state_path) as f:
+                state = json.load(f)
+        except (IOError, OSError):
+            return {'watermark': None, 'seen': dict()}
+        except ValueError:
+            raise IncidentError("Incident sync state file '{path}' is corrupt".format(path=state_path))
+        return {'watermark': state.get('watermark'), 'seen': state.get('seen', dict())}
+
+    def _save_sync_state(self, state_path, state):
+        """Save the sync state. Written to a temporary file first, so an interrupted write can't
+            corrupt the previous state
+
+        :param state_path: Path of the state file
+        :param state: Dictionary with the ``watermark`` and the ``seen`` incidents
+        """
+        tmp_path = '{path}.tmp'.format(path=state_path)
+        with open(tmp_path, 'w') as f:
+            json.dump(state, f)
+        getattr(os, 'replace', os.rename)(tmp_path, state_path)
+
+    def unacknowledged_index(self, node_id=None, event_limit=None, newer_than=None, lazy=False):
+        """Get an index of unacknowledged incidents, keyed by node id and incident id.
+            Fetches the unacknowledged incidents once so they can be looked up for
+            many devices without further requests.
+
+        :param node_id: Index unacknowledged incidents for a specific node only
+        :param event_limit: Specify the maximum number of event logs to be returned with the incident.
+        :param str newer_than: limit to incidents newer than a date like '2019-12-25-12:00:00' (UTC)
+        :param lazy: Defer fetching the incidents until the index is first used
+        :return: An index of unacknowledged incidents
+        :rtype: :class:`IncidentIndex <IncidentIndex>` object
+
+        Usage::
+
+            >>> import canarytools
+            >>> index = console.incidents.unacknowledged_index()
+            >>> incidents = index.for_node('0000000000231c23')
+        """
+        def loader():
+            return self.unacknowledged(node_id=node_id, event_limit=event_limit, newer_than=newer_than)
+
+        if lazy:
+            return IncidentIndex(loader=loader)
+        return IncidentIndex(incidents=loader())
+
+    def iter_all(self, node_id=None, event_limit=None, newer_than=None):
+        """Iterate over all incidents for this console. The response is parsed as it is downloaded
+            and incidents are yielded one at a time, so memory use doesn't grow with the number of incidents.
+
+        :param node_id: Get all incidents for a specific node
+        :param event_limit: Specify the maximum number of event logs to be returned with the incident.
+        :param str newer_than: limit to incidents newer than a date like '2019-12-25-12:00:00' (UTC)
+        :return: Generator of Incident objects
+        :rtype: Generator of :class:`Incident <Incident>` objects
+
+        Usage::
+
+            >>> import canarytools
+            >>> for incident in console.incidents.iter_all():
+            >>>     print(incident.summary)
+        """
+        params = {'tz': self.console.tz, 'node_id': node_id, 'event_limit': event_limit, 'newer_than': newer_than}
+        for incident in self.console.stream('incidents/all', params, 'incidents'):
+            yield self.parse_incident(incident)
+
+    def iter_unacknowledged(self, node_id=None, event_limit=None, newer_than=None):
+        """Iterate over all unacknowledged incidents for this console. The response is parsed as it is
+            downloaded and incidents are yielded one at a time.
+
+        :param node_id: Get all unacknowledged incidents for a specific node
+        :param event_limit: Specify the maximum number of event logs to be returned with the incident.
+        :param str newer_than: limit to incidents newer than a date like '2019-12-25-12:00:00' (UTC)
+        :return: Generator of Incident objects
+        :rtype: Generator of :class:`Incident <Incident>` objects
+
+        Usage::
+
+            >>> import canarytools
+            >>> for incident in console.incidents.iter_unacknowledged():
+            >>>     print(incident.summary)
+        """
+        params = {'tz': self.console.tz, 'node_id': node_id, 'event_limit': event_limit, 'newer_than': newer_than}
+        for incident in self.console.stream('incidents/unacknowledged', params, 'incidents'):
+            yield self.parse_incident(incident)
+
     def acknowledged(self, node_id=None, event_limit=None, newer_than=None):
         """Get list of all acknowledged incidents for a console.
 
@@ -149,6 +342,159 @@ class Incidents(object):
         params = {'node_id': node_id, 'src_host': src_host, 'older_than': older_than}
         return self.console.post('incidents/delete', params)
 
+    def acknowledge_many(self, incidents, max_workers=8, refresh=False):
+        """Acknowledge a list of incidents, several at a time. Incident objects aren't refreshed
+            after each call.
+
+        :param incidents: List of incident ids or Incident objects
+        :param max_workers: Maximum number of requests made at the same time
+        :param refresh: Update the Incident objects passed in from a single listing of acknowledged
+            incidents once all calls are done. Otherwise only their ``acknowledged`` attribute is set
+            and they're marked stale. The listing only goes back to the oldest incident passed in, and is
+            limited to their device if they're all from one
+        :return: Dictionary of :class:`Result <Result>` objects keyed by incident id. A failed call
+            doesn't stop the others; its result is 'error', with the exception as its ``error`` attribute
+
+        Calls are only made in parallel when the console's transport is thread-safe, e.g. a console
+        created with ``thread_safe=True``. Otherwise they're made one at a time.
+
+        Usage::
+
+            >>> import canarytools
+            >>> results = console.incidents.acknowledge_many(['incident:ftplogin:0e4b47', 'incident:sshlogin:1a2b3c'])
+            >>> failed = [incident_id for incident_id, result in results.items() if result.result != 'success']
+        """
+        return self._bulk(self.console.post, 'incident/acknowledge', incidents, max_workers,
+                          self.acknowledged if refresh else None, acknowledged=True)
+
+    def unacknowledge_many(self, incidents, max_workers=8, refresh=False):
+        """Unacknowledge a list of incidents, several at a time. Incident objects aren't refreshed
+            after each call.
+
+        :param incidents: List of incident ids or Incident objects
+        :param max_workers: Maximum number of requests made at the same time
+        :param refresh: Update the Incident objects passed in from a single listing of unacknowledged
+            incidents once all calls are done. Otherwise only their ``acknowledged`` attribute is set
+            and they're marked stale. The listing only goes back to the oldest incident passed in, and is
+            limited to their device if they're all from one
+        :return: Dictionary of :class:`Result <Result>` objects keyed by incident id. A failed call
+            doesn't stop the others; its result is 'error', with the exception as its ``error`` attribute
+
+        Calls are only made in parallel when the console's transport is thread-safe.
+
+        Usage::
+
+            >>> import canarytools
+            >>> results = console.incidents.unacknowledge_many(incident_ids)
+        """
+        return self._bulk(self.console.post, 'incident/unacknowledge', incidents, max_workers,
+                          self.unacknowledged if refresh else None, acknowledged=False)
+
+    def delete_many(self, incidents, max_workers=8):
+        """Delete a list of acknowledged incidents, several at a time
+
+        :param incidents: List of incident ids or Incident objects
+        :param max_workers: Maximum number of requests made at the same time
+        :return: Dictionary of :class:`Result <Result>` objects keyed by incident id. A failed call
+            doesn't stop the others; its result is 'error', with the exception as its ``error`` attribute
+
+        Calls are only made in parallel when the console's transport is thread-safe.
+
+        Usage::
+
+            >>> import canarytools
+            >>> results = console.incidents.delete_many(incident_ids)
+        """
+        return self._bulk(self.console.delete, 'incident/delete', incidents, max_workers)
+
+    def _bulk(self, request, url, incidents, max_workers, listing=None, acknowledged=None):
+        """Call a single incident endpoint for many incidents, in parallel if the console's transport
+            is thread-safe
+
+        :param request: The console method making the call
+        :param url: Url of the API endpoint
+        :param incidents: List of incident ids or Incident objects
+        :param max_workers: Maximum number of requests made at the same time
+        :param listing: Function returning the incidents used to update the Incident objects afterwards,
+            called with the ``node_id`` and ``newer_than`` parameters of :meth:`_listing_params`
+        :param acknowledged: Without a listing, the ``acknowledged`` value set on the Incident objects
+            whose call succeeded. They're marked stale
+        :return: Dictionary of Result objects keyed by incident id
+        """
+        incidents = list(incidents)
+        incident_ids = [getattr(incident, 'id', incident) for incident in incidents]
+        if not incident_ids:
+            return dict()
+
+        def call(incident_id):
+            try:
+                return request(url, {'incident': incident_id})
+            except Exception as e:
+                return self._error_result(e)
+
+        workers = max(1, min(max_workers, len(incident_ids)))
+        transport = getattr(self.console, 'transport', None)
+        if workers == 1 or not getattr(transport, 'thread_safe', False):
+            # the requests would share one session, which isn't safe across threads
+            results = dict((incident_id, call(incident_id)) for incident_id in incident_ids)
+        else:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                results = dict(zip(incident_ids, executor.map(call, incident_ids)))
+
+        if listing is not None:
+            params = self._listing_params(incidents)
+            if params is not None:
+                self._refresh_from(incidents, listing(**params))
+        elif acknowledged is not None:
+            self._acknowledged_locally(incidents, results, acknowledged)
+        return results
+
+    def _listing_params(self, incidents):
+        """Parameters narrowing the listing that refreshes Incident objects to what's needed: incidents
+            since the oldest one, from their device if they all come from one
+
+        :param incidents: List of incident ids or Incident objects
+        :return: Dictionary with the ``node_id`` and ``newer_than`` parameters, ``None`` if there are no
+            Incident objects to refresh
+        """
+        objects = [incident for incident in incidents if isinstance(incident, BaseIncident)]
+        if not objects:
+            return None
+
+        node_ids = set(getattr(incident, 'node_id', None) for incident in objects)
+        node_id = node_ids.pop() if len(node_ids) == 1 else None
+
+        created = [_epoch(getattr(incident, 'created_std', None)) for incident in objects]
+        newer_than = None
+        if None not in created:
+            # a second earlier, as the listing's times have no fractions of seconds
+            newer_than = (EPOCH + datetime.timedelta(seconds=min(created) - 1)).strftime(NEWER_THAN_FORMAT)
+        return {'node_id': node_id, 'newer_than': newer_than}
+
+    def _error_result(self, error):
+        """Result of a failed call in a bulk operation"""
+        result = Result(self.console, {'result': 'error', 'message': str(error)})
+        result.error = error
+        return result
+
+    def _acknowledged_locally(self, incidents, results, acknowledged, stale=True):
+        """Update Incident objects whose (un)acknowledge call succeeded, without refreshing them"""
+        for incident in incidents:
+            if isinstance(incident, BaseIncident) and getattr(results.get(incident.id), 'error', None) is None:
+                incident._acknowledged_locally(acknowledged, stale=stale)
+
+    def _refresh_from(self, incidents, fetched):
+        """Update Incident objects from a listing
+
+        :param incidents: List of incident ids or Incident objects. Ids are skipped
+        :param fetched: List of freshly fetched Incident objects
+        """
+        by_id = dict((incident.id, incident) for incident in fetched)
+        for incident in incidents:
+            new_incident = by_id.get(getattr(incident, 'id', None))
+            if new_incident is not None and isinstance(incident, BaseIncident):
+                incident._update(new_incident)
+
     def get_incident(self, incident_id):
         """Get an Incident.
 
@@ -176,49 +522,170 @@ class Incidents(object):
         if data and 'incidents' in data:
             # loop over each incident in the JSON response
             for incident in data['incidents']:
-                if incident['summary'] in INCIDENT_MAP:
-                    incidents.append(INCIDENT_MAP[incident['summary']].parse(
-                        self.console, incident))
-                else:
-                    incidents.append(INCIDENT_MAP['Default'].parse(
-                        self.console, incident))
+                incidents.append(self.parse_incident(incident))
         elif data and 'incident' in data:
             data = data['incident']
-            if data['description'] in INCIDENT_MAP:
-                return INCIDENT_MAP[data['description']].parse(
-                    self.console, data)
-            else:
-                return INCIDENT_MAP['Default'].parse(self.console, data)
+            return self.incident_class(data['description']).parse(self.console, data)
 
         return incidents
 
+    def parse_incident(self, data):
+        """Parse the JSON data of a single incident from an incident listing
 
-class Incident(CanaryToolsBase):
-    def __init__(self, console, data):
-        """Initialize Incident Object
+        :param data: JSON data of the incident
+        :return: An Incident object of the class matching the incident's summary
+        """
+        return self.incident_class(data['summary']).parse(self.console, data)
 
-        **Attributes:**
-            - **id (str)** -- The identification code of the incident
-            - **description (str)** -- The event description of the incident
-            - **flock_id (str)** -- The id of the flock this incident belongs to
-            - **acknowledged (bool)** -- Has the incident been acknowledged?
-            - **events (list)** -- List of events
-            - **logtype (str)** -- Log type
-            - **summary (str)** -- The event description of the incident
+    def incident_class(self, name):
+        """Get the Incident class used for an incident
 
-        **Subclasses:**
-            List of classes which extend this base class.
+        :param name: The summary or description of the incident
+        :return: The Incident subclass, or CompactIncident if the console uses compact models
+        """
+        if getattr(self.console, 'compact_models', False):
+            return CompactIncident
+        return INCIDENT_MAP.get(name, INCIDENT_MAP['Default'])
 
-            ``IncidentDeviceReconnected``, ``IncidentDeviceDied``, ``IncidentFTPLogin``, ``IncidentHTTPLogin``,
-            ``IncidentHTTPLoad``, ``IncidentSSHLogin``, ``IncidentTelnetLogin``, ``IncidentHTTPProxyRequest``,
-            ``IncidentMySQLLogin``, ``IncidentMSSQLLogin``, ``IncidentTFTPRequest``, ``IncidentNmapOSScan``,
-            ``IncidentNmapNULLScan``, ``IncidentNmapXMASScan``, ``IncidentNTPMonlist``, ``IncidentVNCLogin``,
-            ``IncidentGitCloneRequest``, ``IncidentTCPBannerRequest``, ``IncidentModbusRequest``, ``IncidentRedisCommand``,
-            ``IncidentUser``, ``IncidentSNMPRequest``, ``IncidentSIPRequest``, ``IncidentSMBFileOpen``, ``IncidentCanarytokenTriggered``,
-            ``IncidentHostPortScan``, ``IncidentNetworkPortScan``, ``IncidentConsolidatedNetworkPortScan``
 
+def _epoch(value):
+    """Convert an incident time to epoch seconds
+
+    :param value: A timezone aware datetime
+    :return: Epoch seconds, ``None`` if the value isn't a datetime
+    """
+    if not isinstance(value, datetime.datetime) or value.utcoffset() is None:
+        return None
+    utc = (value - value.utcoffset()).replace(tzinfo=None)
+    return (utc - EPOCH).total_seconds()
+
+
+class IncidentIndex(object):
+    def __init__(self, incidents=None, loader=None):
+        """Index of incidents by node id and incident id
+
+        :param incidents: List of Incident objects to index
+        :param loader: Function returning a list of Incident objects. Called once,
+            the first time the index is used, and again on the next use if it raised
         """
-        super(Incident, self).__init__(console, data)
+        self.by_id = dict()
+        self.by_node = dict()
+        self._loader = loader
+        self._lock = threading.Lock()
+        if incidents:
+            self.add(incidents)
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state['_lock']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def add(self, incidents):
+        """Add incidents to the index
+
+        :param incidents: List of Incident objects
+        """
+        for incident in incidents:
+            self.by_id[incident.id] = incident
+            node_id = getattr(incident, 'node_id', None)
+            self.by_node.setdefault(node_id, dict())[incident.id] = incident
+
+    def load(self):
+        """Fetch the indexed incidents if the index was created lazily"""
+        if self._loader is not None:
+            # devices of one listing share the index, and may be read from several threads
+            with self._lock:
+                loader = self._loader
+                if loader is not None:
+                    # a failed load raises and leaves the loader, so the next access tries again
+                    self.add(loader())
+                    # cleared last, so other threads wait until the index is filled
+                    self._loader = None
+
+    def get(self, incident_id, default=None):
+        """Look up an incident by id
+
+        :param incident_id: The id of the incident
+        :param default: Returned if the incident is not in the index
+        :return: An Incident object
+        """
+        self.load()
+        return self.by_id.get(incident_id, default)
+
+    def for_node(self, node_id, incident_ids=None):
+        """Get the incidents for a node
+
+        :param node_id: The node id of the device
+        :param incident_ids: Only return incidents with these ids, in this order
+        :return: List of Incident objects
+        """
+        self.load()
+        node_incidents = self.by_node.get(node_id, dict())
+        if incident_ids is None:
+            return list(node_incidents.values())
+        return [node_incidents[incident_id] for incident_id in incident_ids
+                if incident_id in node_incidents]
+
+    def __len__(self):
+        self.load()
+        return len(self.by_id)
+
+
+class EventList(Sequence):
+    def __init__(self, console, events, event_class):
+        """The events of an incident. Event objects are only built when they're indexed or
+            iterated over, and then kept.
+
+        :param console: The Console from which API calls are made
+        :param events: List of the events' JSON data
+        :param event_class: The class used to build each event
+
+        **Attributes:**
+            - **raw (list)** -- The events' JSON data, for consumers that don't need Event objects
+        """
+        self.console = console
+        self.raw = events
+        self.event_class = event_class
+        self._events = [None] * len(events)
+
+    def __len__(self):
+        return len(self.raw)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self.raw)))]
+        event = self._events[index]
+        if event is None:
+            event = self._events[index] = profiled_build(self.console, self.event_class.parse, self.console,
+                                                         self.raw[index])
+        return event
+
+    def __iter__(self):
+        for index in range(len(self.raw)):
+            yield self[index]
+
+    def __eq__(self, other):
+        if isinstance(other, (EventList, list)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __ne__(self, other):
+        result = self.__eq__(other)
+        return result if result is NotImplemented else not result
+
+    __hash__ = None
+
+    def __repr__(self):
+        return "<EventList of {count} events>".format(count=len(self.raw))
+
+
+class BaseIncident(CanaryToolsBase):
+    """Behaviour shared by :class:`Incident <Incident>` and :class:`CompactIncident <CompactIncident>`"""
+    __slots__ = ()
 
     def __setattr__(self, key, value):
         """Override function on base class. This will be used to do any
@@ -226,17 +693,13 @@ class Incident(CanaryToolsBase):
             to Event objects.
         """
         # Set only specified fields as attributes
-        if key not in ['console', 'id', 'description', 'summary', 'logtype', 'events', \
-                       'acknowledged', 'dst_host', 'src_host', 'node_id', 'dst_port', \
-                       'src_port', 'created_std', 'updated_std', 'flock_id']:
+        if key not in INCIDENT_FIELDS:
             return
 
-        # if the key is events parse list of events parse events
+        # events are built from their JSON data when first used
         if 'events' == key:
-            events = list()
-            for event in value:
-                events.append(Event.parse(self.console, event))
-            value = events
+            event_class = CompactEvent if isinstance(self, CompactModel) else Event
+            value = EventList(self.console, value, event_class)
 
         # flatten description key
         if 'description' == key and isinstance(value, dict):
@@ -249,15 +712,12 @@ class Incident(CanaryToolsBase):
         if key in ['acknowledged']:
             value = value == 'True'
 
-        if key in set(('created_std', 'updated_std')):
-            try:
-                # time format string defined in standardise_datetime on the Console
-                value = datetime.datetime.strptime(value, "%Y-%m-%d %H:%M:%S %Z%z")
-            except ValueError:
-                # leave it as a string
-                pass
+        if key in ('created_std', 'updated_std'):
+            # unparseable values are left as strings
+            self._store_timestamp(key, value, strict=False)
+            return
 
-        super(Incident, self).__setattr__(key, value)
+        super(BaseIncident, self).__setattr__(key, value)
 
     def __str__(self):
         """Helper method
@@ -265,9 +725,11 @@ class Incident(CanaryToolsBase):
         return "[{type}] acknowledged: {acked};".format(
             type=self.__class__.__name__, acked=self.acknowledged)
 
-    def unacknowledge(self):
+    def unacknowledge(self, refresh=True):
         """Mark incident as unacknowledged
 
+        :param refresh: Refresh the incident afterwards. If ``False`` only ``acknowledged`` is updated and
+            the incident is marked :attr:`stale`, costing one request instead of two
         :return: Result indicator of the API call
         :rtype: :class:`Result <Result>` object
 
@@ -280,13 +742,18 @@ class Incident(CanaryToolsBase):
         params = {'incident': self.id}
         r = self.console.post('incident/unacknowledge', params)
 
-        self.refresh()
+        if refresh:
+            self.refresh()
+        else:
+            self._acknowledged_locally(False)
 
         return r
 
-    def acknowledge(self):
+    def acknowledge(self, refresh=True):
         """Mark incident as acknowledged
 
+        :param refresh: Refresh the incident afterwards. If ``False`` only ``acknowledged`` is updated and
+            the incident is marked :attr:`stale`, costing one request instead of two
         :return: Result indicator of the API call
         :rtype: :class:`Result <Result>` objects
 
@@ -299,10 +766,30 @@ class Incident(CanaryToolsBase):
         params = {'incident': self.id}
         r = self.console.post('incident/acknowledge', params)
 
-        self.refresh()
+        if refresh:
+            self.refresh()
+        else:
+            self._acknowledged_locally(True)
 
         return r
 
+    @property
+    def stale(self):
+        """``True`` if the incident was changed without being refreshed. A stale incident refreshes itself
+            the first time an attribute it doesn't have is accessed, or use :meth:`refresh`
+        """
+        return getattr(self, '_stale', False)
+
+    def _acknowledged_locally(self, acknowledged, stale=True):
+        """Update the incident after (un)acknowledging it without a refresh
+
+        :param acknowledged: The new ``acknowledged`` value
+        :param stale: Mark the incident stale, so it refreshes itself when next needed
+        """
+        super(BaseIncident, self).__setattr__('acknowledged', acknowledged)
+        if stale:
+            self._mark_stale('updated_std')
+
     def delete(self):
         """Delete incident
 
@@ -335,71 +822,104 @@ class Incident(CanaryToolsBase):
         incidents = Incidents(self.console)
         new_incident = incidents.get_incident(incident_id=self.id)
 
-        self.__dict__.update(new_incident.__dict__)
+        self._update(new_incident)
 
     def to_dict(self):
         """Convert incident to a dictionary format
 
-        :return: Dictionary value of incident
+        :return: Dictionary value of incident. The incident itself isn't modified
         :rtype:  <type 'dict'>
         """
-        incident_dict = self.__dict__
-        if 'console' in incident_dict.keys():
-            incident_dict.pop('console')
-
-        events_list = []
-        for event in incident_dict['events']:
-            if type(event) != dict:
-                event_dict = event.to_dict()
-                events_list.append(event_dict)
+        incident_dict = self._attributes(private=False)
+        incident_dict.pop('console', None)
 
-        if events_list != []:
-            incident_dict['events'] = events_list
+        incident_dict['events'] = [event if type(event) == dict else event.to_dict()
+                                   for event in incident_dict['events']]
 
         return incident_dict
 
-class Event(CanaryToolsBase):
+
+class Incident(BaseIncident):
     def __init__(self, console, data):
-        """An event contains all the details relating to a incident occurence.
+        """Initialize Incident Object
 
-        :param console: The Console from which API calls are made
-        :param data: JSON data
+        **Attributes:**
+            - **id (str)** -- The identification code of the incident
+            - **description (str)** -- The event description of the incident
+            - **flock_id (str)** -- The id of the flock this incident belongs to
+            - **acknowledged (bool)** -- Has the incident been acknowledged?
+            - **events (EventList)** -- Sequence of events, see :class:`EventList <EventList>`
+            - **logtype (str)** -- Log type
+            - **summary (str)** -- The event description of the incident
+
+        **Subclasses:**
+            List of classes which extend this base class.
+
+            ``IncidentDeviceReconnected``, ``IncidentDeviceDied``, ``IncidentFTPLogin``, ``IncidentHTTPLogin``,
+            ``IncidentHTTPLoad``, ``IncidentSSHLogin``, ``IncidentTelnetLogin``, ``IncidentHTTPProxyRequest``,
+            ``IncidentMySQLLogin``, ``IncidentMSSQLLogin``, ``IncidentTFTPRequest``, ``IncidentNmapOSScan``,
+            ``IncidentNmapNULLScan``, ``IncidentNmapXMASScan``, ``IncidentNTPMonlist``, ``IncidentVNCLogin``,
+            ``IncidentGitCloneRequest``, ``IncidentTCPBannerRequest``, ``IncidentModbusRequest``, ``IncidentRedisCommand``,
+            ``IncidentUser``, ``IncidentSNMPRequest``, ``IncidentSIPRequest``, ``IncidentSMBFileOpen``, ``IncidentCanarytokenTriggered``,
+            ``IncidentHostPortScan``, ``IncidentNetworkPortScan``, ``IncidentConsolidatedNetworkPortScan``
 
-        For a more detailed list of event attributes see :ref:`incidents-events-ref`
         """
-        super(Event, self).__init__(console, data)
+        super(Incident, self).__init__(console, data)
+
+
+class CompactIncident(BaseIncident, CompactModel):
+    """An Incident keeping its fields in ``__slots__``. Built instead of :class:`Incident <Incident>`
+        when the console uses compact models. Attribute access and ``to_dict()`` are the same as for
+        Incident objects; use ``summary`` rather than the Incident subclass to tell incident types apart.
+    """
+    __slots__ = INCIDENT_FIELDS + ('_extra',)
+
+
+class BaseEvent(CanaryToolsBase):
+    """Behaviour shared by :class:`Event <Event>` and :class:`CompactEvent <CompactEvent>`"""
+    __slots__ = ()
+
+    def __init__(self, console, data):
+        # a consolidated port scan keys each scanned port by its number, collect them in one go
+        ports = None
+        if type(data) is dict:
+            ports = dict((key, value) for key, value in data.items() if key.isdigit())
+            if ports:
+                data = dict((key, value) for key, value in data.items() if key not in ports)
+
+        super(BaseEvent, self).__init__(console, data)
+
+        if ports:
+            self.ports_scanned = PortSet.from_dict(ports)
 
     def __setattr__(self, key, value):
         """ Override base class function
         """
         # key's are integers, probably a consolidated port scan
-        if self.is_int(key):
-            if not hasattr(self, 'ports_scanned'):
-                ports_scanned = {key: value}
-                self.ports_scanned = ports_scanned
-                return
-            else:
-                self.ports_scanned[key] = value
-                return
+        if key.isdigit():
+            ports_scanned = getattr(self, 'ports_scanned', None)
+            if ports_scanned is None:
+                ports_scanned = PortSet()
+            data = ports_scanned.to_dict()
+            data[key] = value
+            super(BaseEvent, self).__setattr__('ports_scanned', PortSet.from_dict(data))
+            return
 
         if key in ['timestamp']:
             return
 
         if 'timestamp_std' == key:
-            key = key[:-4]
-            if value:
-                value = parse(value)
-            else:
-                value = None
+            self._store_timestamp(key[:-4], value)
+            return
 
-        super(Event, self).__setattr__(key.lower(), value)
+        super(BaseEvent, self).__setattr__(key.lower(), value)
 
     def __str__(self):
         """Helper method
         """
         time = None
         event_info = ""
-        for key, value in vars(self).items():
+        for key, value in self._attributes(private=False).items():
             # exclude these from the string
             if 'console' == key:
                 continue
@@ -429,6 +949,8 @@ class Event(CanaryToolsBase):
 
         :return: Shortened version of value
         """
+        if isinstance(value, PortSet):
+            value = str(value)
         if len(value) > 25:
             return value[:25] + "... {trimmed}"
         return value
@@ -436,11 +958,11 @@ class Event(CanaryToolsBase):
     def to_dict(self):
         """Convert event to a dictionary format
 
-        :return: Dictionary value of event
+        :return: Dictionary value of event. The event itself isn't modified
         :rtype:  <type 'dict'>
         """
-        event_dict = self.__dict__
-        event_dict.pop('console')
+        event_dict = self._attributes(private=False)
+        event_dict.pop('console', None)
 
         # It's likely by mistake that we expliclitly include and reformat timestamp field here. This method otherwise
         # transparently passes on the Event dict. This breaks on the ConsolidatedNetworkPortscan event, whose details
@@ -449,8 +971,31 @@ class Event(CanaryToolsBase):
         if 'timestamp' in event_dict:
             event_dict['timestamp'] = event_dict['timestamp'].strftime('%Y-%m-%d %H:%M:%S')
 
+        if isinstance(event_dict.get('ports_scanned'), PortSet):
+            event_dict['ports_scanned'] = event_dict['ports_scanned'].to_dict()
+
         return event_dict
 
+
+class Event(BaseEvent):
+    def __init__(self, console, data):
+        """An event contains all the details relating to a incident occurence.
+
+        :param console: The Console from which API calls are made
+        :param data: JSON data
+
+        For a more detailed list of event attributes see :ref:`incidents-events-ref`
+        """
+        super(Event, self).__init__(console, data)
+
+
+class CompactEvent(BaseEvent, CompactModel):
+    """An Event keeping the fields shared by nearly every event in ``__slots__`` and any others in a
+        small overflow tuple. Built for the events of a :class:`CompactIncident <CompactIncident>`.
+    """
+    __slots__ = EVENT_FIELDS + ('_extra',)
+
+
 class IncidentDeviceReconnected(Incident):
     """Canary Reconnected"""
 
@@ -0,0 +1,227 @@
+import binascii
+
+from array import array
+from bisect import bisect_left
+
+MAX_PORT = 65535
+
+# below this many ports the bitmap is built one bit at a time
+BITMAP_LOOP_LIMIT = 64
+
+
+class PortSet(object):
+    __slots__ = ('ports', '_values')
+
+    def __init__(self, ports=(), values=None):
+        """A set of TCP/UDP ports, e.g. those scanned in a consolidated port scan. Ports are kept as a
+            sorted array of 16 bit integers with an optional value per port kept alongside. Set operations
+            (``|``, ``&``, ``-``, ``^``) work on 65536 bit bitmaps and return PortSets without values.
+
+        A PortSet also reads like the dictionary of values keyed by port string that the console sends,
+        and that ``ports_scanned`` used to be: iterating and ``keys()`` give port strings, ``values()`` and
+        ``items()`` are in the same order, and lookups and assignments take a port number or port string.
+        Use ``ports`` for the port numbers. PortSets are equal when their ports and values are.
+
+        :param ports: Iterable of port numbers
+        :param values: List of values, one per port in the same order as ``ports``
+
+        :except ValueError: A port is out of range
+
+        **Attributes:**
+            - **ports (array)** -- The port numbers in ascending order
+
+        Usage::
+
+            >>> import canarytools
+            >>> scans = [event.ports_scanned for incident in console.incidents.unacknowledged()
+            >>>          for event in incident.events if hasattr(event, 'ports_scanned')]
+            >>> fleet = canarytools.PortSet.union_all(scans)
+            >>> len(fleet), 22 in fleet
+            (1204, True)
+        """
+        if values is None:
+            ports = sorted(set(int(port) for port in ports))
+        else:
+            # the last value of a repeated port wins
+            by_port = dict(zip((int(port) for port in ports), values))
+            ports = sorted(by_port)
+            values = tuple(by_port[port] for port in ports)
+        if ports and (ports[0] < 0 or ports[-1] > MAX_PORT):
+            raise ValueError('Ports must be between 0 and {max}'.format(max=MAX_PORT))
+        self.ports = array('H', ports)
+        self._values = values
+
+    @classmethod
+    def from_dict(cls, data):
+        """Create a PortSet from a dictionary of values keyed by port, e.g. a consolidated port scan's JSON data
+
+        :param data: Dictionary of values keyed by port number or port string
+        :return: A PortSet object
+        """
+        return cls(list(data.keys()), list(data.values()))
+
+    @classmethod
+    def from_bits(cls, bits):
+        """Create a PortSet from a bitmap
+
+        :param bits: Integer with bit ``n`` set for each port ``n``
+        :return: A PortSet object
+        """
+        portset = cls()
+        # least significant bit first
+        flags = bin(bits)[:1:-1]
+        ports = list()
+        port = flags.find('1')
+        while port != -1:
+            ports.append(port)
+            port = flags.find('1', port + 1)
+        portset.ports = array('H', ports)
+        return portset
+
+    @classmethod
+    def union_all(cls, portsets):
+        """Union of many PortSets, e.g. the ports scanned across a fleet
+
+        :param portsets: Iterable of PortSet objects
+        :return: A PortSet object
+        """
+        ports = set()
+        for portset in portsets:
+            ports.update(portset.ports)
+        return cls(ports)
+
+    @property
+    def bits(self):
+        """The set as a bitmap, with bit ``n`` set for each port ``n``"""
+        if len(self.ports) < BITMAP_LOOP_LIMIT:
+            bits = 0
+            for port in self.ports:
+                bits |= 1 << port
+            return bits
+        # little endian bytes, so byte n holds ports 8n to 8n + 7
+        flags = bytearray((MAX_PORT + 1) // 8)
+        for port in self.ports:
+            flags[port >> 3] |= 1 << (port & 7)
+        flags.reverse()
+        return int(binascii.hexlify(flags), 16)
+
+    def get(self, port, default=None):
+        """Get the value of a port
+
+        :param port: Port number or port string
+        :param default: Returned if the port isn't in the set or the set has no values
+        :return: The port's value
+        """
+        index = self._index(port)
+        if index is None or self._values is None:
+            return default
+        return self._values[index]
+
+    def keys(self):
+        """Get the ports as strings, like the keys of the console's JSON data
+
+        :return: List of port strings in ascending port order
+        """
+        return [str(port) for port in self.ports]
+
+    def values(self):
+        """Get the values of the ports
+
+        :return: List of values in ascending port order. Values are ``None`` if the set has no values
+        """
+        if self._values is None:
+            return [None] * len(self.ports)
+        return list(self._values)
+
+    def items(self):
+        """Get the ports and their values
+
+        :return: List of ``(port string, value)`` tuples in ascending port order. Values are ``None`` if
+            the set has no values
+        """
+        return list(zip(self.keys(), self.values()))
+
+    def to_dict(self):
+        """Convert to a dictionary of values keyed by port string, the format of the console's JSON data
+
+        :return: Dictionary of values
+        :rtype: <type 'dict'>
+        """
+        return dict(self.items())
+
+    def _index(self, port):
+        try:
+            port = int(port)
+        except (TypeError, ValueError):
+            return None
+        index = bisect_left(self.ports, port)
+        if index < len(self.ports) and self.ports[index] == port:
+            return index
+        return None
+
+    def __getitem__(self, port):
+        index = self._index(port)
+        if index is None:
+            raise KeyError(port)
+        return self._values[index] if self._values is not None else None
+
+    def __setitem__(self, port, value):
+        port = int(port)
+        if port < 0 or port > MAX_PORT:
+            raise ValueError('Ports must be between 0 and {max}'.format(max=MAX_PORT))
+        values = self.values()
+        index = self._index(port)
+        if index is None:
+            index = bisect_left(self.ports, port)
+            self.ports.insert(index, port)
+            values.insert(index, value)
+        else:
+            values[index] = value
+        self._values = tuple(values)
+
+    def __contains__(self, port):
+        return self._index(port) is not None
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def __len__(self):
+        return len(self.ports)
+
+    def __or__(self, other):
+        return PortSet.from_bits(self.bits | other.bits)
+
+    def __and__(self, other):
+        return PortSet.from_bits(self.bits & other.bits)
+
+    def __sub__(self, other):
+        return PortSet.from_bits(self.bits & ~other.bits)
+
+    def __xor__(self, other):
+        return PortSet.from_bits(self.bits ^ other.bits)
+
+    def __eq__(self, other):
+        if isinstance(other, PortSet):
+            return self.ports == other.ports and self.values() == other.values()
+        if isinstance(other, dict):
+            return self.to_dict() == other
+        return NotImplemented
+
+    def __ne__(self, other):
+        result = self.__eq__(other)
+        return result if result is NotImplemented else not result
+
+    __hash__ = None
+
+    def __getstate__(self):
+        return self.ports.tolist(), self._values
+
+    def __setstate__(self, state):
+        ports, self._values = state
+        self.ports = array('H', ports)
+
+    def __repr__(self):
+        ports = ', '.join(str(port) for port in self.ports[:10])
+        if len(self.ports) > 10:
+            ports += ', ... {count} more'.format(count=len(self.ports) - 10)
+        return "PortSet([{ports}])".format(ports=ports)
@@ -0,0 +1,131 @@
+import time
+
+from concurrent.futures import ThreadPoolExecutor
+
+from .console import Console
+
+
+class PoolResult(object):
+    def __init__(self, console, result=None, error=None, elapsed=None):
+        """The outcome of running a query against a single console
+
+        :param console: The Console the query ran against
+
+        **Attributes:**
+            - **console (Console)** -- The Console the query ran against
+            - **result** -- The value returned by the query, ``None`` if it failed
+            - **error (Exception)** -- The exception raised by the query, ``None`` if it succeeded
+            - **elapsed (float)** -- Time taken by the query in seconds
+        """
+        self.console = console
+        self.result = result
+        self.error = error
+        self.elapsed = elapsed
+
+    @property
+    def ok(self):
+        """``True`` if the query succeeded"""
+        return self.error is None
+
+    def __str__(self):
+        """Helper method"""
+        if self.ok:
+            return "[PoolResult] domain: {domain}; ok".format(domain=self.console.domain)
+        return "[PoolResult] domain: {domain}; error: {error}".format(
+            domain=self.console.domain, error=self.error)
+
+
+class ConsolePool(object):
+    def __init__(self, consoles, max_workers=8):
+        """Run the same query across many consoles in parallel
+
+        :param consoles: List of Console objects, or a dictionary of Console objects keyed by name.
+            Consoles in a list are keyed by domain
+        :param max_workers: Maximum number of consoles queried at the same time
+
+        :except ValueError: A list has two consoles of the same domain, e.g. with different API keys.
+            Pass them in a dictionary with a name for each instead
+
+        Usage::
+
+            >>> import canarytools
+            >>> pool = canarytools.ConsolePool([
+            >>>     canarytools.Console(domain='tenant1', api_key='key1'),
+            >>>     canarytools.Console(domain='tenant2', api_key='key2')])
+            >>> results = pool.call('incidents.unacknowledged')
+            >>> for name, result in results.items():
+            >>>     if result.ok:
+            >>>         print(name, len(result.result))
+        """
+        if isinstance(consoles, dict):
+            self.consoles = dict(consoles)
+        else:
+            self.consoles = dict()
+            for console in consoles:
+                if console.domain in self.consoles:
+                    raise ValueError("Two consoles of domain '{domain}', pass a dictionary of consoles keyed by "
+                                     "name instead".format(domain=console.domain))
+                self.consoles[console.domain] = console
+        self.max_workers = max_workers
+
+    @classmethod
+    def from_keys(cls, api_keys, max_workers=8, **kwargs):
+        """Create a pool from API keys
+
+        :param api_keys: Dictionary of API keys keyed by console domain
+        :param max_workers: Maximum number of consoles queried at the same time
+        :param kwargs: Extra arguments used to initialize each :class:`Console <Console>`
+        :return: A ConsolePool object
+        """
+        consoles = dict((domain, Console(domain=domain, api_key=api_key, **kwargs))
+                        for domain, api_key in api_keys.items())
+        return cls(consoles, max_workers=max_workers)
+
+    def map(self, query):
+        """Run a query against every console
+
+        :param query: Function called with each Console object
+        :return: Dictionary of :class:`PoolResult <PoolResult>` objects keyed by console name. A query
+            that raises doesn't stop the others; its exception is stored on its result.
+
+        Usage::
+
+            >>> results = pool.map(lambda console: console.devices.dead())
+        """
+        results = dict()
+        if not self.consoles:
+            return results
+
+        workers = max(1, min(self.max_workers, len(self.consoles)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = dict((name, executor.submit(self._run, console, query))
+                           for name, console in self.consoles.items())
+            for name, future in futures.items():
+                results[name] = future.result()
+        return results
+
+    def call(self, method, *args, **kwargs):
+        """Call the same method on every console
+
+        :param method: Dotted path of the method, relative to the console. e.g. 'incidents.unacknowledged'
+        :param args: Positional arguments passed to the method
+        :param kwargs: Keyword arguments passed to the method
+        :return: Dictionary of :class:`PoolResult <PoolResult>` objects keyed by console name
+
+        Usage::
+
+            >>> results = pool.call('incidents.unacknowledged', node_id='0000000000231c23')
+        """
+        def query(console):
+            target = console
+            for attribute in method.split('.'):
+                target = getattr(target, attribute)
+            return target(*args, **kwargs)
+        return self.map(query)
+
+    def _run(self, console, query):
+        start = time.time()
+        try:
+            return PoolResult(console, result=query(console), elapsed=time.time() - start)
+        except Exception as e:
+            return PoolResult(console, error=e, elapsed=time.time() - start)
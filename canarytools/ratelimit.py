@@ -0,0 +1,58 @@
+import threading
+import time
+
+
+class RateLimiter(object):
+    def __init__(self, rate, burst=None):
+        """Token bucket limiting how fast requests are sent. Tokens are added at ``rate`` per second,
+            up to ``burst``, and every request takes one; requests wait when the bucket is empty.
+            Thread safe, so a Console shared between threads stays within the limit.
+
+        :param rate: Sustained requests per second
+        :param burst: Maximum number of requests sent back to back. Defaults to ``rate``, at least 1
+
+        Usage::
+
+            >>> import canarytools
+            >>> console = canarytools.Console(rate_limit=canarytools.RateLimiter(rate=5, burst=10))
+        """
+        if rate <= 0:
+            raise ValueError('rate must be positive')
+        self.rate = float(rate)
+        self.burst = float(burst if burst is not None else max(1.0, rate))
+        self._tokens = self.burst
+        self._updated = time.time()
+        self._lock = threading.Lock()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state['_lock']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def reserve(self):
+        """Take a token, borrowing from the future if the bucket is empty
+
+        :return: Seconds to wait before sending the request
+        """
+        with self._lock:
+            now = time.time()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    def acquire(self):
+        """Wait until a request may be sent
+
+        :return: Seconds waited
+        """
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+        return wait
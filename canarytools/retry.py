@@ -0,0 +1,94 @@
+import random
+import time
+
+from email.utils import mktime_tz, parsedate_tz
+
+# responses worth another attempt: rate limited, or the console or its proxy is briefly unavailable
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+# methods that can safely be sent twice
+IDEMPOTENT_METHODS = ('GET', 'HEAD', 'DELETE')
+
+# rate limited requests weren't processed, so they're retried whatever the method
+RATE_LIMITED = 429
+
+
+def parse_retry_after(value):
+    """Parse a Retry-After header
+
+    :param value: The header value, either seconds or an HTTP date
+    :return: Seconds to wait, ``None`` if the value is missing or invalid
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    date = parsedate_tz(value)
+    if date is None:
+        return None
+    return max(0.0, mktime_tz(date) - time.time())
+
+
+class RetryPolicy(object):
+    def __init__(self, retries=3, backoff=0.5, max_backoff=30.0, jitter=True, statuses=RETRY_STATUSES,
+                 methods=IDEMPOTENT_METHODS, max_retry_after=120.0):
+        """When and how long to wait before retrying a failed request. Connection errors and the
+            ``statuses`` are retried for idempotent ``methods``. Rate limited (429) requests are retried
+            for any method, as the console didn't process them.
+
+        :param retries: Maximum number of retries after the first attempt
+        :param backoff: Seconds waited before the first retry, doubled for every retry after it
+        :param max_backoff: Maximum seconds waited between attempts
+        :param jitter: Wait a random time between zero and the backoff ("full jitter"), so that many
+            clients retrying at once spread out
+        :param statuses: HTTP status codes that are retried
+        :param methods: HTTP methods retried after connection errors and the ``statuses``
+        :param max_retry_after: Retry-After headers asking for a longer wait than this many seconds
+            aren't retried
+
+        Usage::
+
+            >>> import canarytools
+            >>> console = canarytools.Console(retry=canarytools.RetryPolicy(retries=5, backoff=1))
+        """
+        self.retries = retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.statuses = frozenset(statuses)
+        self.methods = frozenset(method.upper() for method in methods)
+        self.max_retry_after = max_retry_after
+
+    def should_retry(self, method, attempt, status_code=None, error=None):
+        """Should a failed attempt be retried?
+
+        :param method: The HTTP method
+        :param attempt: Number of retries made so far
+        :param status_code: HTTP status code of the response, if there was one
+        :param error: The connection error raised, if any
+        :return: ``True`` if the request should be sent again
+        """
+        if attempt >= self.retries:
+            return False
+        if error is not None:
+            return method in self.methods
+        if status_code == RATE_LIMITED:
+            return status_code in self.statuses
+        return status_code in self.statuses and method in self.methods
+
+    def delay(self, attempt, retry_after=None):
+        """Seconds to wait before the next attempt
+
+        :param attempt: Number of retries made so far
+        :param retry_after: The response's Retry-After header, if any
+        :return: Seconds to wait, ``None`` if the Retry-After header asks for more than ``max_retry_after``
+        """
+        wait = parse_retry_after(retry_after)
+        if wait is not None:
+            return wait if wait <= self.max_retry_after else None
+        wait = min(self.max_backoff, self.backoff * (2 ** attempt))
+        if self.jitter:
+            wait = random.uniform(0, wait)
+        return wait
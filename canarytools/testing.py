@@ -0,0 +1,299 @@
+import fnmatch
+import json
+import math
+import random
+import threading
+import time
+
+from .transport import Transport
+
+# the part of a url before the endpoint
+API_PREFIX = '/api/v1/'
+
+
+class InjectedConnectionError(IOError):
+    """Connection failure injected by a :class:`FaultInjectionTransport <FaultInjectionTransport>`"""
+
+
+class InjectedTimeout(IOError):
+    """Timeout injected by a :class:`FaultInjectionTransport <FaultInjectionTransport>`"""
+
+
+def fixed(seconds):
+    """Latency distribution that always waits the same time
+
+    :param seconds: Seconds waited
+    :return: Function returning a latency given a ``random.Random``
+    """
+    return lambda rng: seconds
+
+
+def uniform(low, high):
+    """Latency distribution uniform between two times
+
+    :param low: Minimum seconds waited
+    :param high: Maximum seconds waited
+    :return: Function returning a latency given a ``random.Random``
+    """
+    return lambda rng: rng.uniform(low, high)
+
+
+def lognormal(median, sigma=0.5):
+    """Long tailed latency distribution, like that of most real services
+
+    :param median: Median seconds waited
+    :param sigma: Spread of the distribution. At 0.5 the 99th percentile is about 3x the median, at 1.0 about 10x
+    :return: Function returning a latency given a ``random.Random``
+    """
+    mu = math.log(median)
+    return lambda rng: rng.lognormvariate(mu, sigma)
+
+
+class Fault(object):
+    def __init__(self, latency=None, error_rate=0.0, errors=None, status_rate=0.0, statuses=(503,),
+                 retry_after=None, connection_error_rate=0.0, timeout_rate=0.0, truncate_rate=0.0,
+                 non_json_rate=0.0, drip_rate=0.0, drip_chunk_size=1024, drip_delay=0.05):
+        """Latency and failures injected into the responses of an endpoint. Each rate is the probability
+            that a request fails that way
+
+        :param latency: Seconds added to each request, or a latency distribution such as :func:`lognormal`
+        :param error_rate: Rate of API errors, returned with HTTP 200 like the console does
+        :param errors: Messages of the API errors, picked at random. Defaults to every message the console's
+            ``ERROR_MAP`` turns into a specific exception
+        :param status_rate: Rate of HTTP error statuses
+        :param statuses: The HTTP statuses, picked at random
+        :param retry_after: ``Retry-After`` header sent with the HTTP error statuses
+        :param connection_error_rate: Rate of connections refused or reset
+        :param timeout_rate: Rate of requests that time out
+        :param truncate_rate: Rate of responses cut short, which fail to decode
+        :param non_json_rate: Rate of HTML error pages, e.g. from a proxy in front of the console
+        :param drip_rate: Rate of responses that arrive slowly, ``drip_chunk_size`` bytes every ``drip_delay``
+            seconds
+        :param drip_chunk_size: Bytes sent at a time by slow responses
+        :param drip_delay: Seconds between the chunks of slow responses
+
+        Usage::
+
+            >>> from canarytools.testing import Fault, lognormal
+            >>> fault = Fault(latency=lognormal(median=2.0, sigma=1.0), status_rate=0.05, statuses=(429, 503))
+        """
+        if latency is not None and not callable(latency):
+            latency = fixed(latency)
+        self.latency = latency
+        self.error_rate = error_rate
+        if errors is None:
+            from .console import ERROR_MAP
+            errors = sorted(ERROR_MAP)
+        self.errors = tuple(errors)
+        self.status_rate = status_rate
+        self.statuses = tuple(statuses)
+        self.retry_after = retry_after
+        self.connection_error_rate = connection_error_rate
+        self.timeout_rate = timeout_rate
+        self.truncate_rate = truncate_rate
+        self.non_json_rate = non_json_rate
+        self.drip_rate = drip_rate
+        self.drip_chunk_size = drip_chunk_size
+        self.drip_delay = drip_delay
+
+
+class CannedResponse(object):
+    def __init__(self, status_code=200, content=b'', headers=None, drip_chunk_size=None, drip_delay=0.0,
+                 sleep=time.sleep):
+        """A response with the interface of a ``requests`` response, built from bytes
+
+        :param status_code: The HTTP status code
+        :param content: The body
+        :param headers: Dictionary of headers
+        :param drip_chunk_size: Deliver the body this many bytes at a time, ``None`` delivers it at once
+        :param drip_delay: Seconds waited before each chunk
+        :param sleep: Function used to wait
+
+        **Attributes:**
+            - **closed (bool)** -- Was the response closed, e.g. after being discarded?
+        """
+        self.status_code = status_code
+        self.headers = headers or {}
+        self._content = content
+        self._drip_chunk_size = drip_chunk_size
+        self._drip_delay = drip_delay
+        self._sleep = sleep
+        self._delivered = drip_chunk_size is None
+        self.closed = False
+
+    @property
+    def content(self):
+        """The body of the response, waiting for a slow response to arrive"""
+        if not self._delivered:
+            for _ in self.iter_content(self._drip_chunk_size):
+                pass
+        return self._content
+
+    @property
+    def text(self):
+        """The body of the response as text"""
+        return self.content.decode('utf-8', 'replace')
+
+    def json(self):
+        """Decode the JSON body of the response
+
+        :except ValueError: The body isn't JSON
+        """
+        return json.loads(self.content.decode('utf-8'))
+
+    def iter_content(self, chunk_size=1):
+        """Read the body of the response a chunk at a time, at the pace of a slow response
+
+        :param chunk_size: Number of bytes read at a time
+        """
+        step = self._drip_chunk_size or chunk_size
+        for start in range(0, len(self._content), step):
+            if not self._delivered and self._drip_delay:
+                self._sleep(self._drip_delay)
+            yield self._content[start:start + step]
+        self._delivered = True
+
+    def close(self):
+        self.closed = True
+
+
+class FaultInjectionTransport(Transport):
+    def __init__(self, backend=None, faults=None, timeout=None, seed=None, sleep=time.sleep):
+        """A transport injecting latency and failures, to test how code using a Console copes with a slow or
+            failing console without waiting for production to do it
+
+        :param backend: Where responses come from. Either another :class:`Transport <Transport>`, e.g. one
+            talking to a real console, or canned JSON data: a dictionary keyed by endpoint (e.g.
+            ``'incidents/all'``) or a function called with ``(method, endpoint, params, data)``. Endpoints
+            without canned data return ``{'result': 'success'}``
+        :param faults: Dictionary of :class:`Fault <Fault>` objects keyed by endpoint. Keys may be patterns such
+            as ``'incidents/*'`` or ``'*'``; an exact match is used first, otherwise the first matching pattern
+        :param timeout: Seconds after which requests time out, as a real transport's read timeout would. Latency
+            beyond it raises a timeout after waiting this long
+        :param seed: Seed of the random faults, for repeatable runs
+        :param sleep: Function used to wait, e.g. one advancing a fake clock instead of sleeping
+
+        **Attributes:**
+            - **injected (dict)** -- Number of faults injected, keyed by kind: ``latency``, ``error``,
+              ``status``, ``connection_error``, ``timeout``, ``truncate``, ``non_json`` and ``drip``
+            - **requests (dict)** -- Number of requests, keyed by endpoint
+
+        Usage::
+
+            >>> from canarytools.testing import FaultInjectionTransport, Fault, fixed
+            >>> transport = FaultInjectionTransport(
+            >>>     backend={'incidents/all': {'result': 'success', 'incidents': []}},
+            >>>     faults={'incidents/all': Fault(latency=fixed(20)), '*': Fault(status_rate=0.01)},
+            >>>     timeout=10)
+            >>> console = canarytools.Console(domain='test', api_key='test', transport=transport)
+            >>> console.incidents.all()
+            RequestTimeoutError: Timed out waiting for the console at domain: 'test'
+        """
+        self.backend = backend if backend is not None else {}
+        self.faults = faults or {}
+        self.timeout = timeout
+        self.sleep = sleep
+        self.injected = dict()
+        self.requests = dict()
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+        self.connection_errors = (InjectedConnectionError,)
+        self.timeout_errors = (InjectedTimeout,)
+        self.thread_safe = True
+        if isinstance(self.backend, Transport):
+            self.connection_errors += tuple(self.backend.connection_errors)
+            self.timeout_errors += tuple(self.backend.timeout_errors)
+            self.thread_safe = self.backend.thread_safe
+
+    def fault(self, endpoint):
+        """Get the faults injected into an endpoint
+
+        :param endpoint: The endpoint, e.g. ``'incidents/all'``
+        :return: The :class:`Fault <Fault>` object, ``None`` if the endpoint has no faults
+        """
+        fault = self.faults.get(endpoint)
+        if fault is None:
+            for pattern, candidate in self.faults.items():
+                if fnmatch.fnmatchcase(endpoint, pattern):
+                    return candidate
+        return fault
+
+    def request(self, method, url, params=None, data=None, files=None, stream=False):
+        endpoint = url.split(API_PREFIX, 1)[-1]
+        fault = self.fault(endpoint)
+        with self._lock:
+            self.requests[endpoint] = self.requests.get(endpoint, 0) + 1
+            # draw every roll up front so a run is repeatable whatever the threads do
+            rolls = [self._random.random() for _ in range(8)]
+            latency = fault.latency(self._random) if fault is not None and fault.latency is not None else 0.0
+            pick = self._random.random()
+
+        if fault is None:
+            return self._respond(method, endpoint, url, params, data, files, stream)
+
+        if latency:
+            self._count('latency')
+            if self.timeout is not None and latency > self.timeout:
+                self.sleep(self.timeout)
+                self._count('timeout')
+                raise InjectedTimeout('Injected timeout after {0:.2f}s on {1}'.format(self.timeout, endpoint))
+            self.sleep(latency)
+
+        if rolls[0] < fault.connection_error_rate:
+            self._count('connection_error')
+            raise InjectedConnectionError('Injected connection error on {0}'.format(endpoint))
+        if rolls[1] < fault.timeout_rate:
+            if self.timeout:
+                self.sleep(self.timeout)
+            self._count('timeout')
+            raise InjectedTimeout('Injected timeout on {0}'.format(endpoint))
+        if rolls[2] < fault.status_rate and fault.statuses:
+            self._count('status')
+            status = fault.statuses[int(pick * len(fault.statuses))]
+            headers = {'Retry-After': str(fault.retry_after)} if fault.retry_after is not None else {}
+            return CannedResponse(status, b'<html><body>Injected HTTP error</body></html>', headers)
+        if rolls[3] < fault.non_json_rate:
+            self._count('non_json')
+            return CannedResponse(502, b'<html><body>502 Bad Gateway</body></html>')
+        if rolls[4] < fault.error_rate and fault.errors:
+            self._count('error')
+            message = fault.errors[int(pick * len(fault.errors))]
+            return CannedResponse(200, json.dumps({'result': 'error', 'message': message}).encode('utf-8'))
+
+        truncate = rolls[5] < fault.truncate_rate
+        drip = rolls[6] < fault.drip_rate
+        if not truncate and not drip:
+            return self._respond(method, endpoint, url, params, data, files, stream)
+
+        response = self._respond(method, endpoint, url, params, data, files, False)
+        content = response.content
+        if truncate:
+            self._count('truncate')
+            content = content[:int(len(content) * rolls[7])]
+        drip_chunk_size = None
+        if drip:
+            self._count('drip')
+            drip_chunk_size = fault.drip_chunk_size
+        return CannedResponse(response.status_code, content, dict(response.headers), drip_chunk_size,
+                              fault.drip_delay, self.sleep)
+
+    def _respond(self, method, endpoint, url, params, data, files, stream):
+        """The backend's response to a request"""
+        if isinstance(self.backend, Transport):
+            return self.backend.request(method, url, params=params, data=data, files=files, stream=stream)
+        if callable(self.backend):
+            payload = self.backend(method, endpoint, params, data)
+        else:
+            payload = self.backend.get(endpoint)
+        if payload is None:
+            payload = {'result': 'success'}
+        return CannedResponse(200, json.dumps(payload).encode('utf-8'))
+
+    def _count(self, kind):
+        with self._lock:
+            self.injected[kind] = self.injected.get(kind, 0) + 1
+
+    def close(self):
+        if isinstance(self.backend, Transport):
+            self.backend.close()
@@ -0,0 +1,246 @@
+import json
+import threading
+
+import requests
+
+from requests.adapters import HTTPAdapter
+
+try:
+    # python 3
+    from urllib.parse import urlencode
+except ImportError:
+    # python 2
+    from urllib import urlencode
+
+try:
+    import urllib3
+except ImportError:
+    urllib3 = None
+
+from .exceptions import ConfigurationError
+
+# seconds to wait for a connection to the console, and for each read of its response
+DEFAULT_TIMEOUT = (10.0, 120.0)
+
+# number of connections kept open to the console, enough for a ConsolePool or a few threads sharing a Console
+DEFAULT_POOL_SIZE = 10
+
+
+class Transport(object):
+    """Sends the console's HTTP requests. Subclass it to change how requests are sent, e.g. to use another
+        HTTP library, and pass an instance to :class:`Console <Console>`.
+
+    ``request`` returns a response with the same interface as a ``requests`` response: ``status_code``,
+    ``headers``, ``content``, ``text``, ``json()``, ``iter_content(chunk_size)`` and ``close()``.
+    """
+
+    #: Exceptions raised when the console can't be reached, including connection timeouts
+    connection_errors = ()
+
+    #: Exceptions raised when the console is reached but doesn't respond in time
+    timeout_errors = ()
+
+    #: Can several threads send requests through the transport at once? Required by a thread-safe Console
+    thread_safe = False
+
+    def request(self, method, url, params=None, data=None, files=None, stream=False):
+        """Send a request
+
+        :param method: The HTTP method
+        :param url: The full url, without a query string
+        :param params: Dictionary of query string parameters
+        :param data: Dictionary of form fields sent in the body
+        :param files: Dictionary of ``(filename, fileobj, mimetype)`` tuples uploaded in a multipart body
+        :param stream: Don't read the body until it's accessed, so ``iter_content`` reads it as it's downloaded
+        :return: The response
+        """
+        raise NotImplementedError()
+
+    def close(self):
+        """Close the transport's connections"""
+
+
+class RequestsTransport(Transport):
+    connection_errors = (requests.exceptions.ConnectionError,)
+    timeout_errors = (requests.exceptions.ReadTimeout,)
+
+    def __init__(self, pool_connections=DEFAULT_POOL_SIZE, pool_maxsize=DEFAULT_POOL_SIZE, pool_block=False,
+                 keep_alive=True, timeout=DEFAULT_TIMEOUT, session=None, per_thread=False):
+        """The default transport, sending requests with a ``requests`` session
+
+        :param pool_connections: Number of hosts connections are kept for
+        :param pool_maxsize: Number of connections kept open to each host. Raise it when many threads
+            share a Console, otherwise the extra connections are opened and dropped on every request
+        :param pool_block: Wait for a free connection rather than opening one beyond ``pool_maxsize``
+        :param keep_alive: Reuse connections between requests
+        :param timeout: Seconds to wait for the console, either one number or a ``(connect, read)`` tuple.
+            ``None`` waits forever
+        :param session: The ``requests`` session to use, e.g. one configured with proxies. A new session
+            is created by default. With ``per_thread``, a function returning a new session
+        :param per_thread: Give each thread its own session, so threads never share a session's state. The
+            sessions share one pool of connections. Used by thread-safe consoles
+
+        :except ConfigurationError: ``per_thread`` is set and ``session`` is a session rather than a function
+
+        Usage::
+
+            >>> import canarytools
+            >>> transport = canarytools.RequestsTransport(pool_maxsize=32, timeout=(5, 60))
+            >>> console = canarytools.Console(transport=transport)
+        """
+        self.timeout = timeout
+        self.keep_alive = keep_alive
+        self.thread_safe = per_thread
+        self.adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize,
+                                   pool_block=pool_block)
+        if per_thread:
+            if session is not None and not callable(session):
+                raise ConfigurationError("Pass a function creating sessions rather than a session, "
+                                         "each thread needs its own.")
+            self._new_session = session if session is not None else requests.session
+            self._local = threading.local()
+            self._session = None
+        else:
+            self._local = None
+            self._session = self._mount(session if session is not None else requests.session())
+
+    @property
+    def session(self):
+        """The ``requests`` session used by the calling thread"""
+        if self._local is None:
+            return self._session
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            session = self._local.session = self._mount(self._new_session())
+        return session
+
+    def _mount(self, session):
+        """Send a session's requests through the transport's pool of connections
+
+        :param session: A ``requests`` session
+        :return: The session
+        """
+        session.mount('https://', self.adapter)
+        session.mount('http://', self.adapter)
+        if not self.keep_alive:
+            session.headers['Connection'] = 'close'
+        return session
+
+    def request(self, method, url, params=None, data=None, files=None, stream=False):
+        return self.session.request(method, url=url, params=params, data=data, files=files, stream=stream,
+                                    timeout=self.timeout)
+
+    def close(self):
+        if self._session is not None:
+            self._session.close()
+        else:
+            self.adapter.close()
+
+
+class Urllib3Response(object):
+    def __init__(self, response):
+        """A urllib3 response with the interface of a ``requests`` response
+
+        :param response: The ``urllib3.HTTPResponse``
+        """
+        self._response = response
+        self.status_code = response.status
+        self.headers = response.headers
+
+    @property
+    def content(self):
+        """The body of the response"""
+        return self._response.data
+
+    @property
+    def text(self):
+        """The body of the response as text"""
+        return self.content.decode('utf-8', 'replace')
+
+    def json(self):
+        """Decode the JSON body of the response
+
+        :except ValueError: The body isn't JSON
+        """
+        return json.loads(self.content.decode('utf-8'))
+
+    def iter_content(self, chunk_size=1):
+        """Read the body of the response a chunk at a time
+
+        :param chunk_size: Number of bytes read at a time
+        """
+        return self._response.stream(chunk_size)
+
+    def close(self):
+        self._response.release_conn()
+
+
+class Urllib3Transport(Transport):
+    # urllib3's pool manager hands each request a connection of its own
+    thread_safe = True
+
+    def __init__(self, num_pools=DEFAULT_POOL_SIZE, maxsize=DEFAULT_POOL_SIZE, block=False, keep_alive=True,
+                 timeout=DEFAULT_TIMEOUT, **kwargs):
+        """Send requests with a ``urllib3`` pool manager directly, skipping the overhead ``requests`` adds
+            to every request. Useful for many small, concurrent requests
+
+        :param num_pools: Number of hosts connections are kept for
+        :param maxsize: Number of connections kept open to each host
+        :param block: Wait for a free connection rather than opening one beyond ``maxsize``
+        :param keep_alive: Reuse connections between requests
+        :param timeout: Seconds to wait for the console, either one number or a ``(connect, read)`` tuple.
+            ``None`` waits forever
+        :param kwargs: Extra arguments of the ``urllib3.PoolManager``, e.g. ``ca_certs``
+
+        :except ConfigurationError: ``urllib3`` is not installed
+
+        Usage::
+
+            >>> import canarytools
+            >>> console = canarytools.Console(transport=canarytools.Urllib3Transport(maxsize=32))
+        """
+        if urllib3 is None:
+            raise ConfigurationError("urllib3 is required to use Urllib3Transport. "
+                                     "Install it with 'pip install urllib3'.")
+        self.connection_errors = (urllib3.exceptions.HTTPError,)
+        self.timeout_errors = (urllib3.exceptions.ReadTimeoutError,)
+
+        if isinstance(timeout, tuple):
+            timeout = urllib3.Timeout(connect=timeout[0], read=timeout[1])
+        elif timeout is not None:
+            timeout = urllib3.Timeout(connect=timeout, read=timeout)
+        headers = kwargs.pop('headers', {})
+        if not keep_alive:
+            headers['Connection'] = 'close'
+        self.pool = urllib3.PoolManager(num_pools=num_pools, maxsize=maxsize, block=block, timeout=timeout,
+                                        retries=False, headers=headers, **kwargs)
+
+    def request(self, method, url, params=None, data=None, files=None, stream=False):
+        if params:
+            url = '{url}?{query}'.format(url=url, query=urlencode(_fields(params), doseq=True))
+        body = None
+        headers = dict(self.pool.headers)
+        if files:
+            fields = _fields(data or {})
+            for name, upload in files.items():
+                filename, fileobj, mimetype = upload
+                fields.append((name, (filename, fileobj.read(), mimetype)))
+            body, content_type = urllib3.encode_multipart_formdata(fields)
+            headers['Content-Type'] = content_type
+        elif data:
+            body = urlencode(_fields(data), doseq=True)
+            headers['Content-Type'] = 'application/x-www-form-urlencoded'
+        response = self.pool.urlopen(method, url, body=body, headers=headers, preload_content=not stream)
+        return Urllib3Response(response)
+
+    def close(self):
+        self.pool.clear()
+
+
+def _fields(params):
+    """Form fields of a dictionary, skipping ``None`` values as ``requests`` does
+
+    :param params: Dictionary of parameters
+    :return: List of ``(name, value)`` tuples
+    """
+    return [(name, value) for name, value in params.items() if value is not None]
@@ -40,9 +40,15 @@ setup(
 
     keywords='canary thinkst canarytools api wrapper',
 
-    packages=find_packages(exclude=['contrib', 'docs', 'tests']),
+    packages=find_packages(exclude=['contrib', 'docs', 'tests', 'benchmarks', 'benchmarks.*']),
 
-    install_requires=['requests>=2.10.0', 'python-dateutil>=2.1', 'pytz>=2013b'],
+    install_requires=['requests>=2.10.0', 'python-dateutil>=2.1', 'pytz>=2013b',
+                      'futures>=3.0; python_version < "3"'],
+
+    extras_require={
+        'async': ['aiohttp>=3.0'],
+        'export': ['numpy', 'pyarrow>=6.0', 'orjson; python_version >= "3.6"'],
+    },
 
     package_data={
         '': ['LICENSE.txt'],
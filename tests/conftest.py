@@ -0,0 +1,33 @@
+import pytest
+
+import canarytools
+
+from canarytools.testing import FaultInjectionTransport
+
+
+def device_data(index, **fields):
+    data = {'id': 'node{0:03d}'.format(index), 'name': 'bird{0}'.format(index), 'description': 'Cape Town',
+            'device_live': 'True', 'ip_address': '10.0.0.{0}'.format(index),
+            'first_seen_std': '2019-12-25 12:00:00 UTC+0000', 'last_seen_std': '2019-12-25 13:00:00 UTC+0000',
+            'unacknowleged_incidents': [{'key': 'incident:{0}'.format(index)}]}
+    data.update(fields)
+    return data
+
+
+def incident_data(index, **fields):
+    data = {'id': 'incident:{0}'.format(index), 'summary': 'SSH Login Attempt', 'description': 'SSH Login Attempt',
+            'node_id': 'node{0:03d}'.format(index), 'acknowledged': 'False', 'src_host': '10.1.1.1',
+            'created_std': '2019-12-25 12:00:00 UTC+0000', 'updated_std': '2019-12-25 12:00:00 UTC+0000',
+            'events': [{'timestamp_std': '2019-12-25 12:00:00 UTC+0000', 'USERNAME': 'root'}]}
+    data.update(fields)
+    return data
+
+
+@pytest.fixture
+def make_console():
+    """Build a Console answered by a :class:`FaultInjectionTransport`, returning both"""
+    def make(backend=None, faults=None, **kwargs):
+        transport = FaultInjectionTransport(backend=backend, faults=faults, seed=0, sleep=lambda seconds: None)
+        console = canarytools.Console(domain='test', api_key='test-key', transport=transport, **kwargs)
+        return console, transport
+    return make
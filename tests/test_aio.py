@@ -0,0 +1,116 @@
+import asyncio
+import json
+
+import pytest
+
+aiohttp = pytest.importorskip('aiohttp')
+
+from aiohttp import web
+
+import canarytools
+
+from .conftest import device_data, incident_data
+
+
+def run(coroutine_function, incidents, chunk=None, devices=None, requests=None):
+    """Serve the incidents from a local server and run a coroutine function with an AsyncConsole using it.
+        The listing is written ``chunk`` bytes at a time, so it is parsed as it arrives. The endpoints
+        requested are appended to ``requests``
+    """
+    async def listing(request):
+        body = json.dumps({'result': 'success', 'incidents': incidents}).encode('utf-8')
+        response = web.StreamResponse()
+        await response.prepare(request)
+        size = chunk or len(body)
+        for start in range(0, len(body), size):
+            await response.write(body[start:start + size])
+        await response.write_eof()
+        return response
+
+    async def device_listing(request):
+        return web.json_response({'result': 'success', 'devices': devices or []})
+
+    async def device(request):
+        found = [data for data in devices or [] if data['id'] == request.query['node_id']]
+        return web.json_response({'result': 'success', 'device': found[0]})
+
+    @web.middleware
+    async def count(request, handler):
+        if requests is not None:
+            requests.append(request.path[len('/api/v1/'):])
+        return await handler(request)
+
+    async def main():
+        app = web.Application(middlewares=[count])
+        app.router.add_get('/api/v1/incidents/all', listing)
+        app.router.add_get('/api/v1/incidents/unacknowledged', listing)
+        app.router.add_get('/api/v1/devices/all', device_listing)
+        app.router.add_get('/api/v1/device/getinfo', device)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, '127.0.0.1', 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        base_url = 'http://127.0.0.1:{0}/api/v1/'.format(port)
+        try:
+            async with canarytools.AsyncConsole('test', 'test-key', base_url=base_url) as console:
+                return await coroutine_function(console)
+        finally:
+            await runner.cleanup()
+
+    return asyncio.run(main())
+
+
+def test_iter_all_streams_incidents():
+    async def collect(console):
+        return [incident async for incident in console.incidents.iter_all()]
+
+    incidents = run(collect, [incident_data(index) for index in range(20)], chunk=97)
+    assert [incident.id for incident in incidents] == ['incident:{0}'.format(index) for index in range(20)]
+    assert incidents[0].src_host == '10.1.1.1'
+
+
+def test_iter_unacknowledged_is_recorded_in_metrics():
+    async def collect(console):
+        incidents = [incident async for incident in console.incidents.iter_unacknowledged()]
+        return incidents, console.stats()
+
+    incidents, stats = run(collect, [incident_data(index) for index in range(3)])
+    assert len(incidents) == 3
+    assert stats['incidents/unacknowledged']['count'] == 1
+
+
+def test_sync_returns_only_changes(tmp_path):
+    state_path = str(tmp_path / 'incidents.state')
+
+    async def sync_twice(console):
+        return await console.incidents.sync(state_path), await console.incidents.sync(state_path)
+
+    first, second = run(sync_twice, [incident_data(index) for index in range(3)])
+    assert len(first) == 3
+    assert second == []
+
+
+def test_devices_without_incidents_are_one_request():
+    requests = list()
+
+    async def get_devices(console):
+        return await console.devices.all(), await console.devices.get_device('node001')
+
+    devices, device = run(get_devices, [], devices=[device_data(i, unacknowleged_incidents=[]) for i in range(3)],
+                          requests=requests)
+    assert len(devices) == 3 and device.node_id == 'node001'
+    assert devices[0].unacknowleged_incidents == []
+    assert requests == ['devices/all', 'device/getinfo']
+
+
+def test_device_incidents_are_fetched_with_the_device():
+    requests = list()
+
+    async def get_devices(console):
+        return await console.devices.all()
+
+    devices = run(get_devices, [incident_data(i) for i in range(3)], devices=[device_data(i) for i in range(3)],
+                  requests=requests)
+    assert [incident.id for incident in devices[2].unacknowleged_incidents] == ['incident:2']
+    assert requests == ['devices/all', 'incidents/unacknowledged']
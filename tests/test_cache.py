@@ -0,0 +1,37 @@
+import canarytools
+
+from canarytools.testing import FaultInjectionTransport
+
+
+def flocks(name):
+    return {'flocks/list': {'result': 'success', 'flocks': {'flock:default': name}}}
+
+
+def test_shared_cache_keeps_consoles_apart():
+    cache = canarytools.ResponseCache()
+    first = canarytools.Console(domain='a', api_key='key-a', cache=cache,
+                                transport=FaultInjectionTransport(flocks('Tenant A')))
+    second = canarytools.Console(domain='b', api_key='key-b', cache=cache,
+                                 transport=FaultInjectionTransport(flocks('Tenant B')))
+
+    assert [flock.name for flock in first.flocks.all()] == ['Tenant A']
+    assert [flock.name for flock in second.flocks.all()] == ['Tenant B']
+    assert [flock.name for flock in first.flocks.all()] == ['Tenant A']
+    assert first.transport.requests == {'flocks/list': 1}
+
+
+def test_api_keys_of_one_console_are_kept_apart():
+    cache = canarytools.ResponseCache()
+    transport = FaultInjectionTransport(flocks('Default'))
+    for key in ('key-a', 'key-b'):
+        canarytools.Console(domain='a', api_key=key, cache=cache, transport=transport).flocks.all()
+    assert transport.requests == {'flocks/list': 2}
+
+
+def test_changes_drop_cached_responses(make_console):
+    console, transport = make_console(flocks('Default'), cache=True)
+    console.flocks.all()
+    console.flocks.all()
+    console.post('flock/rename', {'flock_id': 'flock:default', 'name': 'Renamed'})
+    console.flocks.all()
+    assert transport.requests['flocks/list'] == 2
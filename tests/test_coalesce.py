@@ -0,0 +1,92 @@
+import threading
+import time
+
+import pytest
+
+import canarytools
+
+from canarytools.coalesce import RequestCoalescer
+
+from .conftest import device_data
+
+THREADS = 8
+
+
+def concurrently(fn):
+    """Call a function from many threads at once, returning what each returned or raised"""
+    results = [None] * THREADS
+    start = threading.Barrier(THREADS)
+
+    def call(index):
+        start.wait()
+        try:
+            results[index] = fn()
+        except Exception as e:
+            results[index] = e
+
+    threads = [threading.Thread(target=call, args=(index,)) for index in range(THREADS)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+def slow_backend(method, endpoint, params, data):
+    time.sleep(0.05)
+    if params and params.get('node_id') == 'missing':
+        return {'result': 'error', 'message': 'Device not found'}
+    return {'result': 'success', 'device': device_data(0)}
+
+
+def test_identical_gets_share_one_request(make_console):
+    console, transport = make_console(slow_backend, coalesce=True, thread_safe=True)
+    devices = concurrently(lambda: console.devices.get_device('node000'))
+
+    assert [device.node_id for device in devices] == ['node000'] * THREADS
+    assert len(set(id(device) for device in devices)) == THREADS
+    assert transport.requests == {'device/getinfo': 1}
+    assert console.stats()['device/getinfo']['coalesced'] == THREADS - 1
+
+
+def test_each_waiter_gets_its_own_exception(make_console):
+    console, transport = make_console(slow_backend, coalesce=True, thread_safe=True)
+    errors = concurrently(lambda: console.devices.get_device('missing'))
+
+    assert all(isinstance(error, canarytools.DeviceNotFoundError) for error in errors)
+    assert len(set(id(error) for error in errors)) == THREADS
+    assert transport.requests == {'device/getinfo': 1}
+
+
+def test_posts_are_never_coalesced(make_console):
+    console, transport = make_console(slow_backend, coalesce=True, thread_safe=True)
+    concurrently(lambda: console.post('device/reboot', {'node_id': 'node000'}))
+
+    assert transport.requests == {'device/reboot': THREADS}
+
+
+def test_waiters_see_the_leader_interrupted():
+    coalescer = RequestCoalescer()
+    key = coalescer.key('device/getinfo', {'node_id': 'node000'})
+    started = threading.Event()
+    outcome = list()
+
+    def leader():
+        started.set()
+        time.sleep(0.05)
+        raise KeyboardInterrupt()
+
+    def wait():
+        started.wait()
+        try:
+            outcome.append(coalescer.call(key, lambda: 'own response'))
+        except BaseException as e:
+            outcome.append(e)
+
+    waiter = threading.Thread(target=wait)
+    waiter.start()
+    with pytest.raises(KeyboardInterrupt):
+        coalescer.call(key, leader)
+    waiter.join()
+
+    assert len(outcome) == 1 and isinstance(outcome[0], KeyboardInterrupt)
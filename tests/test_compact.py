@@ -0,0 +1,83 @@
+import pickle
+
+import pytest
+
+import canarytools
+
+from canarytools.models.incidents import CompactEvent, CompactIncident
+
+from .conftest import incident_data
+
+EVENTS = [{'timestamp_std': '2019-12-25 12:00:00 UTC+0000', 'src_host': '10.1.1.1', 'USERNAME': 'root',
+           'PASSWORD': 'hunter2'}]
+
+
+@pytest.fixture
+def console(make_console):
+    return make_console(compact_models=True, lazy_timestamps=True)[0]
+
+
+def test_compact_objects_read_like_regular_ones(console, make_console):
+    incident = console.incidents.parse_incident(incident_data(0, events=EVENTS))
+    regular = make_console()[0].incidents.parse_incident(incident_data(0, events=EVENTS))
+    event = incident.events[0]
+
+    assert type(incident) is CompactIncident and type(event) is CompactEvent
+    assert not hasattr(incident, '__dict__') and not hasattr(event, '__dict__')
+    assert incident.summary == 'SSH Login Attempt' and incident.acknowledged is False
+    assert incident.created_std == regular.created_std
+    assert (event.src_host, event.username, event.password) == ('10.1.1.1', 'root', 'hunter2')
+    assert event.timestamp == regular.events[0].timestamp
+    assert incident.to_dict() == regular.to_dict()
+    with pytest.raises(AttributeError):
+        event.missing
+
+
+def test_unknown_fields_overflow_into_one_tuple(console):
+    event = console.incidents.parse_incident(incident_data(0, events=EVENTS)).events[0]
+    assert event._extra == ('password', 'hunter2', 'username', 'root',
+                            '_raw_timestamp', '2019-12-25 12:00:00 UTC+0000')
+
+    # replaced in place of being added again, and the lazy timestamp is moved to its slot once parsed
+    event.username = 'admin'
+    event.timestamp
+    assert event._extra == ('password', 'hunter2', 'username', 'admin')
+
+    del event.password
+    assert event._extra == ('username', 'admin')
+    with pytest.raises(AttributeError):
+        del event.password
+
+    # every object shares one copy of each overflow key
+    other = console.incidents.parse_incident(incident_data(1, events=EVENTS)).events[0]
+    assert other._extra[2] is event._extra[0]
+
+
+def test_compact_objects_pickle():
+    # with its default transport, as the console is pickled with the incident
+    console = canarytools.Console(domain='test', api_key='test-key', compact_models=True, lazy_timestamps=True)
+    incident = console.incidents.parse_incident(incident_data(0, events=EVENTS))
+    incident.events[0]
+    copy = pickle.loads(pickle.dumps(incident))
+
+    assert type(copy) is CompactIncident
+    # lazy timestamps travel unparsed
+    assert copy._extra == incident._extra
+    assert copy.to_dict() == incident.to_dict()
+    assert copy.events[0].password == 'hunter2'
+
+
+def test_update_copies_a_refreshed_compact_incident(console):
+    incident = console.incidents.parse_incident(incident_data(0, events=EVENTS))
+    incident._acknowledged_locally(True)
+    assert incident.created_std is not None
+    fresh = console.incidents.parse_incident(incident_data(
+        0, acknowledged='True', created_std='2019-12-25 11:00:00 UTC+0000', events=EVENTS * 2))
+
+    incident._update(fresh)
+    assert incident.acknowledged is True
+    assert not incident.stale
+    assert len(incident.events) == 2
+    # the parsed timestamp is replaced by the fresh, unparsed one
+    assert incident._attributes(resolve=False)['_raw_created_std'] == '2019-12-25 11:00:00 UTC+0000'
+    assert incident.created_std.hour == 11
@@ -0,0 +1,34 @@
+import threading
+
+import pytest
+
+import canarytools
+
+
+def test_hedging_needs_a_thread_safe_transport():
+    with pytest.raises(canarytools.ConfigurationError):
+        canarytools.Console(domain='test', api_key='test-key', hedge=True,
+                            transport=canarytools.RequestsTransport(per_thread=False))
+
+
+def test_hedging_defaults_to_a_session_per_thread():
+    console = canarytools.Console(domain='test', api_key='test-key', hedge=True)
+    assert console.transport.thread_safe
+
+
+def test_session_is_the_transports():
+    console = canarytools.Console(domain='test', api_key='test-key')
+    assert console.session is console.transport.session
+    with pytest.raises(AttributeError):
+        console.session = None
+
+
+def test_session_of_a_thread_safe_console_is_the_calling_threads():
+    console = canarytools.Console(domain='test', api_key='test-key', thread_safe=True)
+    sessions = list()
+    thread = threading.Thread(target=lambda: sessions.append(console.session))
+    thread.start()
+    thread.join()
+
+    assert console.session is console.transport.session
+    assert sessions[0] is not console.session
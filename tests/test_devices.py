@@ -0,0 +1,79 @@
+import pytest
+
+import canarytools
+
+from .conftest import device_data, incident_data
+
+
+def listing(count=3):
+    return {
+        'devices/all': {'result': 'success', 'devices': [device_data(i) for i in range(count)]},
+        'incidents/unacknowledged': {'result': 'success', 'incidents': [incident_data(i) for i in range(count)]},
+    }
+
+
+def test_all_is_one_request(make_console):
+    console, transport = make_console(listing())
+    devices = console.devices.all()
+
+    assert [device.node_id for device in devices] == ['node000', 'node001', 'node002']
+    for device in devices:
+        device.name, device.ip_address, device.live, device.first_seen
+    assert transport.requests == {'devices/all': 1}
+
+
+def test_unacknowledged_incidents_share_one_request(make_console):
+    console, transport = make_console(listing())
+    devices = console.devices.all()
+
+    for device in devices:
+        assert [incident.node_id for incident in device.unacknowleged_incidents] == [device.node_id]
+    assert transport.requests == {'devices/all': 1, 'incidents/unacknowledged': 1}
+
+
+def test_hydrate_fetches_missing_attributes(make_console):
+    backend = listing(2)
+    backend['device/getinfo'] = {'result': 'success', 'device': device_data(0, settings={'ssh': True})}
+    console, transport = make_console(backend)
+    device = console.devices.all(hydrate=True)[0]
+
+    assert device.settings == {'ssh': True}
+    device.settings
+    assert transport.requests == {'devices/all': 1, 'device/getinfo': 1}
+
+
+def test_reboot_without_refresh_reloads_on_next_read(make_console):
+    backend = listing(1)
+    backend['device/reboot'] = {'result': 'success'}
+    backend['device/getinfo'] = {'result': 'success', 'device': device_data(0, device_live='False', uptime='5')}
+    console, transport = make_console(backend)
+    device = console.devices.all()[0]
+
+    device.reboot(refresh=False)
+    assert device.stale
+    assert device.need_reboot is True
+    assert transport.requests == {'devices/all': 1, 'device/reboot': 1}
+
+    assert device.uptime == 5
+    assert not device.stale
+    assert transport.requests == {'devices/all': 1, 'device/reboot': 1, 'device/getinfo': 1}
+
+
+def test_failed_incident_index_load_is_retried(make_console):
+    backend = listing(2)
+    calls = list()
+
+    def respond(method, endpoint, params, data):
+        calls.append(endpoint)
+        if endpoint == 'incidents/unacknowledged' and calls.count(endpoint) == 1:
+            return {'result': 'error', 'message': 'Console is busy'}
+        return backend.get(endpoint)
+
+    console, transport = make_console(respond)
+    devices = console.devices.all()
+
+    with pytest.raises(canarytools.ConsoleError):
+        devices[0].unacknowleged_incidents
+    assert [incident.id for incident in devices[0].unacknowleged_incidents] == ['incident:0']
+    assert [incident.id for incident in devices[1].unacknowleged_incidents] == ['incident:1']
+    assert transport.requests == {'devices/all': 1, 'incidents/unacknowledged': 2}
@@ -0,0 +1,70 @@
+import pytest
+
+from canarytools.export import event_columns, incident_columns, to_arrow, write_parquet
+
+from .conftest import incident_data
+
+# 2019-12-25 12:00:00 UTC
+CHRISTMAS = 1577275200
+
+
+def incidents(console):
+    return [
+        console.incidents.parse_incident(incident_data(0, dst_port='22', events=[
+            {'timestamp_std': '2019-12-25 12:00:00 UTC+0000', 'dst_port': '2222'},
+            {'timestamp_std': '2019-12-26 01:00:00 UTC+0200'}])),
+        console.incidents.parse_incident(incident_data(1, acknowledged='True', created_std='bad time', events=[])),
+    ]
+
+
+def test_incident_columns(make_console):
+    console, transport = make_console()
+    columns = incident_columns(incidents(console))
+
+    assert columns['id'] == ['incident:0', 'incident:1']
+    assert columns['dst_port'] == [22, None]
+    assert columns['acknowledged'] == [False, True]
+    assert columns['created'] == [CHRISTMAS, None]
+
+
+def test_event_columns_fall_back_to_the_incident(make_console):
+    console, transport = make_console()
+    columns = event_columns(incidents(console))
+
+    assert columns['incident_id'] == ['incident:0', 'incident:0']
+    assert columns['dst_port'] == [2222, 22]
+    assert columns['timestamp'] == [CHRISTMAS, CHRISTMAS + 11 * 3600]
+
+
+def test_to_arrow_types(make_console):
+    pyarrow = pytest.importorskip('pyarrow')
+    console, transport = make_console()
+    table = to_arrow(incident_columns(incidents(console)))
+
+    assert table.schema.field('created').type == pyarrow.int64()
+    assert table.schema.field('acknowledged').type == pyarrow.bool_()
+    assert table.column('created').to_pylist() == [CHRISTMAS, None]
+
+
+def test_write_parquet_partitions_by_day(make_console, tmp_path):
+    pytest.importorskip('pyarrow')
+    import pyarrow.dataset
+
+    console, transport = make_console()
+    write_parquet(incidents(console), str(tmp_path))
+
+    assert sorted(path.name for path in tmp_path.iterdir()) == ['day=2019-12-25']
+    table = pyarrow.dataset.dataset(str(tmp_path), format='parquet', partitioning='hive').to_table()
+    assert table.num_rows == 2
+
+
+def test_exporting_again_keeps_earlier_rows(make_console, tmp_path):
+    pytest.importorskip('pyarrow')
+    import pyarrow.dataset
+
+    console, transport = make_console()
+    write_parquet(incidents(console)[:1], str(tmp_path))
+    write_parquet(incidents(console)[:1], str(tmp_path))
+
+    table = pyarrow.dataset.dataset(str(tmp_path), format='parquet', partitioning='hive').to_table()
+    assert table.num_rows == 4
@@ -0,0 +1,98 @@
+import threading
+import time
+
+import canarytools
+
+from canarytools.testing import Fault, FaultInjectionTransport
+
+from .conftest import device_data
+
+
+class SlowResponses(object):
+    """Clock of a transport whose slow responses wait until the test releases them. Every ``slow``-th request
+        is slow, the others answer at once
+    """
+    def __init__(self, slow):
+        self.slow = slow
+        self.count = 0
+        self.released = threading.Event()
+
+    def latency(self, rng):
+        self.count += 1
+        return 10.0 if self.count % self.slow == 1 % self.slow else 0.0
+
+    def sleep(self, seconds):
+        self.released.wait(5)
+
+
+def hedged_console(clock, **policy):
+    responses = list()
+
+    def backend(method, endpoint, params, data):
+        return {'result': 'success', 'device': device_data(0, id=params['node_id'])}
+
+    transport = FaultInjectionTransport(backend=backend, faults={'device/getinfo': Fault(latency=clock.latency)},
+                                        seed=0, sleep=clock.sleep)
+    respond = transport._respond
+
+    def keep(*args):
+        response = respond(*args)
+        responses.append(response)
+        return response
+    transport._respond = keep
+
+    console = canarytools.Console(domain='test', api_key='test-key', transport=transport,
+                                  hedge=canarytools.HedgePolicy(**policy))
+    return console, transport, responses
+
+
+def test_slow_request_is_hedged_after_the_delay():
+    clock = SlowResponses(slow=2)
+    console, transport, responses = hedged_console(clock, delay=0.01)
+
+    assert console.devices.get_device('node001').node_id == 'node001'
+    assert transport.requests == {'device/getinfo': 2}
+    stats = console.stats()['device/getinfo']
+    assert stats['hedged'] == 1 and stats['hedge_wins'] == 1
+    clock.released.set()
+
+
+def test_losing_response_is_closed():
+    clock = SlowResponses(slow=2)
+    console, transport, responses = hedged_console(clock, delay=0.01)
+    console.devices.get_device('node001')
+
+    assert [response.closed for response in responses] == [False]
+    clock.released.set()
+    for _ in range(100):
+        if len(responses) == 2 and responses[1].closed:
+            break
+        time.sleep(0.01)
+    assert len(responses) == 2 and responses[1].closed
+
+
+def test_budget_stops_hedging():
+    clock = SlowResponses(slow=2)
+    console, transport, responses = hedged_console(clock, delay=0.01, budget=0.0, burst=1)
+
+    console.devices.get_device('node001')
+    timer = threading.Timer(0.1, clock.released.set)
+    timer.start()
+    console.devices.get_device('node001')
+    timer.join()
+
+    assert transport.requests == {'device/getinfo': 3}
+    assert console.stats()['device/getinfo']['hedged'] == 1
+
+
+def test_requests_beyond_the_pool_are_sent_without_hedging():
+    clock = SlowResponses(slow=1)
+    console, transport, responses = hedged_console(clock, delay=0.01, max_workers=1)
+    threading.Timer(0.1, clock.released.set).start()
+
+    threads = [threading.Thread(target=console.devices.get_device, args=('node001',)) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert console.stats()['device/getinfo']['count'] == 4
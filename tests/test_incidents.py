@@ -0,0 +1,118 @@
+import io
+import json
+import threading
+
+import pytest
+
+from canarytools.export import write_ndjson
+
+from .conftest import incident_data
+
+
+@pytest.mark.parametrize('compact', [False, True])
+def test_to_dict_leaves_out_private_attributes(make_console, compact):
+    console, transport = make_console(compact_models=compact)
+    incident = console.incidents.parse_incident(incident_data(0))
+    incident._acknowledged_locally(True)
+    assert incident.stale
+
+    incident_dict = incident.to_dict()
+    assert incident_dict['acknowledged'] is True
+    assert not [key for key in incident_dict if key.startswith('_')]
+    assert not [key for event in incident_dict['events'] for key in event if key.startswith('_')]
+
+    f = io.StringIO()
+    write_ndjson([incident], f, fast_json=False)
+    assert not [key for key in json.loads(f.getvalue()) if key.startswith('_')]
+
+
+def test_bulk_calls_are_sequential_unless_the_transport_is_thread_safe(make_console):
+    threads = set()
+
+    def backend(method, endpoint, params, data):
+        threads.add(threading.current_thread())
+
+    console, transport = make_console(backend)
+    transport.thread_safe = False
+    results = console.incidents.acknowledge_many(['incident:{0}'.format(index) for index in range(20)])
+
+    assert all(result.result == 'success' for result in results.values())
+    assert threads == set([threading.current_thread()])
+
+
+def test_bulk_refresh_lists_only_the_incidents_needed(make_console):
+    listings = list()
+
+    def backend(method, endpoint, params, data):
+        if endpoint == 'incidents/acknowledged':
+            listings.append(params)
+            return {'result': 'success', 'incidents': [incident_data(1, acknowledged='True')]}
+
+    console, transport = make_console(backend)
+    incidents = [console.incidents.parse_incident(incident_data(1)),
+                 console.incidents.parse_incident(incident_data(1, id='incident:2',
+                                                                created_std='2019-12-25 11:00:00 UTC+0000'))]
+    console.incidents.acknowledge_many(incidents, refresh=True)
+
+    assert incidents[0].acknowledged is True
+    assert len(listings) == 1
+    assert listings[0]['node_id'] == 'node001'
+    assert listings[0]['newer_than'] == '2019-12-25-10:59:59'
+
+    console.incidents.acknowledge_many(['incident:1'], refresh=True)
+    assert len(listings) == 1
+
+
+@pytest.mark.parametrize('lazy', [False, True])
+@pytest.mark.parametrize('fast_json', [False, True])
+def test_exported_times_are_iso_8601(make_console, lazy, fast_json):
+    console, transport = make_console(lazy_timestamps=lazy)
+    events = [{'timestamp_std': '2019-12-25 12:00:00 UTC+0200', 'USERNAME': 'root'}, {'USERNAME': 'guest'}]
+    if lazy:
+        # kept as it is when first accessed
+        events.append({'timestamp_std': 'yesterday-ish', 'USERNAME': 'admin'})
+    incident = console.incidents.parse_incident(incident_data(0, events=events))
+
+    f = io.StringIO()
+    write_ndjson([incident], f, events=True, fast_json=fast_json)
+    times = [json.loads(line).get('timestamp') for line in f.getvalue().splitlines()]
+    assert times == ['2019-12-25T12:00:00+02:00', None] + (['yesterday-ish'] if lazy else [])
+
+    f = io.StringIO()
+    write_ndjson([incident], f, fast_json=fast_json)
+    row = json.loads(f.getvalue())
+    assert row['created_std'] == '2019-12-25T12:00:00+00:00'
+    assert row['events'][0]['timestamp'] == '2019-12-25T12:00:00+02:00'
+
+
+@pytest.mark.parametrize('compact', [False, True])
+def test_events_are_built_once_when_first_used(make_console, monkeypatch, compact):
+    console, transport = make_console(compact_models=compact)
+    incident = console.incidents.parse_incident(incident_data(
+        0, events=[{'USERNAME': 'user{0}'.format(index)} for index in range(5)]))
+    events = incident.events
+    event_class = events.event_class
+    built = list()
+    parse = event_class.parse
+    monkeypatch.setattr(event_class, 'parse', classmethod(
+        lambda cls, console, data: built.append(data['USERNAME']) or parse(console, data)))
+
+    assert len(events) == 5
+    assert events.raw[4] == {'USERNAME': 'user4'}
+    assert built == []
+
+    assert events[1].username == 'user1'
+    assert events[-1].username == 'user4'
+    assert events[-1] is events[4]
+    assert built == ['user1', 'user4']
+
+    assert [event.username for event in events[1:4]] == ['user1', 'user2', 'user3']
+    assert [event.username for event in events[::-2]] == ['user4', 'user2', 'user0']
+    assert events[3:1] == []
+    assert built == ['user1', 'user4', 'user2', 'user3', 'user0']
+
+    assert [event.username for event in events] == ['user{0}'.format(index) for index in range(5)]
+    assert events == list(events)
+    assert len(built) == 5
+    with pytest.raises(IndexError):
+        events[5]
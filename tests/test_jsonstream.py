@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+import json
+
+import pytest
+
+import canarytools
+
+from canarytools.jsonstream import JSONArrayStream
+from canarytools.testing import Fault
+
+from .conftest import incident_data
+
+ITEMS = [{'id': 'incident:0', 'summary': u'Café \\ "quoted"', 'count': 12345},
+         {'id': 'incident:1', 'score': -1.5e-3, 'events': [{'port': 22}, {'port': 0}], 'empty': []},
+         7, u'é€', None, True]
+DOCUMENT = (u'{"result": "success", "incidents": [%s], "page": 104}' %
+            u', '.join(json.dumps(item) for item in ITEMS)).encode('utf-8')
+RAW = u'{"before": [1, 2], "incidents": [{"name": "Café", "port": 8080}, 65535], "after": "x"}'.encode('utf-8')
+
+
+def split(document, *offsets):
+    """The document in chunks split at the offsets"""
+    bounds = [0] + list(offsets) + [len(document)]
+    return [document[start:end] for start, end in zip(bounds, bounds[1:])]
+
+
+@pytest.mark.parametrize('document, expected', [(DOCUMENT, ITEMS), (RAW, [{'name': u'Café', 'port': 8080}, 65535])])
+def test_every_split_point_is_parsed_the_same(document, expected):
+    # splits mid-string, mid-escape, mid-number, within a multi-byte character and between the brackets
+    for offset in range(len(document) + 1):
+        items = JSONArrayStream(split(document, offset), 'incidents')
+        assert list(items) == expected, offset
+        assert items.bytes == len(document)
+
+
+def test_one_byte_at_a_time():
+    items = JSONArrayStream([DOCUMENT[i:i + 1] for i in range(len(DOCUMENT))], 'incidents')
+    assert list(items) == ITEMS
+    assert items.extra == {'result': 'success', 'page': 104}
+
+
+@pytest.mark.parametrize('fragment', [b'\\"', b'\\u00e9', b'12345', b'[{', b'}, '])
+def test_split_inside(fragment):
+    offset = DOCUMENT.index(fragment) + 1
+    assert list(JSONArrayStream(split(DOCUMENT, offset, offset + 1), 'incidents')) == ITEMS
+
+
+def test_push_mode_yields_items_as_they_complete():
+    items = JSONArrayStream(None, 'incidents')
+    parsed = list()
+    for offset in range(0, len(DOCUMENT), 5):
+        items.feed(DOCUMENT[offset:offset + 5])
+        parsed.extend(items.items())
+        # an item is only yielded once it's complete
+        assert parsed == ITEMS[:len(parsed)]
+    items.close()
+    parsed.extend(items.items())
+    assert parsed == ITEMS
+    assert items.extra == {'result': 'success', 'page': 104}
+
+
+def test_truncated_document_raises():
+    with pytest.raises(ValueError):
+        list(JSONArrayStream(split(DOCUMENT[:-20], 10), 'incidents'))
+
+    items = JSONArrayStream(None, 'incidents')
+    items.feed(DOCUMENT[:-20])
+    list(items.items())
+    items.close()
+    with pytest.raises(ValueError):
+        list(items.items())
+
+
+def test_streamed_incidents(make_console):
+    backend = {'incidents/all': {'result': 'success', 'incidents': [incident_data(i) for i in range(5)]}}
+    console, transport = make_console(backend, {'*': Fault(drip_rate=1.0, drip_chunk_size=7)})
+    assert [incident.id for incident in console.incidents.iter_all()] == \
+        ['incident:{0}'.format(i) for i in range(5)]
+
+
+def test_streamed_error_response_raises(make_console):
+    backend = {'incidents/all': {'result': 'error', 'message': 'Incident not found'}}
+    console, transport = make_console(backend, {'*': Fault(drip_rate=1.0, drip_chunk_size=7)})
+    with pytest.raises(canarytools.IncidentNotFoundError):
+        list(console.incidents.iter_all())
+    assert console.stats()['incidents/all']['errors'] == {'IncidentNotFoundError': 1}
@@ -0,0 +1,97 @@
+import time
+
+import pytest
+
+import canarytools
+
+from canarytools.testing import Fault, FaultInjectionTransport, fixed
+
+from .conftest import device_data, incident_data
+
+LATENCY = 0.01
+
+
+def canned_console(**kwargs):
+    """A console answered by canned data after a short real wait, so network time is measurable"""
+    devices = [device_data(index) for index in range(3)]
+    backend = {
+        'devices/all': {'result': 'success', 'devices': devices},
+        'incidents/unacknowledged': {'result': 'success', 'incidents': [incident_data(index) for index in range(3)]},
+        'incidents/all': {'result': 'success', 'incidents': [
+            incident_data(index, events=[{'USERNAME': 'user{0}'.format(event)} for event in range(200)])
+            for index in range(5)]},
+        'device/getinfo': {'result': 'success', 'device': device_data(1, unacknowleged_incidents=[])},
+        'incident/acknowledge': {'result': 'error', 'message': 'Incident not found'},
+    }
+    transport = FaultInjectionTransport(backend, {'*': Fault(latency=fixed(LATENCY))})
+    return canarytools.Console(domain='test', api_key='test-key', transport=transport, **kwargs)
+
+
+def test_stats_are_aggregated_per_endpoint():
+    records = list()
+    console = canned_console(metrics_callback=records.append)
+    console.devices.all()[0].unacknowleged_incidents
+    for _ in range(2):
+        console.devices.get_device('node001')
+    with pytest.raises(canarytools.IncidentNotFoundError):
+        console.post('incident/acknowledge', {'incident': 'incident:9'})
+
+    stats = console.stats()
+    assert sorted(stats) == ['device/getinfo', 'devices/all', 'incident/acknowledge', 'incidents/unacknowledged']
+    assert [stats[endpoint]['count'] for endpoint in sorted(stats)] == [2, 1, 1, 1]
+    assert stats['incident/acknowledge']['errors'] == {'IncidentNotFoundError': 1}
+    assert stats['device/getinfo']['errors'] == {}
+
+    getinfo = [record for record in records if record.endpoint == 'device/getinfo']
+    assert len(records) == 5 and len(getinfo) == 2
+    assert stats['device/getinfo']['bytes'] == sum(record.bytes for record in getinfo) > 0
+    assert stats['device/getinfo']['network_time'] == pytest.approx(sum(record.network_time for record in getinfo))
+    assert stats['device/getinfo']['latency']['p50'] >= LATENCY
+    assert stats['device/getinfo']['latency']['max'] == max(record.network_time for record in getinfo)
+    assert all(record.decode_time >= 0 and record.build_time >= 0 for record in records)
+
+    console.metrics.reset()
+    assert console.stats() == {}
+
+
+def test_profile_splits_the_block_into_phases():
+    console = canned_console()
+    with console.profile() as profile:
+        incidents = console.incidents.all()
+        # events are built, and their time counted, as they're used
+        build = profile.build
+        assert sum(len(list(incident.events)) for incident in incidents) == 1000
+        assert profile.build > build
+        time.sleep(0.05)
+
+    phases = profile.phases()
+    assert profile.requests == 1
+    assert phases['network'] >= LATENCY
+    assert phases['decode'] > 0
+    assert phases['user'] >= 0.05
+    assert sum(phases.values()) == pytest.approx(profile.wall)
+
+    # nothing is recorded once the block ends
+    console.incidents.all()
+    assert profile.requests == 1
+    assert profile.to_dict()['phases'] == phases
+
+
+def test_profile_attributes_requests_to_the_method_called():
+    console = canned_console()
+    with console.profile() as profile:
+        devices = console.devices.all()
+        for _ in range(3):
+            console.devices.get_device('node001')
+        devices[0].unacknowleged_incidents
+
+    methods = profile.to_dict()['methods']
+    assert methods == {
+        'Devices.all': {'calls': 1, 'requests': 1, 'endpoints': {'devices/all': 1}},
+        'Devices.get_device': {'calls': 3, 'requests': 3, 'endpoints': {'device/getinfo': 3}},
+        # the incidents are only listed when first used
+        'Device.unacknowleged_incidents': {'calls': 1, 'requests': 1, 'endpoints': {'incidents/unacknowledged': 1}},
+    }
+    report = profile.report()
+    assert report.startswith('{0:.3f}s in 5 requests'.format(profile.wall))
+    assert 'Devices.get_device x3: 3 requests (device/getinfo x3)' in report
@@ -0,0 +1,34 @@
+import pytest
+
+import canarytools
+
+from canarytools.testing import FaultInjectionTransport
+
+
+def console(domain, backend):
+    return canarytools.Console(domain=domain, api_key='test-key', transport=FaultInjectionTransport(backend))
+
+
+def test_a_failing_console_doesnt_stop_the_others():
+    pool = canarytools.ConsolePool([
+        console('tenant1', {'devices/all': {'result': 'success', 'devices': []}}),
+        console('tenant2', {'devices/all': {'result': 'error', 'message': 'Console is busy'}})])
+    results = pool.call('devices.all')
+
+    assert results['tenant1'].ok and results['tenant1'].result == []
+    assert not results['tenant2'].ok and results['tenant2'].result is None
+    assert isinstance(results['tenant2'].error, canarytools.ConsoleError)
+    assert results['tenant2'].elapsed >= 0
+
+
+def test_map_runs_a_query_per_console():
+    pool = canarytools.ConsolePool({'first': console('tenant1', {}), 'second': console('tenant1', {})})
+    results = pool.map(lambda console: console.domain)
+
+    assert dict((name, result.result) for name, result in results.items()) == {'first': 'tenant1',
+                                                                               'second': 'tenant1'}
+
+
+def test_list_with_the_same_domain_twice_is_refused():
+    with pytest.raises(ValueError):
+        canarytools.ConsolePool([console('tenant1', {}), console('tenant1', {})])
@@ -0,0 +1,53 @@
+import pickle
+
+from canarytools import PortSet
+from canarytools.models.incidents import Event
+
+SCAN = {'22': '10.0.0.1', '80': '10.0.0.2', '443': '10.0.0.1'}
+
+
+def test_reads_like_the_console_data():
+    ports = PortSet.from_dict(SCAN)
+
+    assert list(ports) == ['22', '80', '443']
+    assert ports.keys() == ['22', '80', '443']
+    assert ports.values() == ['10.0.0.1', '10.0.0.2', '10.0.0.1']
+    assert ports.items() == [('22', '10.0.0.1'), ('80', '10.0.0.2'), ('443', '10.0.0.1')]
+    assert dict(ports.items()) == SCAN == ports.to_dict()
+    assert ports == SCAN
+    assert ports['22'] == ports[22] == '10.0.0.1'
+    assert '443' in ports and 443 in ports and 8080 not in ports
+    assert list(ports.ports) == [22, 80, 443]
+
+
+def test_set_operations_drop_values():
+    union = PortSet.from_dict(SCAN) | PortSet([8080])
+    assert list(union.ports) == [22, 80, 443, 8080]
+    assert union.values() == [None] * 4
+    assert union.get(22) is None
+
+
+def test_consolidated_port_scan_event():
+    event = Event(None, dict(SCAN, logtype='5007'))
+    assert event.ports_scanned == SCAN
+    assert event.to_dict()['ports_scanned'] == SCAN
+    assert pickle.loads(pickle.dumps(event.ports_scanned)).items() == event.ports_scanned.items()
+
+
+def test_assignment_sets_or_adds_a_port():
+    ports = PortSet.from_dict(SCAN)
+    ports['80'] = '10.0.0.3'
+    ports[25] = '10.0.0.4'
+    assert ports.items() == [('22', '10.0.0.1'), ('25', '10.0.0.4'), ('80', '10.0.0.3'), ('443', '10.0.0.1')]
+    assert list(ports.ports) == [22, 25, 80, 443]
+
+    without_values = PortSet([22, 443])
+    without_values[80] = '10.0.0.2'
+    assert without_values.values() == [None, '10.0.0.2', None]
+
+
+def test_equality_includes_values():
+    assert PortSet.from_dict(SCAN) == PortSet.from_dict(SCAN)
+    assert PortSet.from_dict(SCAN) != PortSet.from_dict(dict(SCAN, **{'22': '10.0.0.9'}))
+    assert PortSet.from_dict(SCAN) != PortSet(SCAN)
+    assert PortSet([22, 80]) == PortSet.from_bits((1 << 22) | (1 << 80))
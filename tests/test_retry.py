@@ -0,0 +1,86 @@
+import pytest
+
+import canarytools
+
+from canarytools.testing import CannedResponse
+from canarytools.transport import Transport
+
+OK = b'{"result": "success", "devices": []}'
+UNAVAILABLE = b'<html><body>503 Service Unavailable</body></html>'
+
+
+class ScriptedTransport(Transport):
+    """Answers requests with the given responses in order"""
+    thread_safe = True
+
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.requests = list()
+
+    def request(self, method, url, params=None, data=None, files=None, stream=False):
+        self.requests.append(method)
+        return self.responses.pop(0)
+
+
+@pytest.fixture
+def waits(monkeypatch):
+    """Seconds the console slept between attempts"""
+    waits = list()
+    monkeypatch.setattr('canarytools.console.time.sleep', waits.append)
+    return waits
+
+
+def console_with(transport, **retry):
+    return canarytools.Console(domain='test', api_key='test-key', transport=transport,
+                               retry=canarytools.RetryPolicy(jitter=False, **retry))
+
+
+def test_rate_limited_request_waits_for_retry_after(waits):
+    transport = ScriptedTransport(CannedResponse(429, b'', {'Retry-After': '7'}), CannedResponse(200, OK))
+    console = console_with(transport)
+
+    assert console.devices.all() == []
+    assert waits == [7.0]
+    assert transport.requests == ['GET', 'GET']
+
+
+def test_unavailable_console_is_retried_with_backoff_until_retries_run_out(waits):
+    transport = ScriptedTransport(*[CannedResponse(503, UNAVAILABLE) for _ in range(4)])
+    console = console_with(transport, retries=3, backoff=0.5)
+
+    with pytest.raises(canarytools.ConsoleError):
+        console.devices.all()
+    assert waits == [0.5, 1.0, 2.0]
+    assert len(transport.requests) == 4
+
+
+def test_post_is_not_retried_after_unavailable_console(waits):
+    transport = ScriptedTransport(CannedResponse(503, UNAVAILABLE), CannedResponse(200, OK))
+    console = console_with(transport)
+
+    with pytest.raises(canarytools.ConsoleError):
+        console.post('device/reboot', {'node_id': 'node000'})
+    assert waits == []
+    assert transport.requests == ['POST']
+
+
+def test_response_that_is_not_json_raises_console_error(waits):
+    console = console_with(ScriptedTransport(CannedResponse(200, b'<html><body>Login</body></html>')))
+
+    with pytest.raises(canarytools.ConsoleError) as error:
+        console.devices.all()
+    assert 'not JSON' in str(error.value)
+
+
+def test_retries_get_through_a_failing_fake_console(waits):
+    from benchmarks.fakeconsole import FakeConsole
+
+    with FakeConsole(scale='tiny', fault_rate=0.5, seed=1) as fake:
+        console = canarytools.Console('test', 'test-key', base_url=fake.base_url,
+                                      retry=canarytools.RetryPolicy(retries=20, backoff=0.01, jitter=False))
+        assert len(console.devices.all()) == 20
+        requests = fake.requests()
+
+    # one request to each endpoint got through, every failed attempt was waited for and retried
+    assert sum(requests.values()) == len(requests) + len(waits)
+    assert waits
@@ -0,0 +1,74 @@
+import json
+import os
+
+import pytest
+
+import canarytools
+
+from .conftest import incident_data
+
+
+def sync_console(make_console, incidents):
+    """A console whose incident listing returns ``incidents[0]``, and records its parameters"""
+    listings = list()
+
+    def respond(method, endpoint, params, data):
+        if endpoint == 'incidents/all':
+            listings.append(params)
+            return {'result': 'success', 'incidents': incidents[0]}
+
+    console, transport = make_console(respond)
+    return console, listings
+
+
+def test_state_is_saved_and_used_by_the_next_sync(make_console, tmp_path, monkeypatch):
+    state_path = str(tmp_path / 'incidents.state')
+    replaced = list()
+    replace = os.replace
+    monkeypatch.setattr(os, 'replace', lambda src, dst: replaced.append((src, dst)) or replace(src, dst))
+    incidents = [[incident_data(0), incident_data(1, updated_std='2019-12-25 12:03:00 UTC+0000')]]
+    console, listings = sync_console(make_console, incidents)
+
+    assert len(console.incidents.sync(state_path)) == 2
+    assert replaced == [(state_path + '.tmp', state_path)]
+    assert not os.path.exists(state_path + '.tmp')
+    with open(state_path) as f:
+        state = json.load(f)
+    assert state['watermark'] == 1577275380
+    assert sorted(state['seen']) == ['incident:0', 'incident:1']
+
+    assert console.incidents.sync(state_path) == []
+    assert listings[0].get('newer_than') is None
+    # the overlap of five minutes before the newest incident
+    assert listings[1]['newer_than'] == '2019-12-25-11:58:00'
+
+
+def test_changed_incidents_are_returned_again(make_console, tmp_path):
+    state_path = str(tmp_path / 'incidents.state')
+    incidents = [[incident_data(0), incident_data(1)]]
+    console, listings = sync_console(make_console, incidents)
+    console.incidents.sync(state_path)
+
+    incidents[0] = [incident_data(0), incident_data(1, updated_std='2019-12-25 12:01:00 UTC+0000'),
+                    incident_data(2)]
+    assert sorted(incident.id for incident in console.incidents.sync(state_path)) == ['incident:1', 'incident:2']
+
+
+def test_missing_state_file_syncs_everything(make_console, tmp_path):
+    state_path = tmp_path / 'incidents.state'
+    console, listings = sync_console(make_console, [[incident_data(0)]])
+    assert len(console.incidents.sync(str(state_path))) == 1
+    assert state_path.exists()
+
+
+def test_corrupt_state_file_raises_until_replaced(make_console, tmp_path):
+    state_path = tmp_path / 'incidents.state'
+    state_path.write_text('{"watermark": 15772')
+    console, listings = sync_console(make_console, [[incident_data(0)]])
+
+    with pytest.raises(canarytools.IncidentError):
+        console.incidents.sync(str(state_path))
+    assert listings == []
+
+    state_path.unlink()
+    assert len(console.incidents.sync(str(state_path))) == 1
@@ -0,0 +1,88 @@
+import pytest
+
+import canarytools
+
+from canarytools.testing import Fault, FaultInjectionTransport, fixed
+
+from .conftest import device_data
+
+BACKEND = {'devices/all': {'result': 'success', 'devices': [device_data(index) for index in range(3)]}}
+
+
+def console_with(fault, timeout=None, seed=0):
+    """A console whose device listing has the fault, and the seconds its transport slept"""
+    sleeps = list()
+    transport = FaultInjectionTransport(BACKEND, {'devices/*': fault}, timeout=timeout, seed=seed,
+                                        sleep=sleeps.append)
+    console = canarytools.Console(domain='test', api_key='test-key', transport=transport)
+    return console, transport, sleeps
+
+
+@pytest.mark.parametrize('fault, kind, exception, message', [
+    (Fault(connection_error_rate=1.0), 'connection_error', canarytools.ConnectionError, None),
+    (Fault(timeout_rate=1.0), 'timeout', canarytools.RequestTimeoutError, None),
+    (Fault(status_rate=1.0, statuses=(503,)), 'status', canarytools.ConsoleError, '503'),
+    (Fault(non_json_rate=1.0), 'non_json', canarytools.ConsoleError, 'not JSON'),
+    (Fault(error_rate=1.0, errors=['Device not found']), 'error', canarytools.DeviceNotFoundError, None),
+    (Fault(error_rate=1.0, errors=['Something else broke']), 'error', canarytools.ConsoleError,
+     'Something else broke'),
+    (Fault(truncate_rate=1.0), 'truncate', canarytools.ConsoleError, None),
+])
+def test_each_fault_reaches_the_console_as_its_exception(fault, kind, exception, message):
+    console, transport, sleeps = console_with(fault)
+    with pytest.raises(exception) as excinfo:
+        console.devices.all()
+    if exception is canarytools.ConnectionError:
+        assert not isinstance(excinfo.value, canarytools.RequestTimeoutError)
+    if message is not None:
+        assert message in str(excinfo.value)
+    assert transport.injected == {kind: 1}
+    assert transport.requests == {'devices/all': 1}
+    assert console.stats()['devices/all']['errors'] == {type(excinfo.value).__name__: 1}
+
+
+def test_slow_response_arrives_whole():
+    console, transport, sleeps = console_with(Fault(drip_rate=1.0, drip_chunk_size=100, drip_delay=0.5))
+    assert [device.id for device in console.devices.all()] == ['node000', 'node001', 'node002']
+    assert transport.injected == {'drip': 1}
+    assert len(sleeps) > 1 and set(sleeps) == set([0.5])
+
+
+def test_latency_below_the_timeout_is_waited():
+    console, transport, sleeps = console_with(Fault(latency=fixed(2.0)), timeout=10)
+    assert len(console.devices.all()) == 3
+    assert sleeps == [2.0]
+    assert transport.injected == {'latency': 1}
+
+
+def test_latency_beyond_the_timeout_times_out_after_the_timeout():
+    console, transport, sleeps = console_with(Fault(latency=fixed(20.0)), timeout=10)
+    with pytest.raises(canarytools.RequestTimeoutError):
+        console.devices.all()
+    assert sleeps == [10]
+    assert transport.injected == {'latency': 1, 'timeout': 1}
+
+
+def test_endpoints_without_faults_are_untouched():
+    console, transport, sleeps = console_with(Fault(connection_error_rate=1.0))
+    assert console.incidents.all() == []
+    assert transport.injected == {}
+
+
+def test_seeded_runs_are_repeatable():
+    def run(seed):
+        console, transport, sleeps = console_with(Fault(status_rate=0.3, connection_error_rate=0.2,
+                                                        error_rate=0.2), seed=seed)
+        outcomes = list()
+        for _ in range(50):
+            try:
+                console.devices.all()
+                outcomes.append(None)
+            except canarytools.ConsoleError as e:
+                outcomes.append(type(e).__name__)
+        return outcomes, transport.injected
+
+    assert run(3) == run(3)
+    outcomes, injected = run(3)
+    assert sum(injected.values()) == len([outcome for outcome in outcomes if outcome is not None])
+    assert set(injected) == set(['status', 'connection_error', 'error'])
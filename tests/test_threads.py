@@ -0,0 +1,66 @@
+import threading
+import time
+
+import canarytools
+
+from .conftest import device_data, incident_data
+
+THREADS = 16
+
+
+def shared_listing(make_console, fail_first=False):
+    """A thread-safe console whose incident listing is slow, so threads pile up waiting for it"""
+    calls = list()
+
+    def respond(method, endpoint, params, data):
+        if endpoint == 'devices/all':
+            return {'result': 'success', 'devices': [device_data(i) for i in range(THREADS)]}
+        if endpoint == 'incidents/unacknowledged':
+            calls.append(endpoint)
+            time.sleep(0.05)
+            if fail_first and len(calls) == 1:
+                return {'result': 'error', 'message': 'Console is busy'}
+            return {'result': 'success', 'incidents': [incident_data(i) for i in range(THREADS)]}
+
+    console, transport = make_console(respond, thread_safe=True)
+    return console, transport, console.devices.all()
+
+
+def read_concurrently(devices):
+    """Read every device's unacknowledged incidents from its own thread, all at once"""
+    results = [None] * len(devices)
+    start = threading.Barrier(len(devices))
+
+    def read(index):
+        start.wait()
+        try:
+            results[index] = [incident.id for incident in devices[index].unacknowleged_incidents]
+        except Exception as e:
+            results[index] = e
+
+    threads = [threading.Thread(target=read, args=(index,)) for index in range(len(devices))]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+def test_shared_listing_loads_its_index_once(make_console):
+    console, transport, devices = shared_listing(make_console)
+    results = read_concurrently(devices)
+
+    assert results == [['incident:{0}'.format(index)] for index in range(THREADS)]
+    assert transport.requests == {'devices/all': 1, 'incidents/unacknowledged': 1}
+
+
+def test_shared_listing_recovers_from_a_failed_load(make_console):
+    console, transport, devices = shared_listing(make_console, fail_first=True)
+    results = read_concurrently(devices)
+
+    errors = [result for result in results if isinstance(result, Exception)]
+    assert len(errors) == 1 and isinstance(errors[0], canarytools.ConsoleError)
+    for index, result in enumerate(results):
+        if not isinstance(result, Exception):
+            assert result == ['incident:{0}'.format(index)]
+    assert transport.requests == {'devices/all': 1, 'incidents/unacknowledged': 2}
@@ -0,0 +1,34 @@
+import datetime
+
+import pytest
+
+from canarytools.models.base import parse_timestamp
+from canarytools.models.devices import Device
+from canarytools.models.incidents import Event
+
+from .conftest import device_data
+
+
+@pytest.mark.parametrize('value, offset', [
+    ('2019-12-25 12:00:00 UTC+0000', datetime.timedelta(0)),
+    ('2019-12-25 12:00:00 UTC+0200', datetime.timedelta(hours=2)),
+    ('2019-12-25 12:00:00 UTC-0530', -datetime.timedelta(hours=5, minutes=30)),
+])
+def test_offsets_are_ahead_of_utc_when_positive(value, offset):
+    parsed = parse_timestamp(value)
+    assert parsed.replace(tzinfo=None) == datetime.datetime(2019, 12, 25, 12)
+    assert parsed.utcoffset() == offset
+
+
+def test_other_formats_fall_back_to_dateutil():
+    parsed = parse_timestamp('2019-12-25T12:00:00+02:00')
+    assert parsed.utcoffset() == datetime.timedelta(hours=2)
+    assert parse_timestamp('25 Dec 2019').date() == datetime.date(2019, 12, 25)
+    with pytest.raises(ValueError):
+        parse_timestamp('not a time')
+
+
+def test_event_and_device_times_use_the_same_offsets():
+    event = Event(None, {'timestamp_std': '2019-12-25 12:00:00 UTC+0200'})
+    device = Device(None, device_data(0, last_seen_std='2019-12-25 12:00:00 UTC+0200'))
+    assert event.timestamp.utcoffset() == device.last_seen.utcoffset() == datetime.timedelta(hours=2)